@@ -0,0 +1,193 @@
+import argparse
+import contextlib
+import importlib
+import io
+import json
+import math
+import platform
+import statistics
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Sequence, TypedDict
+
+import helper_functions
+import input_generators
+
+DESCRIPTION = "Advent of code benchmark, times the solutions on generated inputs"
+CURRENT_DIRECTORY = Path(__file__).parent
+
+
+class BenchmarkResult(TypedDict):
+    day: int
+    part: str
+    size: int
+    input_bytes: int
+    repeats: int
+    median_seconds: float
+    p95_seconds: float
+    peak_memory_bytes: int
+
+
+def percentile(values: Sequence[float], percentage: float) -> float:
+    """Nearest-rank percentile of the given values"""
+    sorted_values = sorted(values)
+    rank = math.ceil(percentage / 100 * len(sorted_values))
+    return sorted_values[max(rank, 1) - 1]
+
+
+def measure(function: Callable, repeats: int) -> tuple[list[float], int]:
+    """Call function repeatedly and measure the wall time of each call. The
+    peak memory is measured in a separate call, since tracing the memory
+    allocations slows down the function.
+
+    Returns:
+        The wall time of each call, and the peak memory of a single call
+    """
+    wall_times = []
+    with contextlib.redirect_stdout(io.StringIO()):
+        for _ in range(repeats):
+            start_time = time.perf_counter()
+            function()
+            wall_times.append(time.perf_counter() - start_time)
+
+        tracemalloc.start()
+        try:
+            function()
+            _, peak_memory = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+    return wall_times, peak_memory
+
+
+def benchmark_day(
+    day: int, sizes: Sequence[int], repeats: int = 5, seed: int = 0
+) -> list[BenchmarkResult]:
+    """Benchmark parsing and both parts of the given day for each input size.
+    The generated inputs are placed in a temporary input store, so the day
+    module parses them like a regular puzzle input.
+
+    Args:
+        day:        Puzzle day to benchmark
+        sizes:      Input sizes to benchmark, see input_generators for the
+                    meaning of the size for each day
+        repeats:    Number of timed runs for each part and size
+        seed:       Seed for generating the inputs
+    """
+    module = importlib.import_module(f"day{day:0>2}.day{day}")
+    results = []
+    with tempfile.TemporaryDirectory() as store_directory:
+        helper_functions.set_input_store(Path(store_directory))
+        try:
+            for size in sizes:
+                puzzle_input = input_generators.GENERATORS[day](size, seed=seed)
+                helper_functions.store_input(puzzle_input, day)
+                data = module.parse_data()
+                for part, function in [
+                    ("parse", module.parse_data),
+                    ("a", lambda: module.part1(data)),
+                    ("b", lambda: module.part2(data)),
+                ]:
+                    wall_times, peak_memory = measure(function, repeats)
+                    results.append(
+                        BenchmarkResult(
+                            day=day,
+                            part=part,
+                            size=size,
+                            input_bytes=len(puzzle_input.encode("utf-8")),
+                            repeats=repeats,
+                            median_seconds=statistics.median(wall_times),
+                            p95_seconds=percentile(wall_times, 95),
+                            peak_memory_bytes=peak_memory,
+                        )
+                    )
+        finally:
+            helper_functions.set_input_store()
+    return results
+
+
+def run_benchmarks(
+    days: Sequence[int], sizes: Sequence[int], repeats: int = 5, seed: int = 0
+) -> dict:
+    """Benchmark the given days and collect the results together with some
+    information about the system the benchmark ran on"""
+    results = []
+    for day in days:
+        results += benchmark_day(day, sizes, repeats, seed)
+    return {
+        "metadata": {
+            "date": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "sizes": list(sizes),
+            "repeats": repeats,
+            "seed": seed,
+        },
+        "results": results,
+    }
+
+
+if __name__ == "__main__":
+    arguments = argparse.ArgumentParser(description=DESCRIPTION)
+    arguments.add_argument(
+        "days",
+        type=int,
+        nargs="*",
+        help="Select the days to benchmark. If not supplied, all days with an "
+        "input generator are benchmarked.",
+        metavar="PUZZLE_DAY",
+    )
+    arguments.add_argument(
+        "-s",
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=[10, 100],
+        help="Input sizes to benchmark. The meaning of the size depends on the "
+        "day, e.g. the number of lines or the side of a grid.",
+    )
+    arguments.add_argument(
+        "-r",
+        "--repeats",
+        type=int,
+        default=5,
+        help="Number of timed runs for each part and input size.",
+    )
+    arguments.add_argument(
+        "--seed",
+        type=int,
+        default=0,
+        help="Seed for generating the inputs.",
+    )
+    arguments.add_argument(
+        "-o",
+        "--output",
+        type=Path,
+        default=CURRENT_DIRECTORY / "benchmark_results.json",
+        help="JSON file to write the results to.",
+    )
+    args = arguments.parse_args()
+    generators = input_generators.GENERATORS
+    if unknown_days := set(args.days) - set(generators):
+        arguments.error(
+            f"no input generator available for day(s) {sorted(unknown_days)}, "
+            f"choose from {list(generators)}"
+        )
+
+    benchmark = run_benchmarks(
+        args.days or list(generators), args.sizes, args.repeats, args.seed
+    )
+    with open(args.output, "w") as f:
+        json.dump(benchmark, f, indent=4)
+
+    for result in benchmark["results"]:
+        print(
+            f"Day {result['day']:>2} part {result['part']:<5} size "
+            f"{result['size']:>6}: median {result['median_seconds']:.6f} s, "
+            f"p95 {result['p95_seconds']:.6f} s, "
+            f"peak memory {result['peak_memory_bytes'] / 1024:.1f} KiB"
+        )
+    print(f"\nResults written to {args.output}")
@@ -1,7 +1,10 @@
-from aocd import get_data, submit
+from typing import Any
 
+import helper_functions
 
-def parse_data() -> list[list[int]]:
+
+@helper_functions.cache_parsed_input(day=1)
+def parse_data(load_test_data: bool = False) -> list[list[int]]:
     """The data contains the total calories for the collection of foods that
     each elf holds. The inventory of each elf is separated by double newlines
     and within each elf's inventory, the number of calories for each food is
@@ -24,6 +27,10 @@ def parse_data() -> list[list[int]]:
     Each line in the data is the number of calories that each food contains.
     The food inventory of the different elves is separated by n
 
+    Args:
+        load_test_data:     Set to true to load test data from the local
+                            directory
+
     Returns:
         List of lists where each inner list represents the inventory of 1 elf.
         For the above example, this function returns
@@ -31,7 +38,7 @@ def parse_data() -> list[list[int]]:
         [[1000, 2000, 3000], [4000], [5000, 6000]]
         ```
     """
-    data = get_data(day=1, year=2022)
+    data = helper_functions.load_input(day=1, load_test_data=load_test_data)
     elf_data = data.split("\n\n")
     total_calories_per_elf = [
         [int(calories_per_snack) for calories_per_snack in elf.splitlines()]
@@ -65,16 +72,24 @@ def part2(data: list[list[int]]) -> int:
     return answer
 
 
-def main(parts: str, should_submit: bool = False) -> None:
+def main(parts: str, should_submit: bool = False, load_test_data: bool = False) -> dict[str, Any]:
     """Main function for solving the selected part(s) of today's puzzle
     and automatically submitting the answer.
 
     Args:
         parts:          "a", "b", or "ab". Execute the chosen parts
         should_submit:  Set to True if you want to submit your answer
+        load_test_data: Set to True if you want to load test data instead of
+                        the full input. By default, this will load the file
+                        called 'input1.1'
+
+    Returns:
+        Dict with the answer of each executed part, keyed by the part
+        ("a" or "b")
     """
-    data = parse_data()
+    data = parse_data(load_test_data=load_test_data)
 
+    answers = {}
     for part in parts:
         if part == "a":
             aocd_result = part1(data)
@@ -82,13 +97,19 @@ def main(parts: str, should_submit: bool = False) -> None:
             aocd_result = part2(data)
         else:
             raise ValueError(f"Wrong part chosen, expecting 'a' or 'b': got {part}")
+        answers[part] = aocd_result
 
         if should_submit:
-            submit(aocd_result, part=part, day=1, year=2022)
+            helper_functions.submit(aocd_result, part=part, day=1, year=2022)
+
+    return answers
 
 
 if __name__ == "__main__":
+    test_data = False
+    # test_data = True
     submit_answer = False
-    # main("a", submit_answer)
-    # main("b", submit_answer)
-    main("ab", submit_answer)
+    # submit_answer = True
+    # main("a", should_submit=submit_answer, load_test_data=test_data)
+    # main("b", should_submit=submit_answer, load_test_data=test_data)
+    main("ab", should_submit=submit_answer, load_test_data=test_data)
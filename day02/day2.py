@@ -1,6 +1,7 @@
 import re
+from typing import Any
 
-from aocd import get_data, submit
+import helper_functions
 
 
 def evaluate_round(opponent_move: str, player_move: str) -> int:
@@ -78,11 +79,15 @@ def move_score(player_move: str) -> int:
     return scoring_scheme[player_move]
 
 
-def parse_data() -> dict[str, list[str]]:
-    """Parser function to parse today's data"""
-    data = get_data(day=2, year=2022)
-    # with open("input2.1", "r") as f:
-    #     data = f.read()
+@helper_functions.cache_parsed_input(day=2)
+def parse_data(load_test_data: bool = False) -> dict[str, list[str]]:
+    """Parser function to parse today's data
+
+    Args:
+        load_test_data:     Set to true to load test data from the local
+                            directory
+    """
+    data = helper_functions.load_input(day=2, load_test_data=load_test_data)
     moves = re.findall("\S", data)
     parsed_data = {"opponent_moves": moves[::2], "player_moves": moves[1::2]}
     # lines = data.splitlines()
@@ -117,16 +122,24 @@ def part2(data: dict[str, list[str]]) -> int:
     return answer
 
 
-def main(parts: str, should_submit: bool = False) -> None:
+def main(parts: str, should_submit: bool = False, load_test_data: bool = False) -> dict[str, Any]:
     """Main function for solving the selected part(s) of today's puzzle
     and automatically submitting the answer.
 
     Args:
         parts:          "a", "b", or "ab". Execute the chosen parts
         should_submit:  Set to True if you want to submit your answer
+        load_test_data: Set to True if you want to load test data instead of
+                        the full input. By default, this will load the file
+                        called 'input2.1'
+
+    Returns:
+        Dict with the answer of each executed part, keyed by the part
+        ("a" or "b")
     """
-    data = parse_data()
+    data = parse_data(load_test_data=load_test_data)
 
+    answers = {}
     for part in parts:
         if part == "a":
             aocd_result = part1(data)
@@ -134,14 +147,19 @@ def main(parts: str, should_submit: bool = False) -> None:
             aocd_result = part2(data)
         else:
             raise ValueError(f"Wrong part chosen, expecting 'a' or 'b': got {part}")
+        answers[part] = aocd_result
 
         if should_submit:
-            submit(aocd_result, part=part, day=2, year=2022)
+            helper_functions.submit(aocd_result, part=part, day=2, year=2022)
+
+    return answers
 
 
 if __name__ == "__main__":
+    test_data = False
+    # test_data = True
     submit_answer = False
     # submit_answer = True
-    # main("a", submit_answer)
-    # main("b", submit_answer)
-    main("ab", submit_answer)
+    # main("a", should_submit=submit_answer, load_test_data=test_data)
+    # main("b", should_submit=submit_answer, load_test_data=test_data)
+    main("ab", should_submit=submit_answer, load_test_data=test_data)
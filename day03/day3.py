@@ -1,11 +1,17 @@
-from aocd import get_data, submit
+from typing import Any
 
+import helper_functions
 
-def parse_data() -> list[str]:
-    """Parser function to parse today's data"""
-    data = get_data(day=3, year=2022)
-    # with open("input3.1", "r") as f:
-    #     data = f.read()
+
+@helper_functions.cache_parsed_input(day=3)
+def parse_data(load_test_data: bool = False) -> list[str]:
+    """Parser function to parse today's data
+
+    Args:
+        load_test_data:     Set to true to load test data from the local
+                            directory
+    """
+    data = helper_functions.load_input(day=3, load_test_data=load_test_data)
     lines = data.splitlines()
     # numbers = [int(x) for x in re.findall("(-?\d+)", data)]
     return lines
@@ -83,16 +89,24 @@ def part2(data: list[str]) -> int:
     return answer
 
 
-def main(parts: str, should_submit: bool = False) -> None:
+def main(parts: str, should_submit: bool = False, load_test_data: bool = False) -> dict[str, Any]:
     """Main function for solving the selected part(s) of today's puzzle
     and automatically submitting the answer.
 
     Args:
         parts:          "a", "b", or "ab". Execute the chosen parts
         should_submit:  Set to True if you want to submit your answer
+        load_test_data: Set to True if you want to load test data instead of
+                        the full input. By default, this will load the file
+                        called 'input3.1'
+
+    Returns:
+        Dict with the answer of each executed part, keyed by the part
+        ("a" or "b")
     """
-    data = parse_data()
+    data = parse_data(load_test_data=load_test_data)
 
+    answers = {}
     for part in parts:
         if part == "a":
             aocd_result = part1(data)
@@ -100,14 +114,19 @@ def main(parts: str, should_submit: bool = False) -> None:
             aocd_result = part2(data)
         else:
             raise ValueError(f"Wrong part chosen, expecting 'a' or 'b': got {part}")
+        answers[part] = aocd_result
 
         if should_submit:
-            submit(aocd_result, part=part, day=3, year=2022)
+            helper_functions.submit(aocd_result, part=part, day=3, year=2022)
+
+    return answers
 
 
 if __name__ == "__main__":
+    test_data = False
+    # test_data = True
     submit_answer = False
     # submit_answer = True
-    # main("a", submit_answer)
-    # main("b", submit_answer)
-    main("ab", submit_answer)
+    # main("a", should_submit=submit_answer, load_test_data=test_data)
+    # main("b", should_submit=submit_answer, load_test_data=test_data)
+    main("ab", should_submit=submit_answer, load_test_data=test_data)
@@ -1,12 +1,13 @@
 import re
-from typing import Callable
+from typing import Callable, Any
 
-from aocd import get_data, submit
+import helper_functions
 
 
 ELF_RANGE = tuple[int, int]
 
 
+@helper_functions.cache_parsed_input(day=4)
 def parse_data(load_test_data: bool = False) -> list[ELF_RANGE]:
     """Parser function to parse today's data
 
@@ -14,12 +15,7 @@ def parse_data(load_test_data: bool = False) -> list[ELF_RANGE]:
         load_test_data:     Set to true to load test data from the local
                             directory
     """
-    if load_test_data:
-        with open("input4.1", "r") as f:
-            # For loading example or test data
-            data = f.read()
-    else:
-        data = get_data(day=4, year=2022)
+    data = helper_functions.load_input(day=4, load_test_data=load_test_data)
     cleaning_ranges: list[ELF_RANGE] = re.findall("(\d+)-(\d+)", data)
     int_data = [
         tuple(int(number) for number in cleaning_range)
@@ -95,7 +91,7 @@ def part2(data: list[ELF_RANGE]):
     return answer
 
 
-def main(parts: str, should_submit: bool = False, load_test_data: bool = False) -> None:
+def main(parts: str, should_submit: bool = False, load_test_data: bool = False) -> dict[str, Any]:
     """Main function for solving the selected part(s) of today's puzzle
     and automatically submitting the answer.
 
@@ -105,9 +101,14 @@ def main(parts: str, should_submit: bool = False, load_test_data: bool = False)
         load_test_data: Set to True if you want to load test data instead of
                         the full input. By default, this will load the file
                         called 'input4.1'
+
+    Returns:
+        Dict with the answer of each executed part, keyed by the part
+        ("a" or "b")
     """
     data = parse_data(load_test_data=load_test_data)
 
+    answers = {}
     for part in parts:
         if part == "a":
             aocd_result = part1(data)
@@ -115,9 +116,12 @@ def main(parts: str, should_submit: bool = False, load_test_data: bool = False)
             aocd_result = part2(data)
         else:
             raise ValueError(f"Wrong part chosen, expecting 'a' or 'b': got {part}")
+        answers[part] = aocd_result
 
         if should_submit:
-            submit(aocd_result, part=part, day=4, year=2022)
+            helper_functions.submit(aocd_result, part=part, day=4, year=2022)
+
+    return answers
 
 
 if __name__ == "__main__":
@@ -1,7 +1,7 @@
 import re
-from typing import TypedDict
+from typing import TypedDict, Any
 
-from aocd import get_data, submit
+import helper_functions
 
 
 STACKS = list[str]
@@ -13,6 +13,7 @@ class StacksAndInstructions(TypedDict):
     instructions: INSTRUCTIONS
 
 
+@helper_functions.cache_parsed_input(day=5)
 def parse_data(load_test_data: bool = False) -> StacksAndInstructions:
     """Parser function to parse today's data
 
@@ -20,12 +21,7 @@ def parse_data(load_test_data: bool = False) -> StacksAndInstructions:
         load_test_data:     Set to true to load test data from the local
                             directory
     """
-    if load_test_data:
-        with open("input5.1", "r") as f:
-            # For loading example or test data
-            data = f.read()
-    else:
-        data = get_data(day=5, year=2022)
+    data = helper_functions.load_input(day=5, load_test_data=load_test_data)
 
     stacks, instructions = data.split("\n\n")
     instructions = re.findall("move (\d+) from (\d+) to (\d+)", instructions)
@@ -136,7 +132,7 @@ def part2(data: StacksAndInstructions) -> str:
     return answer
 
 
-def main(parts: str, should_submit: bool = False, load_test_data: bool = False) -> None:
+def main(parts: str, should_submit: bool = False, load_test_data: bool = False) -> dict[str, Any]:
     """Main function for solving the selected part(s) of today's puzzle
     and automatically submitting the answer.
 
@@ -146,9 +142,14 @@ def main(parts: str, should_submit: bool = False, load_test_data: bool = False)
         load_test_data: Set to True if you want to load test data instead of
                         the full input. By default, this will load the file
                         called 'input5.1'
+
+    Returns:
+        Dict with the answer of each executed part, keyed by the part
+        ("a" or "b")
     """
     data = parse_data(load_test_data=load_test_data)
 
+    answers = {}
     for part in parts:
         if part == "a":
             aocd_result = part1(data)
@@ -156,9 +157,12 @@ def main(parts: str, should_submit: bool = False, load_test_data: bool = False)
             aocd_result = part2(data)
         else:
             raise ValueError(f"Wrong part chosen, expecting 'a' or 'b': got {part}")
+        answers[part] = aocd_result
 
         if should_submit:
-            submit(aocd_result, part=part, day=5, year=2022)
+            helper_functions.submit(aocd_result, part=part, day=5, year=2022)
+
+    return answers
 
 
 if __name__ == "__main__":
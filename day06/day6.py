@@ -1,6 +1,7 @@
 from enum import Enum
+from typing import Any
 
-from aocd import get_data, submit
+import helper_functions
 
 
 class MarkerType(Enum):
@@ -8,6 +9,7 @@ class MarkerType(Enum):
     MESSAGE = 14
 
 
+@helper_functions.cache_parsed_input(day=6)
 def parse_data(load_test_data: bool = False) -> str:
     """Parser function to parse today's data
 
@@ -15,12 +17,7 @@ def parse_data(load_test_data: bool = False) -> str:
         load_test_data:     Set to true to load test data from the local
                             directory
     """
-    if load_test_data:
-        with open("input6.1", "r") as f:
-            # For loading example or test data
-            data = f.read()
-    else:
-        data = get_data(day=6, year=2022)
+    data = helper_functions.load_input(day=6, load_test_data=load_test_data)
     # lines = data.splitlines()
     # numbers = [int(x) for x in re.findall("(-?\d+)", data)]
     return data
@@ -75,7 +72,7 @@ def part2(data):
     return answer
 
 
-def main(parts: str, should_submit: bool = False, load_test_data: bool = False) -> None:
+def main(parts: str, should_submit: bool = False, load_test_data: bool = False) -> dict[str, Any]:
     """Main function for solving the selected part(s) of today's puzzle
     and automatically submitting the answer.
 
@@ -85,9 +82,14 @@ def main(parts: str, should_submit: bool = False, load_test_data: bool = False)
         load_test_data: Set to True if you want to load test data instead of
                         the full input. By default, this will load the file
                         called 'input6.1'
+
+    Returns:
+        Dict with the answer of each executed part, keyed by the part
+        ("a" or "b")
     """
     data = parse_data(load_test_data=load_test_data)
 
+    answers = {}
     for part in parts:
         if part == "a":
             aocd_result = part1(data)
@@ -95,9 +97,12 @@ def main(parts: str, should_submit: bool = False, load_test_data: bool = False)
             aocd_result = part2(data)
         else:
             raise ValueError(f"Wrong part chosen, expecting 'a' or 'b': got {part}")
+        answers[part] = aocd_result
 
         if should_submit:
-            submit(aocd_result, part=part, day=6, year=2022)
+            helper_functions.submit(aocd_result, part=part, day=6, year=2022)
+
+    return answers
 
 
 if __name__ == "__main__":
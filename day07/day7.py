@@ -1,41 +1,40 @@
+from __future__ import annotations
+
 import re
 from pathlib import Path
+from typing import Any
+
+import helper_functions
 
-from aocd import get_data, submit
-import numpy as np
-import anytree
-from anytree import AnyNode
+anytree = helper_functions.lazy_import("anytree")
 
 
 HOME = 'aoc2022day7'
 DISK_SIZE = 70_000_000
 
 
-def parse_data(load_test_data: bool = False) -> list[str]:
-    """Parser function to parse today's data
+@helper_functions.cache_parsed_input(day=7)
+def parse_data(load_test_data: bool = False) -> tuple[dict[Path, anytree.AnyNode], anytree.AnyNode]:
+    """Parser function to parse today's data. Creates the file system from the
+    cd-ls output.
 
     Args:
         load_test_data:     Set to true to load test data from the local
                             directory
     """
-    if load_test_data:
-        with open("input7.1", "r") as f:
-            # For loading example or test data
-            data = f.read()
-    else:
-        data = get_data(day=7, year=2022)
+    data = helper_functions.load_input(day=7, load_test_data=load_test_data)
     lines = data.splitlines()
     # numbers = [int(x) for x in re.findall("(-?\d+)", data)]
-    return lines
+    return prepare_file_system(lines)
 
 
-def create_file_system(cd_ls_output: list[str]) -> dict[Path, AnyNode]:
+def create_file_system(cd_ls_output: list[str]) -> dict[Path, anytree.AnyNode]:
     """Parse the output given by a series of cd and ls commands and create a
     file system based on it"""
     # Start at the home directory
     current_directory = Path(HOME)
     file_system = {
-        current_directory: AnyNode(name=str(current_directory), size=None,
+        current_directory: anytree.AnyNode(name=str(current_directory), size=None,
                                    is_dir=True)
     }
     for line in cd_ls_output:
@@ -58,14 +57,14 @@ def create_file_system(cd_ls_output: list[str]) -> dict[Path, AnyNode]:
             case ['dir', directory_name]:
                 new_directory_path = current_directory / directory_name
                 if new_directory_path not in file_system:
-                    file_system[new_directory_path] = AnyNode(name=f'{directory_name}/',
+                    file_system[new_directory_path] = anytree.AnyNode(name=f'{directory_name}/',
                                                               size=None,
                                                               is_dir=True,
                                                               parent=file_system[current_directory])
             case [file_size, file_name]:
                 new_file_path = current_directory / file_name
                 if new_file_path not in file_system:
-                    file_system[new_file_path] = AnyNode(name=f'{file_name} ({int(file_size):_})',
+                    file_system[new_file_path] = anytree.AnyNode(name=f'{file_name} ({int(file_size):_})',
                                                          size=int(file_size),
                                                          is_dir=False,
                                                          parent=file_system[current_directory])
@@ -73,13 +72,13 @@ def create_file_system(cd_ls_output: list[str]) -> dict[Path, AnyNode]:
     return file_system
 
 
-def render_file_system(root_node: AnyNode) -> None:
+def render_file_system(root_node: anytree.AnyNode) -> None:
     """Pretty print the filesystem starting at the given root node"""
     for pre, _, node in anytree.RenderTree(root_node):
         print(f'{pre}{node.name}')
 
 
-def calculate_directory_size(dir_node: AnyNode) -> None:
+def calculate_directory_size(dir_node: anytree.AnyNode) -> None:
     """Calculate the size of the given directory node. If sub-directories exist,
     then the function will recursively calculate the size of those directories
     as well. The size of the nodes is added in-place. Also updates the name of
@@ -95,7 +94,7 @@ def calculate_directory_size(dir_node: AnyNode) -> None:
     dir_node.name = f'{dir_node.name} ({dir_node.size:_})'
 
 
-def find_size_sum_directories_with_size_less_than(max_size: int, root_node: AnyNode) -> int:
+def find_size_sum_directories_with_size_less_than(max_size: int, root_node: anytree.AnyNode) -> int:
     """Sum the sizes of the directories with size less than given max_size"""
     sum = 0
     for _, __, node in anytree.RenderTree(root_node):
@@ -104,7 +103,7 @@ def find_size_sum_directories_with_size_less_than(max_size: int, root_node: AnyN
     return sum
 
 
-def prepare_file_system(data: list[str]) -> tuple[dict[Path, AnyNode], AnyNode]:
+def prepare_file_system(data: list[str]) -> tuple[dict[Path, anytree.AnyNode], anytree.AnyNode]:
     """Create file system from cd-ls output and calculate directory sizes"""
     file_system = create_file_system(data)
     root_node = file_system[Path(HOME)]
@@ -113,7 +112,7 @@ def prepare_file_system(data: list[str]) -> tuple[dict[Path, AnyNode], AnyNode]:
     return file_system, root_node
 
 
-def part1(data: tuple[dict[Path, AnyNode], AnyNode]) -> int:
+def part1(data: tuple[dict[Path, anytree.AnyNode], anytree.AnyNode]) -> int:
     """Advent of code 2022 day 7 - Part 1"""
     _, root_node = data
 
@@ -122,7 +121,7 @@ def part1(data: tuple[dict[Path, AnyNode], AnyNode]) -> int:
     return answer
 
 
-def find_size_smallest_directory_above(dir_size: int, root_node: AnyNode) -> int:
+def find_size_smallest_directory_above(dir_size: int, root_node: anytree.AnyNode) -> int:
     """Find the size of the directory that is the closest above the given
     dir_size within the given file_system (starting at root_node)"""
     smallest_target = DISK_SIZE
@@ -132,7 +131,7 @@ def find_size_smallest_directory_above(dir_size: int, root_node: AnyNode) -> int
     return smallest_target
 
 
-def part2(data: tuple[dict[Path, AnyNode], AnyNode]) -> int:
+def part2(data: tuple[dict[Path, anytree.AnyNode], anytree.AnyNode]) -> int:
     """Advent of code 2022 day 7 - Part 2"""
     _, root_node = data
     free_space = DISK_SIZE - root_node.size
@@ -147,7 +146,7 @@ def part2(data: tuple[dict[Path, AnyNode], AnyNode]) -> int:
     return answer
 
 
-def main(parts: str, should_submit: bool = False, load_test_data: bool = False) -> None:
+def main(parts: str, should_submit: bool = False, load_test_data: bool = False) -> dict[str, Any]:
     """Main function for solving the selected part(s) of today's puzzle
     and automatically submitting the answer.
 
@@ -157,10 +156,14 @@ def main(parts: str, should_submit: bool = False, load_test_data: bool = False)
         load_test_data: Set to True if you want to load test data instead of
                         the full input. By default, this will load the file
                         called 'input7.1'
+
+    Returns:
+        Dict with the answer of each executed part, keyed by the part
+        ("a" or "b")
     """
     data = parse_data(load_test_data=load_test_data)
-    data = prepare_file_system(data)
 
+    answers = {}
     for part in parts:
         if part == "a":
             aocd_result = part1(data)
@@ -168,9 +171,12 @@ def main(parts: str, should_submit: bool = False, load_test_data: bool = False)
             aocd_result = part2(data)
         else:
             raise ValueError(f"Wrong part chosen, expecting 'a' or 'b': got {part}")
+        answers[part] = aocd_result
 
         if should_submit:
-            submit(aocd_result, part=part, day=7, year=2022)
+            helper_functions.submit(aocd_result, part=part, day=7, year=2022)
+
+    return answers
 
 
 if __name__ == "__main__":
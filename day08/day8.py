@@ -1,10 +1,14 @@
-from aocd import get_data, submit
-import numpy as np
+from __future__ import annotations
+
+from typing import Any
 
 import helper_functions
 from helper_functions import Direction
 
+np = helper_functions.lazy_import("numpy")
+
 
+@helper_functions.cache_parsed_input(day=8)
 def parse_data(load_test_data: bool = False) -> np.ndarray:
     """Parser function to parse today's data
 
@@ -12,17 +16,13 @@ def parse_data(load_test_data: bool = False) -> np.ndarray:
         load_test_data:     Set to true to load test data from the local
                             directory
     """
-    if load_test_data:
-        with open("input8.1", "r") as f:
-            # For loading example or test data
-            data = f.read()
-    else:
-        data = get_data(day=8, year=2022)
+    data = helper_functions.load_input(day=8, load_test_data=load_test_data)
     lines = data.splitlines()
     # numbers = [int(x) for x in re.findall("(-?\d+)", data)]
-    return helper_functions.pad_numpy_array(
-        np.array(helper_functions.digits_to_int(lines)), -1
-    )
+    # Tree heights fit in an int8, the padding around the grid has height -1
+    return helper_functions.Grid.from_lines(
+        lines, "0123456789", padding=1, fill_value=-1, dtype=np.int8
+    ).data
 
 
 def check_visibility(grid: np.ndarray, visibility_grid: np.ndarray) -> None:
@@ -113,7 +113,8 @@ def get_scenic_score(grid: np.ndarray, tree_index: tuple[int, int]) -> np.int32:
 def check_scenic_scores(grid: np.ndarray) -> np.ndarray:
     """Calculate the scenic scores of all trees in the grid and add them inplace
     to the scenic_scores array"""
-    scenic_scores = np.zeros_like(grid)
+    # Scores are products of distances, which don't fit in the type of the grid
+    scenic_scores = np.zeros(grid.shape, dtype=np.int64)
     with np.nditer(
         scenic_scores[1:-1, 1:-1], op_flags=["readwrite"], flags=["multi_index"]
     ) as it:
@@ -140,7 +141,7 @@ def part2(grid: np.ndarray) -> np.int32:
     return answer
 
 
-def main(parts: str, should_submit: bool = False, load_test_data: bool = False) -> None:
+def main(parts: str, should_submit: bool = False, load_test_data: bool = False) -> dict[str, Any]:
     """Main function for solving the selected part(s) of today's puzzle
     and automatically submitting the answer.
 
@@ -150,9 +151,14 @@ def main(parts: str, should_submit: bool = False, load_test_data: bool = False)
         load_test_data: Set to True if you want to load test data instead of
                         the full input. By default, this will load the file
                         called 'input8.1'
+
+    Returns:
+        Dict with the answer of each executed part, keyed by the part
+        ("a" or "b")
     """
     data = parse_data(load_test_data=load_test_data)
 
+    answers = {}
     for part in parts:
         if part == "a":
             aocd_result = part1(data)
@@ -160,9 +166,12 @@ def main(parts: str, should_submit: bool = False, load_test_data: bool = False)
             aocd_result = part2(data)
         else:
             raise ValueError(f"Wrong part chosen, expecting 'a' or 'b': got {part}")
+        answers[part] = aocd_result
 
         if should_submit:
-            submit(aocd_result, part=part, day=8, year=2022)
+            helper_functions.submit(aocd_result, part=part, day=8, year=2022)
+
+    return answers
 
 
 if __name__ == "__main__":
@@ -1,10 +1,12 @@
-from collections import defaultdict
-from typing import Optional, Union
-
-from aocd import get_data, submit
+from typing import Optional, Union, Any
 
 import helper_functions
-from helper_functions import Coordinate, Direction
+from helper_functions import (
+    Coordinate2,
+    CoordinateEncoder,
+    Direction,
+    PackedCoordinateDict,
+)
 
 
 DIRECTION_MAP = {
@@ -13,8 +15,11 @@ DIRECTION_MAP = {
     "R": Direction.RIGHT.value,
     "D": Direction.DOWN.value,
 }
+# Tail locations are stored as packed coordinates to save memory
+ENCODER = CoordinateEncoder(dimension=2)
 
 
+@helper_functions.cache_parsed_input(day=9)
 def parse_data(load_test_data: bool = False) -> list[str]:
     """Parser function to parse today's data
 
@@ -22,27 +27,22 @@ def parse_data(load_test_data: bool = False) -> list[str]:
         load_test_data:     Set to true to load test data from the local
                             directory
     """
-    if load_test_data:
-        with open("input9.1", "r") as f:
-            # For loading example or test data
-            data = f.read()
-    else:
-        data = get_data(day=9, year=2022)
+    data = helper_functions.load_input(day=9, load_test_data=load_test_data)
     lines = data.splitlines()
     # numbers = [int(x) for x in re.findall("(-?\d+)", data)]
     return lines
 
 
-def move_towards(self: Coordinate, other: Coordinate) -> Coordinate:
+def move_towards(self: Coordinate2, other: Coordinate2) -> Coordinate2:
     """Step self towards other"""
     difference = other - self
     direction = [
         helper_functions.get_sign(coordinate, sign_zero=0) for coordinate in difference
     ]
-    return Coordinate(*[coordinate + step for coordinate, step in zip(self, direction)])
+    return self + direction
 
 
-def move_tail(location_tail: Coordinate, location_head: Coordinate) -> Coordinate:
+def move_tail(location_tail: Coordinate2, location_head: Coordinate2) -> Coordinate2:
     """Move tail towards head. Tail should always be touching the head.
     Diagonally touching or overlapping also count as touching. If not, then the
     tail needs to move towards the head."""
@@ -54,9 +54,9 @@ def move_tail(location_tail: Coordinate, location_head: Coordinate) -> Coordinat
 
 def move(
     command: str,
-    locations: list[Coordinate, ...],
-    tail_locations: dict[Coordinate, int] = None,
-) -> Union[tuple[list[Coordinate, ...], dict[Coordinate, int]], list[Coordinate, ...]]:
+    locations: list[Coordinate2, ...],
+    tail_locations: PackedCoordinateDict = None,
+) -> Union[tuple[list[Coordinate2, ...], PackedCoordinateDict], list[Coordinate2, ...]]:
     """Move the head. Expected format of command: [direction] [steps]
     direction can be any of [L, U, R, D]"""
     direction, steps = command.split()
@@ -84,13 +84,13 @@ def move(
 
 def process_commands(
     commands: list[str], length_rope: int = 2, register_tail_locations: bool = False
-) -> tuple[dict[str, Coordinate], Optional[dict[Coordinate, int]]]:
+) -> tuple[dict[str, Coordinate2], Optional[PackedCoordinateDict]]:
     """Process all move commands"""
     if register_tail_locations:
-        tail_locations = defaultdict(int)
+        tail_locations = PackedCoordinateDict(ENCODER, default_factory=int)
     else:
         tail_locations = None
-    locations = [Coordinate(0, 0)] * length_rope
+    locations = [Coordinate2(0, 0)] * length_rope
     for command in commands:
         locations = move(command, locations, tail_locations)
         if register_tail_locations:
@@ -121,7 +121,7 @@ def part2(data: list[str]) -> int:
     return answer
 
 
-def main(parts: str, should_submit: bool = False, load_test_data: bool = False) -> None:
+def main(parts: str, should_submit: bool = False, load_test_data: bool = False) -> dict[str, Any]:
     """Main function for solving the selected part(s) of today's puzzle
     and automatically submitting the answer.
 
@@ -131,9 +131,14 @@ def main(parts: str, should_submit: bool = False, load_test_data: bool = False)
         load_test_data: Set to True if you want to load test data instead of
                         the full input. By default, this will load the file
                         called 'input9.1'
+
+    Returns:
+        Dict with the answer of each executed part, keyed by the part
+        ("a" or "b")
     """
     data = parse_data(load_test_data=load_test_data)
 
+    answers = {}
     for part in parts:
         if part == "a":
             aocd_result = part1(data)
@@ -141,9 +146,12 @@ def main(parts: str, should_submit: bool = False, load_test_data: bool = False)
             aocd_result = part2(data)
         else:
             raise ValueError(f"Wrong part chosen, expecting 'a' or 'b': got {part}")
+        answers[part] = aocd_result
 
         if should_submit:
-            submit(aocd_result, part=part, day=9, year=2022)
+            helper_functions.submit(aocd_result, part=part, day=9, year=2022)
+
+    return answers
 
 
 if __name__ == "__main__":
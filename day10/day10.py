@@ -1,13 +1,11 @@
 import os
-from typing import Callable, Union
-
-from aocd import get_data, submit
-import numpy as np
+from typing import Callable, Union, Any
 
 import helper_functions
 from helper_functions import Processor
 
 
+@helper_functions.cache_parsed_input(day=10)
 def parse_data(load_test_data: bool = False):
     """Parser function to parse today's data
 
@@ -15,12 +13,7 @@ def parse_data(load_test_data: bool = False):
         load_test_data:     Set to true to load test data from the local
                             directory
     """
-    if load_test_data:
-        with open("input10.1", "r") as f:
-            # For loading example or test data
-            data = f.read()
-    else:
-        data = get_data(day=10, year=2022)
+    data = helper_functions.load_input(day=10, load_test_data=load_test_data)
     lines = data.splitlines()
     # grid = np.array(helper_functions.digits_to_int(data.splitlines()))
     # numbers = [int(x) for x in re.findall("(-?\d+)", data)]
@@ -188,7 +181,7 @@ def part2(data: list[str]) -> None:
     return answer
 
 
-def main(parts: str, should_submit: bool = False, load_test_data: bool = False) -> None:
+def main(parts: str, should_submit: bool = False, load_test_data: bool = False) -> dict[str, Any]:
     """Main function for solving the selected part(s) of today's puzzle
     and automatically submitting the answer.
 
@@ -198,9 +191,14 @@ def main(parts: str, should_submit: bool = False, load_test_data: bool = False)
         load_test_data: Set to True if you want to load test data instead of
                         the full input. By default, this will load the file
                         called 'input10.1'
+
+    Returns:
+        Dict with the answer of each executed part, keyed by the part
+        ("a" or "b")
     """
     data = parse_data(load_test_data=load_test_data)
 
+    answers = {}
     for part in parts:
         if part == "a":
             aocd_result = part1(data)
@@ -208,9 +206,12 @@ def main(parts: str, should_submit: bool = False, load_test_data: bool = False)
             aocd_result = part2(data)
         else:
             raise ValueError(f"Wrong part chosen, expecting 'a' or 'b': got {part}")
+        answers[part] = aocd_result
 
         if should_submit:
-            submit(aocd_result, part=part, day=10, year=2022)
+            helper_functions.submit(aocd_result, part=part, day=10, year=2022)
+
+    return answers
 
 
 if __name__ == "__main__":
@@ -1,10 +1,8 @@
 import re
-from typing import Callable, Self, TypedDict, Sequence
-
-from aocd import get_data, submit
-import numpy as np
+from typing import Callable, Self, Sequence, Any
 
 import helper_functions
+import profiler
 
 
 class Monkey:
@@ -47,6 +45,7 @@ class Monkey:
         a Monkey class instance for each as value."""
         self.target_monkeys = target_monkeys
 
+    @profiler.profile
     def do_turn(self) -> None:
         """Perform turn. For all items in self.item_list:
             - Inspect item and update worry level
@@ -160,6 +159,7 @@ def parse_monkeys(data: list[str], divide_worry_by: int = 3) -> list[Monkey]:
     return monkeys
 
 
+@helper_functions.cache_parsed_input(day=11)
 def parse_data(load_test_data: bool = False) -> list[Monkey]:
     """Parser function to parse today's data
 
@@ -167,12 +167,7 @@ def parse_data(load_test_data: bool = False) -> list[Monkey]:
         load_test_data:     Set to true to load test data from the local
                             directory
     """
-    if load_test_data:
-        with open("input11.1", "r") as f:
-            # For loading example or test data
-            data = f.read()
-    else:
-        data = get_data(day=11, year=2022)
+    data = helper_functions.load_input(day=11, load_test_data=load_test_data)
     data = data.split("\n\n")
     # lines = data.splitlines()
     # grid = np.array(helper_functions.digits_to_int(data.splitlines()))
@@ -196,106 +191,40 @@ def get_monkey_activities(monkeys: list[Monkey]) -> tuple[int]:
     return tuple(monkey.activity_level for monkey in monkeys)
 
 
-class CacheItem(TypedDict):
-    round_idx: int
-    activity_levels: list[int]
-
-
-def find_activity_level_for_round(
-    cache: dict[tuple[tuple[int]], CacheItem], target_round: int
-) -> list[int]:
-    """Check the round_idx in each CacheItem looking for the specified round.
-    Returns the activity level for that round"""
-
-    for cache_entry in cache.values():
-        if cache_entry["round_idx"] == target_round:
-            return cache_entry["activity_levels"]
-
-    raise ValueError(f"Round not found. Looking for round {target_round}")
-
-
-def calculate_activity_increase(start: Sequence[int], end: Sequence[int]) -> list[int]:
-    """Calculate the increase in activity between the start and end point"""
-    return [
-        end_activity - start_activity
-        for start_activity, end_activity in zip(start, end)
-    ]
-
-
-def do_number_of_rounds(
-    monkeys: list[Monkey], number_of_rounds: int, cache: dict
-) -> Sequence[int]:
-    """"""
-    for round_number in range(number_of_rounds):
-        # Get the state of the item lists for all the monkeys, including the
-        # worry level of each item of this moment
-        current_item_list_state = get_state_item_lists(monkeys)
-        # Check if this state has occurred before
-        if current_item_list_state not in cache:
-            # If so, save this state together with the round number at the start
-            # of which this item state occurred
-            cache[current_item_list_state] = {
-                "round_idx": round_number,
-                "activity_levels": [monkey.activity_level for monkey in monkeys],
-            }
-
-            # Now perform this round
-            if not (round_number % 100):
-                print(f"Starting round {round_number}")
-            perform_round(monkeys)
-        else:
-            # we found a loop. Find the round number when this state occurred
-            # before
-            start_of_loop = cache[current_item_list_state]["round_idx"]
-            loop_length = round_number - start_of_loop
-            number_loops_in_total_rounds = (
-                number_of_rounds - start_of_loop
-            ) // loop_length
-            remaining_rounds = (
-                number_of_rounds
-                - start_of_loop
-                - number_loops_in_total_rounds * loop_length
-            )
-            activity_increase_per_loop = calculate_activity_increase(
-                start=cache[current_item_list_state]["activity_levels"],
-                end=get_monkey_activities(monkeys),
-            )
-            activity_increase_remaining_rounds = calculate_activity_increase(
-                start=cache[current_item_list_state]["activity_levels"],
-                end=find_activity_level_for_round(
-                    cache, remaining_rounds + start_of_loop
-                ),
-            )
-            final_activity_level = [
-                activity_increase * number_loops_in_total_rounds
-                + start_activity_level
-                + remaining_activity
-                for activity_increase, start_activity_level, remaining_activity in zip(
-                    activity_increase_per_loop,
-                    cache[current_item_list_state]["activity_levels"],
-                    activity_increase_remaining_rounds,
-                )
-            ]
-
-            print(
-                f"Loop found at the start of round {round_number}!\n"
-                f"The start of the loop occurs at the start of round {start_of_loop}\n"
-                f"With a total of {number_of_rounds} rounds, this loop will occur "
-                f"{number_loops_in_total_rounds} times.\n"
-                f"After that {remaining_rounds} rounds remain"
-            )
-            # return remaining_rounds
-            return final_activity_level
-
-    return get_monkey_activities(monkeys)
+def do_number_of_rounds(monkeys: list[Monkey], number_of_rounds: int) -> Sequence[int]:
+    """Perform the given number of rounds and return the activity level of each
+    monkey. As soon as the items held by the monkeys are the same as at the
+    start of an earlier round, the monkeys are in a loop. The activity levels
+    after all rounds are then extrapolated from the loop, see
+    helper_functions.simulate_with_cycle_detection."""
+
+    def do_round(monkeys: list[Monkey]) -> list[Monkey]:
+        perform_round(monkeys)
+        return monkeys
+
+    result = helper_functions.simulate_with_cycle_detection(
+        monkeys,
+        step=do_round,
+        fingerprint=get_state_item_lists,
+        metric=get_monkey_activities,
+        number_of_steps=number_of_rounds,
+    )
+    if result.cycle_start is not None:
+        print(
+            f"Loop found at the start of round "
+            f"{result.cycle_start + result.cycle_length}!\n"
+            f"The start of the loop occurs at the start of round "
+            f"{result.cycle_start}"
+        )
+    return result.metric
 
 
-@helper_functions.timer
+@profiler.profile
 def part1(data: list[str]) -> int:
     """Advent of code 2022 day 11 - Part 1"""
     monkeys = parse_monkeys(data, divide_worry_by=3)
     number_of_rounds = 20
-    number_interactions = sorted(do_number_of_rounds(monkeys, number_of_rounds, {}))
+    number_interactions = sorted(do_number_of_rounds(monkeys, number_of_rounds))
 
     # Multiply the two highest activity levels
     answer = number_interactions[-1] * number_interactions[-2]
@@ -304,12 +233,12 @@ def part1(data: list[str]) -> int:
     return answer
 
 
-@helper_functions.timer
+@profiler.profile
 def part2(data: list[str]) -> int:
     """Advent of code 2022 day 11 - Part 2"""
     monkeys = parse_monkeys(data, divide_worry_by=1)
     number_of_rounds = 10_000
-    number_interactions = sorted(do_number_of_rounds(monkeys, number_of_rounds, {}))
+    number_interactions = sorted(do_number_of_rounds(monkeys, number_of_rounds))
 
     # Multiply the two highest activity levels
     answer = number_interactions[-1] * number_interactions[-2]
@@ -318,7 +247,7 @@ def part2(data: list[str]) -> int:
     return answer
 
 
-def main(parts: str, should_submit: bool = False, load_test_data: bool = False) -> None:
+def main(parts: str, should_submit: bool = False, load_test_data: bool = False) -> dict[str, Any]:
     """Main function for solving the selected part(s) of today's puzzle
     and automatically submitting the answer.
 
@@ -328,9 +257,14 @@ def main(parts: str, should_submit: bool = False, load_test_data: bool = False)
         load_test_data: Set to True if you want to load test data instead of
                         the full input. By default, this will load the file
                         called 'input11.1'
+
+    Returns:
+        Dict with the answer of each executed part, keyed by the part
+        ("a" or "b")
     """
     data = parse_data(load_test_data=load_test_data)
 
+    answers = {}
     for part in parts:
         if part == "a":
             aocd_result = part1(data)
@@ -338,9 +272,12 @@ def main(parts: str, should_submit: bool = False, load_test_data: bool = False)
             aocd_result = part2(data)
         else:
             raise ValueError(f"Wrong part chosen, expecting 'a' or 'b': got {part}")
+        answers[part] = aocd_result
 
         if should_submit:
-            submit(aocd_result, part=part, day=11, year=2022)
+            helper_functions.submit(aocd_result, part=part, day=11, year=2022)
+
+    return answers
 
 
 if __name__ == "__main__":
@@ -1,87 +1,79 @@
-from typing import Callable
+from __future__ import annotations
 
-from aocd import get_data, submit
+from typing import Callable, Any, Optional
 
-from helper_functions import Coordinate, Direction
+import helper_functions
+from helper_functions import Grid
 
 
 START_SYMBOL: str = "S"
 END_SYMBOL: str = "E"
+# Symbol of the border around the height map, which can never be visited
+BORDER_SYMBOL: str = "#"
+# Every symbol is stored as its index in this string
+SYMBOLS: str = "abcdefghijklmnopqrstuvwxyz" + START_SYMBOL + END_SYMBOL + BORDER_SYMBOL
+# Height of each symbol, the start has height a and the end has height z. The
+# border has no height.
+HEIGHTS: list[Optional[int]] = list(range(26)) + [0, 25, None]
 
 
-def parse_data(load_test_data: bool = False) -> list[str]:
+@helper_functions.cache_parsed_input(day=12)
+def parse_data(load_test_data: bool = False) -> Grid:
     """Parser function to parse today's data
 
     Args:
         load_test_data:     Set to true to load test data from the local
                             directory
     """
-    if load_test_data:
-        with open("input12.1", "r") as f:
-            # For loading example or test data
-            data = f.read()
-    else:
-        data = get_data(day=12, year=2022)
+    data = helper_functions.load_input(day=12, load_test_data=load_test_data)
     lines = data.splitlines()
     # grid = np.array(helper_functions.digits_to_int(data.splitlines()))
     # numbers = [int(x) for x in re.findall("(-?\d+)", data)]
-    return lines
+    # The border makes sure every step from a location in the height map ends
+    # up in the grid array, so moves don't need bounds checks
+    return Grid.from_lines(
+        lines, SYMBOLS, padding=1, fill_value=SYMBOLS.index(BORDER_SYMBOL)
+    )
 
 
-def find_start_and_end_coordinate(grid: list[str]) -> dict[str, Coordinate]:
+def find_start_and_end_coordinate(grid: Grid) -> dict[str, int]:
     """Look for the S and E indicating the start and end position accordingly
-    return a dict containing the coordinates to each position"""
-    start_end = {"start": None, "end": None}
-    for line_idx, line in enumerate(grid):
-        if (start_idx := line.find(START_SYMBOL)) >= 0:
-            start_end["start"] = Coordinate(line_idx, start_idx)
-        if (end_idx := line.find(END_SYMBOL)) >= 0:
-            start_end["end"] = Coordinate(line_idx, end_idx)
-    return start_end
+    return a dict containing the flat index of each position"""
+    return {
+        "start": int(grid.find(SYMBOLS.index(START_SYMBOL))[0]),
+        "end": int(grid.find(SYMBOLS.index(END_SYMBOL))[0]),
+    }
 
 
-def is_coordinate_in_grid(location: Coordinate, grid: list[str]) -> bool:
-    """Check if coordinate is in grid boundaries"""
-    return Coordinate(0, 0) <= location < Coordinate(len(grid), len(grid[0]))
+def get_heights(grid: Grid) -> list[Optional[int]]:
+    """Height of every location in the grid by flat index, None for the
+    border"""
+    return [HEIGHTS[code] for code in grid.flat.tolist()]
 
 
-def is_go_up_valid(current_location: str, next_location: str) -> bool:
+def is_go_up_valid(current_height: int, next_height: int) -> bool:
     """Part 1 move rules. Next location is valid if it is at most one character
     later in the alphabet. For example, if current location is l, then [a-m] are
     valid next locations"""
-
-    def replace_special_symbols(symbol: str) -> str:
-        if symbol == START_SYMBOL:
-            return "a"
-        elif symbol == END_SYMBOL:
-            return "z"
-
-        # Else return the symbol itself
-        return symbol
-
-    return (
-        ord(replace_special_symbols(next_location))
-        - ord(replace_special_symbols(current_location))
-    ) <= 1
+    return next_height - current_height <= 1
 
 
 def get_possible_next_locations(
-    cur_location: Coordinate,
-    grid: list[str],
-    visited: dict[Coordinate, int],
+    cur_location: int,
+    heights: list[Optional[int]],
+    steps: list[int],
+    visited: dict[int, int],
     is_move_valid: Callable,
-) -> list[Coordinate]:
+) -> list[int]:
     """List all the possible next locations you can visit from the current
-    location"""
+    location. Locations are flat indices in the grid, steps are the flat-index
+    offsets to the neighbouring locations."""
     next_locations = []
-    for direction in Direction:
+    for step in steps:
         if (
-            (next_location := cur_location + direction.value) not in visited
-            and is_coordinate_in_grid(next_location, grid)
-            and is_move_valid(
-                grid[cur_location[0]][cur_location[1]],
-                grid[next_location[0]][next_location[1]],
-            )
+            (next_location := cur_location + step) not in visited
+            and heights[next_location] is not None
+            and is_move_valid(heights[cur_location], heights[next_location])
         ):
             next_locations += [next_location]
 
@@ -89,18 +81,19 @@ def get_possible_next_locations(
 
 
 def move(
-    current_frontier: list[Coordinate],
-    grid: list[str],
-    visited: dict[Coordinate, int],
+    current_frontier: list[int],
+    heights: list[Optional[int]],
+    steps: list[int],
+    visited: dict[int, int],
     is_move_valid: Callable,
-) -> (list[Coordinate], dict[Coordinate, int]):
+) -> (list[int], dict[int, int]):
     """From cur_location retrieve all possible next location that are still
     unvisited"""
 
     next_frontier = []
     for cur_location in current_frontier:
         for next_location in get_possible_next_locations(
-            cur_location, grid, visited, is_move_valid
+            cur_location, heights, steps, visited, is_move_valid
         ):
             visited[next_location] = visited[cur_location] + 1
             next_frontier += [next_location]
@@ -109,21 +102,24 @@ def move(
 
 
 def shortest_path(
-    start_location: Coordinate,
-    end_location: Coordinate,
-    grid: list[str],
+    start_location: int,
+    end_location: int,
+    grid: Grid,
     is_move_valid: Callable,
 ) -> int:
     """Search for the shortest path from start to end in the grid. Valid moves
-    are defined by the callable is_move_valid (which takes two Coordinates as
-    input, the current location and the next location as its first and second).
+    are defined by the callable is_move_valid (which takes two heights as
+    input, the height of the current location and the next location as its
+    first and second).
 
     Returns the number of steps needed to reach the end location
     """
+    heights = get_heights(grid)
+    steps = grid.neighbour_offsets().tolist()
     frontier = [start_location]
     visited = {start_location: 0}
     while end_location not in visited:
-        frontier, visited = move(frontier, grid, visited, is_move_valid)
+        frontier, visited = move(frontier, heights, steps, visited, is_move_valid)
         if not frontier:
             # Then our search fails, and we have no more valid next locations
             # left
@@ -131,7 +127,7 @@ def shortest_path(
     return visited[end_location]
 
 
-def part1(grid: list[str]) -> int:
+def part1(grid: Grid) -> int:
     """Advent of code 2022 day 12 - Part 1"""
     start_end = find_start_and_end_coordinate(grid)
     start = start_end["start"]
@@ -142,58 +138,41 @@ def part1(grid: list[str]) -> int:
     return answer
 
 
-def is_go_down_valid(current_location: str, next_location: str) -> bool:
+def is_go_down_valid(current_height: int, next_height: int) -> bool:
     """Part 2 move rules. Next location is valid if it is at most one character
     lower in the alphabet. For example, if current location is l, then [k-z] are
     valid next locations"""
-
-    def replace_special_symbols(symbol: str) -> str:
-        if symbol == START_SYMBOL:
-            return "a"
-        elif symbol == END_SYMBOL:
-            return "z"
-
-        # Else return the symbol itself
-        return symbol
-
-    return (
-        ord(replace_special_symbols(current_location))
-        - ord(replace_special_symbols(next_location))
-    ) <= 1
-
-
-def get_characters_in_frontier(frontier: list[Coordinate], grid: list[str]) -> str:
-    """Get the characters for each location in the frontier"""
-    return "".join([grid[row][col] for row, col in frontier])
+    return current_height - next_height <= 1
 
 
 def shortest_path_to_a(
-    start_location: Coordinate,
-    grid: list[str],
+    start_location: int,
+    grid: Grid,
     is_move_valid: Callable,
 ) -> int:
     """Search for the shortest path from the start in the grid to the lowest
     point in the valid. Valid moves are defined by the callable is_move_valid
-    (which takes two Coordinates as input, the current location and the next
-    location as its first and second).
+    (which takes two heights as input, the height of the current location and
+    the next location as its first and second).
 
     Returns the number of steps needed to reach the end location
     """
+    heights = get_heights(grid)
+    steps = grid.neighbour_offsets().tolist()
     frontier = [start_location]
     visited = {start_location: 0}
-    frontier_characters = get_characters_in_frontier(frontier, grid)
-    while not ("a" in frontier_characters or START_SYMBOL in frontier_characters):
-        frontier, visited = move(frontier, grid, visited, is_move_valid)
+    while True:
+        for location in frontier:
+            if heights[location] == 0:
+                return visited[location]
+        frontier, visited = move(frontier, heights, steps, visited, is_move_valid)
         if not frontier:
             # Then our search fails, and we have no more valid next locations
             # left
             return -1
-        frontier_characters = get_characters_in_frontier(frontier, grid)
-
-    return visited[frontier[frontier_characters.find("a")]]
 
 
-def part2(grid: list[str]) -> int:
+def part2(grid: Grid) -> int:
     """Advent of code 2022 day 12 - Part 2"""
     start_end = find_start_and_end_coordinate(grid)
     start = start_end["end"]
@@ -203,7 +182,7 @@ def part2(grid: list[str]) -> int:
     return answer
 
 
-def main(parts: str, should_submit: bool = False, load_test_data: bool = False) -> None:
+def main(parts: str, should_submit: bool = False, load_test_data: bool = False) -> dict[str, Any]:
     """Main function for solving the selected part(s) of today's puzzle
     and automatically submitting the answer.
 
@@ -213,9 +192,14 @@ def main(parts: str, should_submit: bool = False, load_test_data: bool = False)
         load_test_data: Set to True if you want to load test data instead of
                         the full input. By default, this will load the file
                         called 'input12.1'
+
+    Returns:
+        Dict with the answer of each executed part, keyed by the part
+        ("a" or "b")
     """
     data = parse_data(load_test_data=load_test_data)
 
+    answers = {}
     for part in parts:
         if part == "a":
             aocd_result = part1(data)
@@ -223,9 +207,12 @@ def main(parts: str, should_submit: bool = False, load_test_data: bool = False)
             aocd_result = part2(data)
         else:
             raise ValueError(f"Wrong part chosen, expecting 'a' or 'b': got {part}")
+        answers[part] = aocd_result
 
         if should_submit:
-            submit(aocd_result, part=part, day=12, year=2022)
+            helper_functions.submit(aocd_result, part=part, day=12, year=2022)
+
+    return answers
 
 
 if __name__ == "__main__":
@@ -1,8 +1,8 @@
 import functools
 from enum import Enum
-from typing import Union
+from typing import Union, Any
 
-from aocd import get_data, submit
+import helper_functions
 
 
 class Order(Enum):
@@ -11,24 +11,25 @@ class Order(Enum):
     INCORRECT = 1
 
 
-def parse_data(load_test_data: bool = False) -> list[str]:
+PACKET_PAIR = tuple[list, list]
+
+
+@helper_functions.cache_parsed_input(day=13)
+def parse_data(load_test_data: bool = False) -> list[PACKET_PAIR]:
     """Parser function to parse today's data
 
     Args:
         load_test_data:     Set to true to load test data from the local
                             directory
     """
-    if load_test_data:
-        with open("input13.1", "r") as f:
-            # For loading example or test data
-            data = f.read()
-    else:
-        data = get_data(day=13, year=2022)
-    data = data.split("\n\n")
+    data = helper_functions.load_input(day=13, load_test_data=load_test_data)
+    # Each pair consists of two packets on separate lines, the packets are
+    # converted to lists using eval.
+    pairs = [tuple(map(eval, pair.split())) for pair in data.split("\n\n")]
     # lines = data.splitlines()
     # grid = np.array(helper_functions.digits_to_int(data.splitlines()))
     # numbers = [int(x) for x in re.findall("(-?\d+)", data)]
-    return data
+    return pairs
 
 
 def int_int_compare(left: int, right: int) -> Order:
@@ -71,19 +72,18 @@ def lists_in_right_order(left: list, right: list) -> Order:
         return int_int_compare(len(left), len(right))
 
 
-def process_pairs(pairs: list[str]) -> list[int]:
+def process_pairs(pairs: list[PACKET_PAIR]) -> list[int]:
     """Compare the lists in each pair and return the index of the pairs that
     are in the correct order"""
     idx_correctly_ordered_pairs = []
-    for idx, pair in enumerate(pairs):
-        left, right = tuple(map(eval, pair.split()))
+    for idx, (left, right) in enumerate(pairs):
         status = lists_in_right_order(left, right)
         if status == Order.CORRECT:
             idx_correctly_ordered_pairs += [idx]
     return idx_correctly_ordered_pairs
 
 
-def part1(data: list[str]) -> int:
+def part1(data: list[PACKET_PAIR]) -> int:
     """Advent of code 2022 day 13 - Part 1"""
     correctly_ordered_pairs = process_pairs(data)
     answer = sum(correctly_ordered_pairs) + len(correctly_ordered_pairs)
@@ -109,12 +109,10 @@ def sort_all_packets(packets: list[list]) -> list[list]:
     return sorted(packets, key=functools.cmp_to_key(lists_in_right_order_int))
 
 
-def part2(data: list[str]) -> int:
+def part2(data: list[PACKET_PAIR]) -> int:
     """Advent of code 2022 day 13 - Part 2"""
-    # concatenate the data again so that every packet is on a separate line,
-    # then split the lines to get the individual packets, then convert the
-    # packets to lists using eval.
-    data = list(map(eval, "\n".join(data).splitlines()))
+    # Unpack the pairs, so we get a single list containing all the packets
+    data = [packet for pair in data for packet in pair]
     sorted_packets = sort_all_packets(data)
 
     # Add the first divider package
@@ -150,7 +148,7 @@ def part2(data: list[str]) -> int:
     return answer
 
 
-def main(parts: str, should_submit: bool = False, load_test_data: bool = False) -> None:
+def main(parts: str, should_submit: bool = False, load_test_data: bool = False) -> dict[str, Any]:
     """Main function for solving the selected part(s) of today's puzzle
     and automatically submitting the answer.
 
@@ -160,9 +158,14 @@ def main(parts: str, should_submit: bool = False, load_test_data: bool = False)
         load_test_data: Set to True if you want to load test data instead of
                         the full input. By default, this will load the file
                         called 'input13.1'
+
+    Returns:
+        Dict with the answer of each executed part, keyed by the part
+        ("a" or "b")
     """
     data = parse_data(load_test_data=load_test_data)
 
+    answers = {}
     for part in parts:
         if part == "a":
             aocd_result = part1(data)
@@ -170,9 +173,12 @@ def main(parts: str, should_submit: bool = False, load_test_data: bool = False)
             aocd_result = part2(data)
         else:
             raise ValueError(f"Wrong part chosen, expecting 'a' or 'b': got {part}")
+        answers[part] = aocd_result
 
         if should_submit:
-            submit(aocd_result, part=part, day=13, year=2022)
+            helper_functions.submit(aocd_result, part=part, day=13, year=2022)
+
+    return answers
 
 
 if __name__ == "__main__":
@@ -1,17 +1,25 @@
-import functools
-import re
+from __future__ import annotations
 
-from aocd import get_data, submit
-import numpy as np
+import re
+from typing import Any
 
 import helper_functions
-from helper_functions import LineSegment, Coordinate
+import profiler
+from helper_functions import LineSegment, Coordinate2, Grid
 
+np = helper_functions.lazy_import("numpy")
 
-VOID = Coordinate(-100, -100)
-SAND_ENTRY = Coordinate(500, 0)
 
+VOID = Coordinate2(-100, -100)
+SAND_ENTRY = Coordinate2(500, 0)
+# Codes of the cells in the cavern grid
+AIR = 0
+ROCK = 1
+SAND = 2
+ENTRY = 3
 
+
+@helper_functions.cache_parsed_input(day=14)
 def parse_data(load_test_data: bool = False) -> list[str]:
     """Parser function to parse today's data
 
@@ -19,12 +27,7 @@ def parse_data(load_test_data: bool = False) -> list[str]:
         load_test_data:     Set to true to load test data from the local
                             directory
     """
-    if load_test_data:
-        with open("input14.1", "r") as f:
-            # For loading example or test data
-            data = f.read()
-    else:
-        data = get_data(day=14, year=2022)
+    data = helper_functions.load_input(day=14, load_test_data=load_test_data)
     lines = data.splitlines()
     # grid = np.array(helper_functions.digits_to_int(data.splitlines()))
     # numbers = [int(x) for x in re.findall("(-?\d+)", data)]
@@ -38,7 +41,7 @@ def build_line_segments(data: list[str]) -> (list[LineSegment], int):
     for line in data:
         coordinates = []
         for coordinate in line.split(" -> "):
-            new_coordinate = Coordinate(
+            new_coordinate = Coordinate2(
                 [int(number) for number in coordinate.split(",")]
             )
             # Check if the row number of the new coordinate is further away
@@ -68,22 +71,28 @@ def get_grid_dimensions(raw_data: str) -> (int, int, int):
     return height, width, left
 
 
-def construct_grid(line_segments: list[LineSegment], height: int) -> np.ndarray:
+def construct_grid(line_segments: list[LineSegment], height: int) -> Grid:
     """Construct a numpy array representation of the rocky cavern. The size of
     the grid will be height x (2 * (height - 2) + 1). As for part 2 the final
     sand layout is a triangle starting at the SAND_ENTRY and ending at the
     bottom. The width of that triangle at the bottom will be a function of the
-    grid height."""
-    grid = np.zeros((height, (2 * (height - 2) + 1)))
+    grid height. The grid is padded with rock, so a falling sand particle never
+    leaves the grid."""
+    grid = Grid.from_shape(
+        (height, (2 * (height - 2) + 1)), padding=1, fill_value=ROCK, symbols=".#o+"
+    )
     # For example, in the puzzle example the grid height (including floor and
     # sand entry row) is 12. The sand entry is located in (500, 0) and the left
     # most sand particle is located at (490, 10). So the column shift should be
     # 500 - (12 - 2) for the left most particle to be in the 0th column
     column_shift = SAND_ENTRY[0] - (height - 2)
+    width = grid.shape[1]
     for line in line_segments:
         for col, row in line:
-            grid[row][col - column_shift] = 1
-    grid[SAND_ENTRY[1]][height - 2] = 3
+            # Sand can't reach rocks outside the triangle, so they are left out
+            if 0 <= col - column_shift < width:
+                grid[row, col - column_shift] = ROCK
+    grid[SAND_ENTRY[1], height - 2] = ENTRY
     return grid
 
 
@@ -101,91 +110,59 @@ def print_grid(grid: np.ndarray, symbols: dict = None) -> None:
         print(grid_str)
 
 
-def is_particle_blocked(
-    potential_location: Coordinate,
-    line_segments: list[LineSegment],
-    sand_particles_in_rest: set[Coordinate],
-) -> bool:
-    """Check if the potential location is free for the sand particle to move in.
-    If it contains rock or sand, then it is not."""
-
-    @functools.lru_cache
-    def intersects_line_segment(location: Coordinate) -> bool:
-        """Separate function for checking intersection of line segments so we
-        can use memoization to speed up the calculation"""
-        for line_segment in line_segments:
-            if line_segment.intersect(location):
-                # We hit rock!
-                return True
-        return False
-
-    if potential_location in sand_particles_in_rest:
-        # We hit sand!
-        return True
-
-    return intersects_line_segment(potential_location)
-
-
+@profiler.profile
 def drop_sand_particle(
-    particle_location: Coordinate,
-    start_of_void: int,
-    line_segments: list[LineSegment],
-    sand_particles_in_rest: set[Coordinate],
-) -> Coordinate:
+    cells: memoryview, particle_location: int, start_of_void: int, row_step: int
+) -> int:
     """Drops a sand particle from the start location and find the resting place.
-    If the sand particle cannot find a resting place, i.e. it's row number has
-    reached the start of the void, then we exit the function."""
-    while particle_location[1] < start_of_void:
-        next_location = particle_location + (0, 1)
-        if is_particle_blocked(next_location, line_segments, sand_particles_in_rest):
-            # Straight down didn't work, try diagonal left from current particle
-            # location instead
-            next_location += (-1, 0)
-            if is_particle_blocked(
-                next_location, line_segments, sand_particles_in_rest
-            ):
-                # Diagonal left didn't work, let's try diagonal right instead
-                next_location += (2, 0)
-                if is_particle_blocked(
-                    next_location, line_segments, sand_particles_in_rest
-                ):
-                    # We are blocked all the way, sand particle has come to rest
-                    return particle_location
-        particle_location = next_location
+    Locations are flat indices in the cavern grid, row_step is the flat-index
+    offset to the next row. If the sand particle cannot find a resting place,
+    i.e. it has reached the start of the void, then we exit the function."""
+    while particle_location < start_of_void:
+        # Try straight down, then diagonal left, then diagonal right
+        for step in (row_step, row_step - 1, row_step + 1):
+            if cells[particle_location + step] == AIR:
+                particle_location += step
+                break
+        else:
+            # We are blocked all the way, sand particle has come to rest
+            return particle_location
     return particle_location
 
 
-def fill_cavern(
-    start_location: Coordinate,
-    start_of_void: int,
-    line_segments: list[LineSegment],
-    stop_condition: Coordinate,
-) -> int:
-    """Keep flooding the cavern with sand until one particle reaches the stop
-    condition.
+def fill_cavern(grid: Grid, start_of_void: int, stop_condition: Coordinate2) -> int:
+    """Keep flooding the cavern with sand from the entry until one particle
+    reaches the stop condition: the void (row start_of_void) or the sand
+    entry.
     Return the number of sand particles that came to rest in the cavern"""
-    sand_particles_in_rest = set()
+    # Reading and writing single cells is much faster through a memoryview
+    # than through the numpy array
+    cells = memoryview(grid.flat)
+    start_location = int(grid.find(ENTRY)[0])
+    void_location = grid.flat_index((start_of_void, 0))
+    sand_particles_in_rest = 0
     # Keep dropping sand particles, until one reaches the stop condition
     while True:
         final_location = drop_sand_particle(
-            start_location, start_of_void, line_segments, sand_particles_in_rest
+            cells, start_location, void_location, grid.strides[0]
         )
-        if stop_condition == VOID and final_location[1] == start_of_void:
-            return len(sand_particles_in_rest)
-        elif final_location == stop_condition:
-            # When we need to stop at a specific coordinate, then we also
-            # include that coordinate in the number of total sand particles in
-            # the cavern
-            return len(sand_particles_in_rest) + 1
+        if stop_condition == VOID and final_location >= void_location:
+            return sand_particles_in_rest
+        elif stop_condition == SAND_ENTRY and final_location == start_location:
+            # When we need to stop at the sand entry, then we also include that
+            # particle in the number of total sand particles in the cavern
+            return sand_particles_in_rest + 1
 
-        sand_particles_in_rest.add(final_location)
+        cells[final_location] = SAND
+        sand_particles_in_rest += 1
 
 
 def part1(data: list[str]) -> int:
     """Advent of code 2022 day 14 - Part 1"""
     line_segments, start_of_void = build_line_segments(data)
-    stop_condition = VOID
-    answer = fill_cavern(SAND_ENTRY, start_of_void, line_segments, stop_condition)
+    # The grid includes the two rows below the lowest rock, see part2
+    grid = construct_grid(line_segments, start_of_void + 2)
+    answer = fill_cavern(grid, start_of_void, stop_condition=VOID)
 
     print(f"Solution day 14, part 1: {answer}")
     return answer
@@ -194,14 +171,17 @@ def part1(data: list[str]) -> int:
 def part2(data):
     """Advent of code 2022 day 14 - Part 2"""
     line_segments, start_of_void = build_line_segments(data)
-    stop_condition = SAND_ENTRY
-    answer = fill_cavern(SAND_ENTRY, start_of_void, line_segments, stop_condition)
+    # The floor is located two rows below the lowest rock, sand never falls
+    # into the void
+    grid = construct_grid(line_segments, start_of_void + 2)
+    grid[start_of_void + 1, :] = ROCK
+    answer = fill_cavern(grid, start_of_void + 2, stop_condition=SAND_ENTRY)
 
     print(f"Solution day 14, part 2: {answer}")
     return answer
 
 
-def main(parts: str, should_submit: bool = False, load_test_data: bool = False) -> None:
+def main(parts: str, should_submit: bool = False, load_test_data: bool = False) -> dict[str, Any]:
     """Main function for solving the selected part(s) of today's puzzle
     and automatically submitting the answer.
 
@@ -211,9 +191,14 @@ def main(parts: str, should_submit: bool = False, load_test_data: bool = False)
         load_test_data: Set to True if you want to load test data instead of
                         the full input. By default, this will load the file
                         called 'input14.1'
+
+    Returns:
+        Dict with the answer of each executed part, keyed by the part
+        ("a" or "b")
     """
     data = parse_data(load_test_data=load_test_data)
 
+    answers = {}
     for part in parts:
         if part == "a":
             aocd_result = part1(data)
@@ -221,9 +206,12 @@ def main(parts: str, should_submit: bool = False, load_test_data: bool = False)
             aocd_result = part2(data)
         else:
             raise ValueError(f"Wrong part chosen, expecting 'a' or 'b': got {part}")
+        answers[part] = aocd_result
 
         if should_submit:
-            submit(aocd_result, part=part, day=14, year=2022)
+            helper_functions.submit(aocd_result, part=part, day=14, year=2022)
+
+    return answers
 
 
 if __name__ == "__main__":
@@ -1,61 +1,57 @@
-import re
-from typing import Optional
+from __future__ import annotations
 
-from aocd import get_data, submit
-import numpy as np
+import re
+from typing import Any
 
 import helper_functions
-from helper_functions import Coordinate, LineSegment
+from helper_functions import Coordinate, CoordinateArray, LineSegment
+
+np = helper_functions.lazy_import("numpy")
+
+SENSOR_DATA = tuple[CoordinateArray, CoordinateArray, "np.ndarray"]
 
 
-def get_coordinates(data: list[str]) -> tuple[tuple[Coordinate, Coordinate, int]]:
+def get_coordinates(data: str) -> SENSOR_DATA:
     """From the input parse the sensor and closest beacon coordinates and the
-    manhattan distance between the two"""
-    sensor_beacon_sets = []
-    for line in data:
-        coordinates = [
-            Coordinate(coordinate)
-            for coordinate in helper_functions.digits_to_int(
-                re.findall(f"x=(-?\d+), y=(-?\d+)", line), individual_character=False
-            )
-        ]
-        distance_beacon_sensor = coordinates[0].manhattan_distance(coordinates[1])
-        sensor_beacon_sets.append(tuple((coordinates + [distance_beacon_sensor])))
-    return tuple(sensor_beacon_sets)
-
-
-def parse_data(load_test_data: bool = False):
+    manhattan distance between the two. Every line holds a sensor and its
+    beacon, so every group of 4 numbers is (sensor x, sensor y, beacon x,
+    beacon y)."""
+    numbers = np.array(re.findall(r"-?\d+", data), dtype=np.int64).reshape(-1, 4)
+    sensors = CoordinateArray(numbers[:, :2])
+    beacons = CoordinateArray(numbers[:, 2:])
+    return sensors, beacons, sensors.manhattan_distance(beacons)
+
+
+@helper_functions.cache_parsed_input(day=15)
+def parse_data(load_test_data: bool = False) -> SENSOR_DATA:
     """Parser function to parse today's data
 
     Args:
         load_test_data:     Set to true to load test data from the local
                             directory
     """
-    if load_test_data:
-        with open("input15.1", "r") as f:
-            # For loading example or test data
-            data = f.read()
-    else:
-        data = get_data(day=15, year=2022)
-    lines = data.splitlines()
+    data = helper_functions.load_input(day=15, load_test_data=load_test_data)
     # grid = np.array(helper_functions.digits_to_int(data.splitlines()))
     # numbers = [int(x) for x in re.findall("(-?\d+)", data)]
-    return get_coordinates(lines)
+    return get_coordinates(data)
 
 
 def coordinates_in_reach(
-    sensor_location: Coordinate, sensing_distance: int, target_y: int
-) -> Optional[LineSegment]:
-    """Get the set of coordinates on the target_y row that is within the sensing
-    distance of the sensor"""
-    y_distance = abs(target_y - sensor_location[1])
-    if y_distance > sensing_distance:
-        # Then the sensor cannot reach the target row
-        return None
-    remaining_distance = sensing_distance - y_distance
-    lowest_x = sensor_location[0] - remaining_distance
-    highest_x = sensor_location[0] + remaining_distance
-    return LineSegment(Coordinate(lowest_x, target_y), Coordinate(highest_x, target_y))
+    sensors: CoordinateArray, sensing_distances: np.ndarray, target_y: int
+) -> list[LineSegment]:
+    """Get the coordinates on the target_y row that are within the sensing
+    distance of each sensor. Sensors that cannot reach the target row are
+    skipped."""
+    sensor_x, sensor_y = sensors.axes
+    remaining_distances = sensing_distances - np.abs(target_y - sensor_y)
+    # Sensors with a negative remaining distance cannot reach the target row
+    in_reach = remaining_distances >= 0
+    lowest_x = sensor_x[in_reach] - remaining_distances[in_reach]
+    highest_x = sensor_x[in_reach] + remaining_distances[in_reach]
+    return [
+        LineSegment(Coordinate(low, target_y), Coordinate(high, target_y))
+        for low, high in zip(lowest_x.tolist(), highest_x.tolist())
+    ]
 
 
 def merge_all_lines(lines: list[LineSegment]) -> list[LineSegment]:
@@ -93,22 +89,15 @@ def merge_all_lines(lines: list[LineSegment]) -> list[LineSegment]:
     return merged_lines
 
 
-def part1(sensor_beacons: tuple[tuple[Coordinate, Coordinate, int]]) -> int:
+def part1(sensor_beacons: SENSOR_DATA) -> int:
     """Advent of code 2022 day 15 - Part 1"""
     target_y = 2000_000
     target_y = 10
-    beacons_on_target_y = 0
-    impossible_locations = []
-    for sensor_location, beacon_location, distance in sensor_beacons:
-        # print(f'{sensor_location = }, {beacon_location = }, {distance = }')
-        if beacon_location[1] == target_y:
-            # Remember that this beacon is located on the target row, so we can
-            # subtract that from the total available spaces
-            beacons_on_target_y += 1
-        covered_location = coordinates_in_reach(sensor_location, distance, target_y)
-        if covered_location:
-            # print(f'{covered_location = }')
-            impossible_locations += [covered_location]
+    sensors, beacons, distances = sensor_beacons
+    # Remember how many beacons are located on the target row, so we can
+    # subtract them from the total available spaces
+    beacons_on_target_y = int(np.count_nonzero(beacons.axes[1] == target_y))
+    impossible_locations = coordinates_in_reach(sensors, distances, target_y)
 
     impossible_locations = merge_all_lines(impossible_locations)
     # print(f"{beacons_on_target_y = }")
@@ -132,7 +121,7 @@ def part2(data):
     return answer
 
 
-def main(parts: str, should_submit: bool = False, load_test_data: bool = False) -> None:
+def main(parts: str, should_submit: bool = False, load_test_data: bool = False) -> dict[str, Any]:
     """Main function for solving the selected part(s) of today's puzzle
     and automatically submitting the answer.
 
@@ -142,9 +131,14 @@ def main(parts: str, should_submit: bool = False, load_test_data: bool = False)
         load_test_data: Set to True if you want to load test data instead of
                         the full input. By default, this will load the file
                         called 'input15.1'
+
+    Returns:
+        Dict with the answer of each executed part, keyed by the part
+        ("a" or "b")
     """
     data = parse_data(load_test_data=load_test_data)
 
+    answers = {}
     for part in parts:
         if part == "a":
             aocd_result = part1(data)
@@ -152,9 +146,12 @@ def main(parts: str, should_submit: bool = False, load_test_data: bool = False)
             aocd_result = part2(data)
         else:
             raise ValueError(f"Wrong part chosen, expecting 'a' or 'b': got {part}")
+        answers[part] = aocd_result
 
         if should_submit:
-            submit(aocd_result, part=part, day=15, year=2022)
+            helper_functions.submit(aocd_result, part=part, day=15, year=2022)
+
+    return answers
 
 
 if __name__ == "__main__":
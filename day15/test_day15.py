@@ -30,6 +30,17 @@ class TestDay15(unittest.TestCase):
         """Clean up"""
         pass
 
+    def test_get_coordinates(self):
+        """Test day15.get_coordinates"""
+        sensors, beacons, distances = day15.get_coordinates(TEST_DATA)
+        assert len(sensors) == len(beacons) == len(distances) == 14
+        assert sensors[0] == (2, 18)
+        assert beacons[0] == (-2, 15)
+        assert distances[0] == 7
+        assert sensors[6] == (8, 7)
+        assert beacons[6] == (2, 10)
+        assert distances[6] == 9
+
     def test_part1(self):
         """Test day15.part1"""
         result = day15.part1(TEST_DATA)
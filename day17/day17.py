@@ -1,11 +1,12 @@
-import re
-from typing import Iterator, Sequence, Optional
+from __future__ import annotations
 
-from aocd import get_data, submit
-import numpy as np
+import re
+from typing import Iterator, Sequence, Optional, Any
 
 import helper_functions
-from helper_functions import Coordinate
+from helper_functions import Coordinate2
+
+np = helper_functions.lazy_import("numpy")
 
 
 SYMBOL_ROCK = "#"
@@ -32,11 +33,11 @@ POSSIBLE_ROCKS = [
 ]
 
 ROCK = tuple[str]
-ROCK_LOCATION = list[Coordinate]
+ROCK_LOCATION = list[Coordinate2]
 
 
 def initial_position_rocks(
-    rocks: list[ROCK], bottom_left_anchor: Coordinate
+    rocks: list[ROCK], bottom_left_anchor: Coordinate2
 ) -> dict[ROCK, ROCK_LOCATION]:
     """Return the position for each rock if it were to spawn on an empty grid"""
     initial_positions = {}
@@ -62,9 +63,10 @@ def initial_position_rocks(
 # for each rock is determined assuming the highest rock is at location 0. During
 # the actual rock spawn, the height can be adjusted by shifting the rock up and
 # down depending on the current state of the cavern.
-INITIAL_POSITIONS_ROCK = initial_position_rocks(POSSIBLE_ROCKS, Coordinate(0, 2))
+INITIAL_POSITIONS_ROCK = initial_position_rocks(POSSIBLE_ROCKS, Coordinate2(0, 2))
 
 
+@helper_functions.cache_parsed_input(day=17)
 def parse_data(load_test_data: bool = False) -> str:
     """Parser function to parse today's data
 
@@ -72,12 +74,7 @@ def parse_data(load_test_data: bool = False) -> str:
         load_test_data:     Set to true to load test data from the local
                             directory
     """
-    if load_test_data:
-        with open("input17.1", "r") as f:
-            # For loading example or test data
-            data = f.read()
-    else:
-        data = get_data(day=17, year=2022)
+    data = helper_functions.load_input(day=17, load_test_data=load_test_data)
     # lines = data.splitlines()
     # grid = np.array(helper_functions.digits_to_int(data.splitlines()))
     # numbers = [int(x) for x in re.findall("(-?\d+)", data)]
@@ -104,10 +101,10 @@ def next_rock(rocks: Sequence[ROCK]) -> Iterator[ROCK]:
 
 def is_valid_location(cur_position: ROCK_LOCATION, cavern: np.ndarray) -> bool:
     """Check if the current position is a valid location for the rock"""
-    grid_shape = Coordinate(cavern.shape)
+    grid_shape = Coordinate2(cavern.shape)
 
     for part_location in cur_position:
-        part_in_grid = Coordinate(0, 0) <= part_location < grid_shape
+        part_in_grid = Coordinate2(0, 0) <= part_location < grid_shape
         # in the numpy representation of the cavern, 0 means empty space, and 1
         # means occupied space. The check of the grid status is moved inside the
         # conditional to make sure that is only check when part location is on
@@ -119,7 +116,7 @@ def is_valid_location(cur_position: ROCK_LOCATION, cavern: np.ndarray) -> bool:
 
 
 def move_rock(
-    cur_position: ROCK_LOCATION, step: Coordinate, cavern: np.ndarray
+    cur_position: ROCK_LOCATION, step: Coordinate2, cavern: np.ndarray
 ) -> ROCK_LOCATION:
     """Move the rock by the given step"""
     next_position = [part_location + step for part_location in cur_position]
@@ -136,9 +133,9 @@ def move_rock_horizontally(
     (left, right, bottom, top)"""
     match jet_direction:
         case "<":
-            move = Coordinate(0, -1)
+            move = Coordinate2(0, -1)
         case ">":
-            move = Coordinate(0, 1)
+            move = Coordinate2(0, 1)
         case _:
             raise ValueError(f"Invalid jet direction, got {jet_direction}")
 
@@ -148,7 +145,7 @@ def move_rock_horizontally(
 
 def move_rock_down(cur_position: ROCK_LOCATION, cavern: np.ndarray) -> ROCK_LOCATION:
     """Move the rock down."""
-    return move_rock(cur_position, Coordinate(1, 0), cavern)
+    return move_rock(cur_position, Coordinate2(1, 0), cavern)
 
 
 def get_highest_rock_point(cur_position: ROCK_LOCATION) -> int:
@@ -163,57 +160,100 @@ def place_rock_in_cavern(rock_position: ROCK_LOCATION, cavern: np.ndarray, value
         cavern[part_location] = value
 
 
-def part1(data: str) -> int:
-    """Advent of code 2022 day 17 - Part 1"""
-    cavern = np.zeros((3200, 7))
-    number_of_rocks = 0
-    # Grid dimensions work in reverse. The bottom is the end of the array.
-    top_rock_position = cavern.shape[0]
-    jet_directions = jet_direction_data(data)
-    rocks = next_rock(POSSIBLE_ROCKS)
-
-    for rock in rocks:
+class Chamber:
+    """Tall, narrow chamber in which the rocks fall. The chamber grows upwards
+    when the tower of rocks gets close to the top of the cavern array."""
+
+    def __init__(self, jets: str, initial_height: int = 64) -> None:
+        self.jets = jets
+        # Grid dimensions work in reverse. The bottom is the end of the array.
+        self.cavern = np.zeros((initial_height, 7), dtype=np.uint8)
+        self.top_rock_position = initial_height
+        # Index of the next rock shape and the next jet
+        self.rock_index = 0
+        self.jet_index = 0
+
+    @property
+    def tower_height(self) -> int:
+        """Height of the tower of rocks"""
+        return self.cavern.shape[0] - self.top_rock_position
+
+    def _ensure_space(self) -> None:
+        """Double the height of the cavern when there is no room to spawn the
+        next rock: 3 empty rows above the tower plus the height of the rock"""
+        if self.top_rock_position < 8:
+            added_rows = self.cavern.shape[0]
+            self.cavern = np.vstack(
+                [np.zeros((added_rows, 7), dtype=np.uint8), self.cavern]
+            )
+            self.top_rock_position += added_rows
+
+    def drop_rock(self) -> Chamber:
+        """Drop the next rock until it comes to rest"""
+        self._ensure_space()
+        rock = POSSIBLE_ROCKS[self.rock_index]
+        self.rock_index = (self.rock_index + 1) % len(POSSIBLE_ROCKS)
         cur_position = move_rock(
-            INITIAL_POSITIONS_ROCK[rock], Coordinate(top_rock_position - 4, 0), cavern
+            INITIAL_POSITIONS_ROCK[rock],
+            Coordinate2(self.top_rock_position - 4, 0),
+            self.cavern,
         )
 
         while True:
             # Rocks move in two steps: first horizontally due to jet streams,
             # and then it moves down
-            jet = next(jet_directions)
-            position_after_jet = move_rock_horizontally(cur_position, jet, cavern)
-            cur_position = move_rock_down(position_after_jet, cavern)
-            # print_cavern = cavern.copy()
-            # place_rock_in_cavern(cur_position, print_cavern, 2)
-            # helper_functions.print_grid(print_cavern[9985:, :])
+            jet = self.jets[self.jet_index]
+            self.jet_index = (self.jet_index + 1) % len(self.jets)
+            position_after_jet = move_rock_horizontally(cur_position, jet, self.cavern)
+            cur_position = move_rock_down(position_after_jet, self.cavern)
             if cur_position[0] == position_after_jet[0]:
                 # If the block didn't move during the move down step, the block
                 # comes to rest. Perform the exit logic.
                 highest_rock_point = get_highest_rock_point(cur_position)
-                top_rock_position = min(highest_rock_point, top_rock_position)
-                place_rock_in_cavern(cur_position, cavern)
-                break
+                self.top_rock_position = min(highest_rock_point, self.top_rock_position)
+                place_rock_in_cavern(cur_position, self.cavern)
+                return self
+
+    def fingerprint(self, depth: int = 32) -> tuple[int, int, bytes]:
+        """The next rock, the next jet and the top depth rows of the tower
+        determine how the following rocks fall, assuming no rock falls further
+        than depth rows below the top of the tower"""
+        top_rows = self.cavern[self.top_rock_position : self.top_rock_position + depth]
+        return self.rock_index, self.jet_index, np.packbits(top_rows > 0).tobytes()
+
+
+def get_tower_height(jets: str, number_of_rocks: int) -> int:
+    """Height of the tower after number_of_rocks rocks have fallen. The rocks
+    and jets repeat, so after a while the top of the tower repeats as well. The
+    height is extrapolated from the first repetition, see
+    helper_functions.simulate_with_cycle_detection."""
+    result = helper_functions.simulate_with_cycle_detection(
+        Chamber(jets),
+        step=Chamber.drop_rock,
+        fingerprint=Chamber.fingerprint,
+        metric=lambda chamber: chamber.tower_height,
+        number_of_steps=number_of_rocks,
+    )
+    return result.metric
 
-        # helper_functions.print_grid(cavern[9985:, :])
-        number_of_rocks += 1
-        if number_of_rocks == 2022:
-            # stop when 2022 rocks have fallen
-            break
-    answer = cavern.shape[0] - top_rock_position
+
+def part1(data: str) -> int:
+    """Advent of code 2022 day 17 - Part 1"""
+    answer = get_tower_height(data, 2022)
 
     print(f"Solution day 17, part 1: {answer}")
     return answer
 
 
-def part2(data):
+def part2(data: str) -> int:
     """Advent of code 2022 day 17 - Part 2"""
-    answer = 0
+    answer = get_tower_height(data, 1_000_000_000_000)
 
     print(f"Solution day 17, part 2: {answer}")
     return answer
 
 
-def main(parts: str, should_submit: bool = False, load_test_data: bool = False) -> None:
+def main(parts: str, should_submit: bool = False, load_test_data: bool = False) -> dict[str, Any]:
     """Main function for solving the selected part(s) of today's puzzle
     and automatically submitting the answer.
 
@@ -223,9 +263,14 @@ def main(parts: str, should_submit: bool = False, load_test_data: bool = False)
         load_test_data: Set to True if you want to load test data instead of
                         the full input. By default, this will load the file
                         called 'input17.1'
+
+    Returns:
+        Dict with the answer of each executed part, keyed by the part
+        ("a" or "b")
     """
     data = parse_data(load_test_data=load_test_data)
 
+    answers = {}
     for part in parts:
         if part == "a":
             aocd_result = part1(data)
@@ -233,9 +278,12 @@ def main(parts: str, should_submit: bool = False, load_test_data: bool = False)
             aocd_result = part2(data)
         else:
             raise ValueError(f"Wrong part chosen, expecting 'a' or 'b': got {part}")
+        answers[part] = aocd_result
 
         if should_submit:
-            submit(aocd_result, part=part, day=17, year=2022)
+            helper_functions.submit(aocd_result, part=part, day=17, year=2022)
+
+    return answers
 
 
 if __name__ == "__main__":
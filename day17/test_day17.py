@@ -67,6 +67,17 @@ class TestDay17(unittest.TestCase):
             print(f"{rock = }")
             assert rock == next_rock, f"Expected {rock}, got {next_rock}"
 
+    def test_get_tower_height(self):
+        """Test day17.get_tower_height"""
+        jets = ">>><<><>><<<>><>>><<<>>><<<><<<>><>><<>>"
+        # The extrapolated height matches dropping all rocks one by one
+        chamber = day17.Chamber(jets)
+        for _ in range(2022):
+            chamber.drop_rock()
+        assert chamber.tower_height == 3068
+        assert day17.get_tower_height(jets, 2022) == 3068
+        assert day17.get_tower_height(jets, 1_000_000_000_000) == 1514285714288
+
 
 if __name__ == "__main__":
     unittest.main(module="test_day17")
@@ -1,25 +1,24 @@
 import re
-from typing import Callable
-
-from aocd import get_data, submit
+from typing import Callable, Any
 
 import helper_functions
-from helper_functions import Coordinate
+from helper_functions import Coordinate3, CoordinateEncoder, PackedCoordinateSet
+
 
+# Blocks are stored as packed coordinates, which saves memory and hashes faster
+ENCODER = CoordinateEncoder(dimension=3)
+STEP_TO_NEIGHBOURS = ENCODER.neighbour_steps()
 
-def parse_data(load_test_data: bool = False) -> set[Coordinate]:
+
+@helper_functions.cache_parsed_input(day=18)
+def parse_data(load_test_data: bool = False) -> PackedCoordinateSet:
     """Parser function to parse today's data
 
     Args:
         load_test_data:     Set to true to load test data from the local
                             directory
     """
-    if load_test_data:
-        with open("input18.1", "r") as f:
-            # For loading example or test data
-            data = f.read()
-    else:
-        data = get_data(day=18, year=2022)
+    data = helper_functions.load_input(day=18, load_test_data=load_test_data)
     blocks = helper_functions.digits_to_int(
         re.findall("(\d+),(\d+),(\d+)", data),
         individual_character=False,
@@ -28,34 +27,24 @@ def parse_data(load_test_data: bool = False) -> set[Coordinate]:
     # lines = data.splitlines()
     # grid = np.array(helper_functions.digits_to_int(data.splitlines()))
     # numbers = [int(x) for x in re.findall("(-?\d+)", data)]
-    return set([Coordinate(block) for block in blocks])
-
+    return PackedCoordinateSet(ENCODER, blocks)
 
-STEP_TO_NEIGHBOURS = {
-    Coordinate(1, 0, 0),
-    Coordinate(-1, 0, 0),
-    Coordinate(0, 1, 0),
-    Coordinate(0, -1, 0),
-    Coordinate(0, 0, 1),
-    Coordinate(0, 0, -1),
-}
 
-
-def get_open_faces(blocks: set[Coordinate]) -> list[Coordinate]:
-    """Return the coordinates of all air tiles next to the blocks, i.e. every
-    blocks' neighbouring cell that does not contain a block. Coordinates can
-    appear multiple times, if a cell is neighbouring multiple blocks."""
+def get_open_faces(blocks: PackedCoordinateSet) -> list[int]:
+    """Return the packed coordinates of all air tiles next to the blocks, i.e.
+    every blocks' neighbouring cell that does not contain a block. Coordinates
+    can appear multiple times, if a cell is neighbouring multiple blocks."""
     # For each block, collect all neighbouring coordinates and check that that
     # neighbour cell is not a block
     return [
         neighbour_coordinate
-        for block in blocks
+        for block in blocks.packed
         for step in STEP_TO_NEIGHBOURS
-        if (neighbour_coordinate := block + step) not in blocks
+        if (neighbour_coordinate := block + step) not in blocks.packed
     ]
 
 
-def part1(blocks: set[Coordinate]) -> int:
+def part1(blocks: PackedCoordinateSet) -> int:
     """Advent of code 2022 day 18 - Part 1"""
     answer = len(get_open_faces(blocks))
 
@@ -63,23 +52,23 @@ def part1(blocks: set[Coordinate]) -> int:
     return answer
 
 
-def get_grid_boundaries(blocks: set[Coordinate]) -> (Coordinate, Coordinate):
+def get_grid_boundaries(blocks: PackedCoordinateSet) -> (Coordinate3, Coordinate3):
     """Get the minimum and maximum coordinate of the 3D space the blocks are
     covering"""
     coordinates_per_axis = list(zip(*blocks))
-    space_minimum = Coordinate(*[min(axis) for axis in coordinates_per_axis])
-    space_maximum = Coordinate(*[max(axis) for axis in coordinates_per_axis])
+    space_minimum = Coordinate3(*[min(axis) for axis in coordinates_per_axis])
+    space_maximum = Coordinate3(*[max(axis) for axis in coordinates_per_axis])
     return space_minimum, space_maximum
 
 
 def valid_air_coordinate(
-    blocks: set[Coordinate],
-    space_limits: tuple[Coordinate, Coordinate],
+    blocks: PackedCoordinateSet,
+    space_limits: tuple[Coordinate3, Coordinate3],
 ) -> Callable:
     """Function to pass to the flood_fill function. Checks whether a coordinate
     is a valid coordinate for air to fill into"""
 
-    def is_valid_air_coordinate(coordinate: Coordinate) -> bool:
+    def is_valid_air_coordinate(coordinate: Coordinate3) -> bool:
         """Returns True if air can fill in this coordinate"""
         return (
             space_limits[0] <= coordinate <= space_limits[1]
@@ -89,7 +78,7 @@ def valid_air_coordinate(
     return is_valid_air_coordinate
 
 
-def part2(blocks: set[Coordinate]) -> int:
+def part2(blocks: PackedCoordinateSet) -> int:
     """Advent of code 2022 day 18 - Part 2"""
     space_minimum, space_maximum = get_grid_boundaries(blocks)
     # Pad the grid with extra space so air can surround all the blocks.
@@ -101,18 +90,23 @@ def part2(blocks: set[Coordinate]) -> int:
         is_valid_coordinate=valid_air_coordinate(
             blocks, (space_minimum, space_maximum)
         ),
+        encoder=ENCODER,
     )
     open_faces = get_open_faces(blocks)
 
     answer = len(
-        [coordinate for coordinate in open_faces if coordinate in air_coordinates]
+        [
+            coordinate
+            for coordinate in open_faces
+            if coordinate in air_coordinates.packed
+        ]
     )
 
     print(f"Solution day 18, part 2: {answer}")
     return answer
 
 
-def main(parts: str, should_submit: bool = False, load_test_data: bool = False) -> None:
+def main(parts: str, should_submit: bool = False, load_test_data: bool = False) -> dict[str, Any]:
     """Main function for solving the selected part(s) of today's puzzle
     and automatically submitting the answer.
 
@@ -122,9 +116,14 @@ def main(parts: str, should_submit: bool = False, load_test_data: bool = False)
         load_test_data: Set to True if you want to load test data instead of
                         the full input. By default, this will load the file
                         called 'input18.1'
+
+    Returns:
+        Dict with the answer of each executed part, keyed by the part
+        ("a" or "b")
     """
     data = parse_data(load_test_data=load_test_data)
 
+    answers = {}
     for part in parts:
         if part == "a":
             aocd_result = part1(data)
@@ -132,9 +131,12 @@ def main(parts: str, should_submit: bool = False, load_test_data: bool = False)
             aocd_result = part2(data)
         else:
             raise ValueError(f"Wrong part chosen, expecting 'a' or 'b': got {part}")
+        answers[part] = aocd_result
 
         if should_submit:
-            submit(aocd_result, part=part, day=18, year=2022)
+            helper_functions.submit(aocd_result, part=part, day=18, year=2022)
+
+    return answers
 
 
 if __name__ == "__main__":
@@ -1,33 +1,319 @@
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import importlib.util
+import inspect
 import itertools
+import json
+import mmap
+import os
+import pickle
+import sys
 from enum import Enum
-from typing import Union, Sequence, Callable, Self, Any, Iterator, Optional
+from pathlib import Path
+from typing import (
+    Union,
+    Sequence,
+    Callable,
+    Self,
+    Any,
+    Iterator,
+    Optional,
+    Hashable,
+    NamedTuple,
+)
 import math
 import time
+import types
+from collections.abc import Iterable, MutableMapping, MutableSet
 from functools import wraps
 
-import numpy as np
+import profiler
+
+
+def lazy_import(name: str) -> types.ModuleType:
+    """Import a module on its first attribute access instead of right away.
+    Heavy modules like numpy take longer to import than many solutions take to
+    run, so modules that only need them in some code paths import them lazily.
+    Annotations using the module should not be evaluated at import time, e.g.
+    by using `from __future__ import annotations`.
 
+    Args:
+        name:   Name of the module to import, e.g. "numpy"
+
+    Returns:
+        The module. If the module was imported before, the imported module is
+        returned, otherwise a module that is loaded on first use.
+    """
+    if name in sys.modules:
+        return sys.modules[name]
+    spec = importlib.util.find_spec(name)
+    if spec is None:
+        raise ModuleNotFoundError(f"No module named '{name}'", name=name)
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
+
+
+np = lazy_import("numpy")
+
+YEAR = 2022
+ROOT_DIRECTORY = Path(__file__).parent
+# Puzzle inputs are stored by the hash of their content in the objects
+# directory. The index file maps each puzzle to the hash of its input.
+INPUT_STORE_DIRECTORY = ROOT_DIRECTORY / ".input_store"
+_input_store_directory = INPUT_STORE_DIRECTORY
+# Parsed inputs are cached here when the parse cache is enabled
+PARSE_CACHE_DIRECTORY = ROOT_DIRECTORY / ".parse_cache"
+_parse_cache_enabled = False
+
+
+def timer(func: Optional[Callable] = None, *, memory: bool = False) -> Callable:
+    """Decorator printing the wall time of every call of func. The calls are
+    also recorded as spans when the profiler is enabled, see profiler.py.
+
+    Use @timer(memory=True) to print the memory usage of every call as well:
+    the peak memory, the top allocation sites and the number of Coordinate
+    instances. Tracing the memory allocations slows down the function.
+    """
+    if func is None:
+        return lambda func: timer(func, memory=memory)
+    profiled_func = profiler.profile(func)
 
-def timer(func):
     @wraps(func)
     def wrapper(*args, **kwargs):
-        # Record the start time
-        start_time = time.time()
+        memory_usage = (
+            profiler.measure_memory(count_instances=[Coordinate])
+            if memory
+            else contextlib.nullcontext()
+        )
+        with memory_usage as memory_report:
+            start_time = time.perf_counter_ns()
+            result = profiled_func(*args, **kwargs)
+            elapsed_time = (time.perf_counter_ns() - start_time) / 1e9
+        print(f"Elapsed time for {func.__name__}: {elapsed_time} seconds")
+        if memory:
+            print(f"Memory usage for {func.__name__}:\n{memory_report.format()}")
+        return result
 
-        # Call the function being decorated
-        result = func(*args, **kwargs)
+    return wrapper
 
-        # Record the end time
-        end_time = time.time()
 
-        # Print the elapsed time
-        print(f"Elapsed time for {func.__name__}: {end_time - start_time} seconds")
+def _read_file(path: Path) -> str:
+    """Read a text file in one go through a read-only memory map"""
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            # Empty files cannot be memory mapped
+            return ""
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped_file:
+            return str(mapped_file, encoding="utf-8")
+
+
+def _write_file_atomic(path: Path, data: bytes) -> None:
+    """Write data to a temporary file first and then move it in place, so
+    concurrent readers never see a partially written file"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temporary_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    with open(temporary_path, "wb") as f:
+        f.write(data)
+    os.replace(temporary_path, path)
+
+
+def _read_store_index(store_directory: Path) -> dict[str, str]:
+    """Read the index of the input store, mapping 'year/day' to input hash"""
+    index_path = store_directory / "index.json"
+    if not index_path.exists():
+        return {}
+    return json.loads(_read_file(index_path))
+
+
+def set_input_store(store_directory: Optional[Path] = None) -> None:
+    """Select the input store that is used when no store directory is passed
+    explicitly. Without arguments, the default store in the repository is
+    selected again."""
+    global _input_store_directory
+    _input_store_directory = store_directory or INPUT_STORE_DIRECTORY
+
+
+def store_input(
+    data: str,
+    day: int,
+    year: int = YEAR,
+    store_directory: Optional[Path] = None,
+) -> str:
+    """Add the puzzle input for the given day to the local input store. Inputs
+    in the store are loaded without contacting adventofcode.com, so this can
+    also be used to make a puzzle input available offline.
 
-        # Return the result of the decorated function
-        return result
+    Returns:
+        The hash of the puzzle input, which is the key of the input in the store
+    """
+    store_directory = store_directory or _input_store_directory
+    encoded_data = data.encode("utf-8")
+    input_hash = hashlib.sha256(encoded_data).hexdigest()
+    object_path = store_directory / "objects" / input_hash
+    if not object_path.exists():
+        _write_file_atomic(object_path, encoded_data)
+
+    index = _read_store_index(store_directory)
+    if index.get(f"{year}/{day}") != input_hash:
+        index[f"{year}/{day}"] = input_hash
+        _write_file_atomic(
+            store_directory / "index.json",
+            json.dumps(index, indent=4, sort_keys=True).encode("utf-8"),
+        )
+    return input_hash
+
+
+def _fetch_input(day: int, year: int) -> str:
+    """Download the puzzle input with aocd"""
+    try:
+        from aocd import get_data
+
+        return get_data(day=day, year=year)
+    except Exception as exception:
+        raise FileNotFoundError(
+            f"The input for day {day} ({year}) is not in the local input store "
+            f"and could not be fetched with aocd ({exception}). Add the input to "
+            f"the store with helper_functions.store_input(data, day={day})."
+        ) from exception
+
+
+def submit(answer: Any, part: str, day: int, year: int = YEAR) -> None:
+    """Submit the answer with aocd. aocd is only imported when an answer is
+    submitted, as importing it takes longer than most solutions take to run."""
+    from aocd import submit as aocd_submit
+
+    aocd_submit(answer, part=part, day=day, year=year)
+
+
+def _get_input_path(
+    day: int, load_test_data: bool, year: int, store_directory: Optional[Path]
+) -> Path:
+    """Get the path to the input file for the given day. Puzzle inputs that are
+    missing from the store are fetched with aocd and added to the store."""
+    if load_test_data:
+        return ROOT_DIRECTORY / f"day{day:0>2}" / f"input{day}.1"
+
+    store_directory = store_directory or _input_store_directory
+    index = _read_store_index(store_directory)
+    if (input_hash := index.get(f"{year}/{day}")) is None:
+        input_hash = store_input(_fetch_input(day, year), day, year, store_directory)
+    return store_directory / "objects" / input_hash
+
+
+def get_input_hash(
+    day: int,
+    load_test_data: bool = False,
+    year: int = YEAR,
+    store_directory: Optional[Path] = None,
+) -> str:
+    """Return the sha256 hash of the input for the given day"""
+    input_path = _get_input_path(day, load_test_data, year, store_directory)
+    if load_test_data:
+        # Test data is not in the store, so hash the file content directly
+        with open(input_path, "rb") as f:
+            return hashlib.sha256(f.read()).hexdigest()
+    return input_path.name
+
+
+def load_input(
+    day: int,
+    load_test_data: bool = False,
+    year: int = YEAR,
+    store_directory: Optional[Path] = None,
+) -> str:
+    """Load the puzzle input for the given day. Puzzle inputs are kept in a
+    local store, indexed by the hash of their content. Only if the input is not
+    yet in the store, it is downloaded with aocd.
+
+    Args:
+        day:                Puzzle day
+        load_test_data:     Set to true to load the test data (inputX.1) from
+                            the directory of the given day instead
+        year:               Puzzle year
+        store_directory:    Location of the local input store. By default,
+                            the store selected with set_input_store is used.
+    """
+    return _read_file(_get_input_path(day, load_test_data, year, store_directory))
+
+
+def get_source_hash(*modules) -> str:
+    """Return the sha256 hash of the source code of the given modules"""
+    source_hash = hashlib.sha256()
+    for module in modules:
+        with open(inspect.getsourcefile(module), "rb") as f:
+            source_hash.update(f.read())
+    return source_hash.hexdigest()
+
+
+def enable_parse_cache(enabled: bool = True) -> None:
+    """Turn the cache of parsed inputs on or off. See cache_parsed_input."""
+    global _parse_cache_enabled
+    _parse_cache_enabled = enabled
 
-    # Return the wrapper function
-    return wrapper
+
+def cache_parsed_input(day: Optional[int] = None) -> Callable:
+    """Decorator to cache the output of a parser function on disk. The cache is
+    opt-in, parsers only use the cache after a call to enable_parse_cache().
+
+    The cache key combines the source code of the module defining the parser
+    and of helper_functions with the parser input. When a day is given, the
+    parser is expected to load the input of that day itself (through its
+    load_test_data argument) and the input is identified by its hash.
+    Otherwise, the input is identified by the hash of the arguments of the
+    parser.
+
+    Parser outputs that cannot be pickled are not cached.
+
+    Args:
+        day:    Puzzle day of which the parser loads the input
+    """
+
+    def decorator(parser: Callable) -> Callable:
+        @wraps(parser)
+        def wrapper(*args, **kwargs):
+            if not _parse_cache_enabled:
+                return parser(*args, **kwargs)
+
+            if day is not None:
+                arguments = inspect.signature(parser).bind(*args, **kwargs)
+                arguments.apply_defaults()
+                input_key = get_input_hash(
+                    day, arguments.arguments.get("load_test_data", False)
+                )
+            else:
+                input_key = hashlib.sha256(pickle.dumps((args, kwargs))).hexdigest()
+            source_hash = get_source_hash(
+                sys.modules[parser.__module__], sys.modules[__name__]
+            )
+            cache_key = hashlib.sha256(
+                f"{Path(inspect.getsourcefile(parser)).stem}.{parser.__qualname__}"
+                f"/{input_key}/{source_hash}".encode("utf-8")
+            ).hexdigest()
+
+            cache_path = PARSE_CACHE_DIRECTORY / f"{cache_key}.pickle"
+            if cache_path.exists():
+                with open(cache_path, "rb") as f:
+                    return pickle.load(f)
+
+            parsed_input = parser(*args, **kwargs)
+            try:
+                pickled_input = pickle.dumps(
+                    parsed_input, protocol=pickle.HIGHEST_PROTOCOL
+                )
+            except (pickle.PicklingError, TypeError, AttributeError, RecursionError):
+                return parsed_input
+            _write_file_atomic(cache_path, pickled_input)
+            return parsed_input
+
+        return wrapper
+
+    return decorator
 
 
 class Characters(Enum):
@@ -110,6 +396,9 @@ def get_sign(number: Union[int, float], sign_zero: int = 0) -> int:
 
 
 class Coordinate(tuple):
+    # Coordinates are immutable, so they don't need an instance dict
+    __slots__ = ()
+
     def __new__(cls, *data) -> Self:
         """Be adding this call we allow coordinate creation via Coordinate(x, y)
         instead of Coordinate((x, y))"""
@@ -198,11 +487,686 @@ class Coordinate(tuple):
         return Coordinate([0] * dimension)
 
 
+# Creating tuples directly skips the argument handling of Coordinate.__new__
+_new_tuple = tuple.__new__
+
+
+class Coordinate2(Coordinate):
+    """Coordinate with exactly 2 dimensions. Behaves like Coordinate, but the
+    operations work directly on both fields instead of looping over all axes,
+    which makes them several times faster in hot loops. The other operand can
+    be any sequence of length 2, e.g. a Coordinate or a tuple."""
+
+    __slots__ = ()
+
+    def __new__(cls, *data) -> Self:
+        """Create via Coordinate2(x, y) or Coordinate2((x, y))"""
+        if len(data) == 1:
+            data = data[0]
+        x, y = data
+        return _new_tuple(cls, (x, y))
+
+    def __add__(self, other: Sequence[int]) -> Self:
+        return _new_tuple(Coordinate2, (self[0] + other[0], self[1] + other[1]))
+
+    def __sub__(self, other: Sequence[int]) -> Self:
+        return _new_tuple(Coordinate2, (self[0] - other[0], self[1] - other[1]))
+
+    def __gt__(self, other: Sequence[int]) -> bool:
+        return self[0] > other[0] and self[1] > other[1]
+
+    def __lt__(self, other: Sequence[int]) -> bool:
+        return self[0] < other[0] and self[1] < other[1]
+
+    def __ge__(self, other: Sequence[int]) -> bool:
+        return self[0] >= other[0] and self[1] >= other[1]
+
+    def __le__(self, other: Sequence[int]) -> bool:
+        return self[0] <= other[0] and self[1] <= other[1]
+
+    def distance(self, other: Sequence[int]) -> float:
+        """Calculate the euclidian distance between two coordinates"""
+        return math.hypot(self[0] - other[0], self[1] - other[1])
+
+    def manhattan_distance(self, other: Sequence[int]) -> int:
+        """Returns manhattan distance between two coordinates"""
+        return abs(self[0] - other[0]) + abs(self[1] - other[1])
+
+    def is_touching(
+        self, other: Sequence[int], overlap: bool = True, diagonal: bool = True
+    ) -> bool:
+        """See Coordinate.is_touching"""
+        dx = abs(self[0] - other[0])
+        dy = abs(self[1] - other[1])
+        if not dx and not dy:
+            return overlap
+        if diagonal:
+            return dx <= 1 and dy <= 1
+        return dx + dy == 1
+
+    @staticmethod
+    def create_origin(dimension: int = 2) -> Self:
+        """Create the origin (0, 0). The dimension argument only exists to
+        match Coordinate.create_origin, and must be 2."""
+        if dimension != 2:
+            raise ValueError(f"Coordinate2 has 2 dimensions, got {dimension}")
+        return Coordinate2(0, 0)
+
+
+class Coordinate3(Coordinate):
+    """Coordinate with exactly 3 dimensions, see Coordinate2"""
+
+    __slots__ = ()
+
+    def __new__(cls, *data) -> Self:
+        """Create via Coordinate3(x, y, z) or Coordinate3((x, y, z))"""
+        if len(data) == 1:
+            data = data[0]
+        x, y, z = data
+        return _new_tuple(cls, (x, y, z))
+
+    def __add__(self, other: Sequence[int]) -> Self:
+        return _new_tuple(
+            Coordinate3,
+            (self[0] + other[0], self[1] + other[1], self[2] + other[2]),
+        )
+
+    def __sub__(self, other: Sequence[int]) -> Self:
+        return _new_tuple(
+            Coordinate3,
+            (self[0] - other[0], self[1] - other[1], self[2] - other[2]),
+        )
+
+    def __gt__(self, other: Sequence[int]) -> bool:
+        return self[0] > other[0] and self[1] > other[1] and self[2] > other[2]
+
+    def __lt__(self, other: Sequence[int]) -> bool:
+        return self[0] < other[0] and self[1] < other[1] and self[2] < other[2]
+
+    def __ge__(self, other: Sequence[int]) -> bool:
+        return self[0] >= other[0] and self[1] >= other[1] and self[2] >= other[2]
+
+    def __le__(self, other: Sequence[int]) -> bool:
+        return self[0] <= other[0] and self[1] <= other[1] and self[2] <= other[2]
+
+    def distance(self, other: Sequence[int]) -> float:
+        """Calculate the euclidian distance between two coordinates"""
+        return math.hypot(self[0] - other[0], self[1] - other[1], self[2] - other[2])
+
+    def manhattan_distance(self, other: Sequence[int]) -> int:
+        """Returns manhattan distance between two coordinates"""
+        return (
+            abs(self[0] - other[0])
+            + abs(self[1] - other[1])
+            + abs(self[2] - other[2])
+        )
+
+    def is_touching(
+        self, other: Sequence[int], overlap: bool = True, diagonal: bool = True
+    ) -> bool:
+        """See Coordinate.is_touching"""
+        dx = abs(self[0] - other[0])
+        dy = abs(self[1] - other[1])
+        dz = abs(self[2] - other[2])
+        if not dx and not dy and not dz:
+            return overlap
+        if diagonal:
+            return dx <= 1 and dy <= 1 and dz <= 1
+        return dx + dy + dz == 1
+
+    @staticmethod
+    def create_origin(dimension: int = 3) -> Self:
+        """Create the origin (0, 0, 0). The dimension argument only exists to
+        match Coordinate.create_origin, and must be 3."""
+        if dimension != 3:
+            raise ValueError(f"Coordinate3 has 3 dimensions, got {dimension}")
+        return Coordinate3(0, 0, 0)
+
+
 class Direction(Enum):
-    LEFT = Coordinate(0, -1)
-    UP = Coordinate(-1, 0)
-    RIGHT = Coordinate(0, 1)
-    DOWN = Coordinate(1, 0)
+    LEFT = Coordinate2(0, -1)
+    UP = Coordinate2(-1, 0)
+    RIGHT = Coordinate2(0, 1)
+    DOWN = Coordinate2(1, 0)
+
+
+def _coordinate_type(dimension: int) -> type[Coordinate]:
+    """Fastest coordinate class for the given dimension"""
+    return {2: Coordinate2, 3: Coordinate3}.get(dimension, Coordinate)
+
+
+class CoordinateEncoder:
+    """Packs coordinates into a single int, which takes a fraction of the
+    memory of a Coordinate and hashes faster. Every axis gets a fixed number of
+    bits, with the first axis in the most significant bits, so sorting the
+    packed values sorts the coordinates. The packing is linear, so moving a
+    packed coordinate is a single addition with a packed step, see step.
+
+    Coordinates must lie within [-2**(bits - 1), 2**(bits - 1)) on every axis.
+    encode doesn't check this to stay fast, encode_array does."""
+
+    def __init__(self, dimension: int, bits: Optional[int] = None) -> None:
+        """Create an encoder for coordinates with the given dimension. By
+        default, the axes share 60 bits, so the packed values fit in an int64
+        numpy array, and in the smallest Python int that holds 60 bits."""
+        if bits is None:
+            bits = 60 // max(dimension, 1)
+        if dimension < 1 or bits < 1:
+            raise ValueError(
+                f"Dimension and bits must be positive, got {dimension} and {bits}"
+            )
+        self.dimension = dimension
+        self.bits = bits
+        self.minimum = -(1 << (bits - 1))
+        self.maximum = (1 << (bits - 1)) - 1
+        self.shifts = tuple(bits * axis for axis in reversed(range(dimension)))
+        self.multipliers = tuple(1 << shift for shift in self.shifts)
+        self.mask = (1 << bits) - 1
+        # Packed value of the origin. Every axis is offset by -minimum, so all
+        # fields are non-negative.
+        self.bias = self.step([-self.minimum] * dimension)
+        self._coordinate_type = _coordinate_type(dimension)
+        # encode and decode are called in hot loops, so 2 and 3 dimensions get
+        # versions without a loop over the axes, which are several times faster
+        if dimension in (2, 3):
+            self.encode, self.decode = self._unrolled_functions()
+
+    def __reduce__(self) -> tuple[type, tuple[int, int]]:
+        # The unrolled functions can't be pickled, so recreate the encoder
+        return CoordinateEncoder, (self.dimension, self.bits)
+
+    def _unrolled_functions(self) -> tuple[Callable, Callable]:
+        """encode and decode for 2 or 3 dimensions"""
+        bias, mask, minimum = self.bias, self.mask, self.minimum
+        if self.dimension == 2:
+            shift = self.shifts[0]
+            multiplier = self.multipliers[0]
+
+            def encode(coordinate: Sequence[int]) -> int:
+                x, y = coordinate
+                return bias + x * multiplier + y
+
+            def decode(packed: int) -> Coordinate2:
+                return _new_tuple(
+                    Coordinate2,
+                    (((packed >> shift) & mask) + minimum, (packed & mask) + minimum),
+                )
+
+        else:
+            shift_x, shift_y, _ = self.shifts
+            multiplier_x, multiplier_y, _ = self.multipliers
+
+            def encode(coordinate: Sequence[int]) -> int:
+                x, y, z = coordinate
+                return bias + x * multiplier_x + y * multiplier_y + z
+
+            def decode(packed: int) -> Coordinate3:
+                return _new_tuple(
+                    Coordinate3,
+                    (
+                        ((packed >> shift_x) & mask) + minimum,
+                        ((packed >> shift_y) & mask) + minimum,
+                        (packed & mask) + minimum,
+                    ),
+                )
+
+        return encode, decode
+
+    def encode(self, coordinate: Sequence[int]) -> int:
+        """Pack a coordinate into an int"""
+        return self.bias + sum(
+            value * multiplier
+            for value, multiplier in zip(coordinate, self.multipliers)
+        )
+
+    def decode(self, packed: int) -> Coordinate:
+        """Unpack an int into a coordinate. Returns a Coordinate2 or
+        Coordinate3 for 2 or 3 dimensions."""
+        mask, minimum = self.mask, self.minimum
+        return self._coordinate_type(
+            [((packed >> shift) & mask) + minimum for shift in self.shifts]
+        )
+
+    def step(self, step: Sequence[int]) -> int:
+        """Packed value of a step, e.g. (0, 1). Adding it to a packed
+        coordinate gives the packed value of the moved coordinate."""
+        if len(step) != self.dimension:
+            raise ValueError(f"Expected a step of dimension {self.dimension}")
+        return sum(value * multiplier for value, multiplier in zip(step, self.multipliers))
+
+    def neighbour_steps(self, diagonal: bool = False) -> list[int]:
+        """Packed steps to all neighbours of a coordinate. Without diagonal,
+        only the neighbours that share a face are included."""
+        return [
+            self.step(step)
+            for step in itertools.product((-1, 0, 1), repeat=self.dimension)
+            if any(step) and (diagonal or sum(map(abs, step)) == 1)
+        ]
+
+    def encode_array(self, coordinates: np.ndarray) -> np.ndarray:
+        """Pack an array of coordinates with shape (N, dimension) into an int64
+        array of length N"""
+        coordinates = np.asarray(coordinates, dtype=np.int64).reshape(
+            -1, self.dimension
+        )
+        if coordinates.size and (
+            coordinates.min() < self.minimum or coordinates.max() > self.maximum
+        ):
+            raise ValueError(
+                f"Coordinates must be within [{self.minimum}, {self.maximum}]"
+            )
+        shifts = np.array(self.shifts, dtype=np.int64)
+        return ((coordinates - self.minimum) << shifts).sum(axis=1)
+
+    def decode_array(self, packed: np.ndarray) -> np.ndarray:
+        """Unpack an int64 array of length N into coordinates with shape
+        (N, dimension)"""
+        packed = np.asarray(packed, dtype=np.int64).reshape(-1, 1)
+        shifts = np.array(self.shifts, dtype=np.int64)
+        return ((packed >> shifts) & self.mask) + self.minimum
+
+
+class PackedCoordinateSet(MutableSet):
+    """Set of coordinates, stored as packed ints (see CoordinateEncoder).
+    Behaves like a set of coordinates. Hot loops can use the packed values
+    directly through the packed attribute, together with the packed steps of
+    the encoder."""
+
+    def __init__(
+        self, encoder: CoordinateEncoder, coordinates: Iterable[Sequence[int]] = ()
+    ) -> None:
+        self.encoder = encoder
+        self.packed = set(map(encoder.encode, coordinates))
+
+    @classmethod
+    def from_packed(
+        cls, encoder: CoordinateEncoder, packed: Iterable[int]
+    ) -> PackedCoordinateSet:
+        """Create the set from values that are already packed"""
+        coordinate_set = cls(encoder)
+        coordinate_set.packed = set(packed)
+        return coordinate_set
+
+    def __contains__(self, coordinate: Sequence[int]) -> bool:
+        return self.encoder.encode(coordinate) in self.packed
+
+    def __iter__(self) -> Iterator[Coordinate]:
+        return map(self.encoder.decode, self.packed)
+
+    def __len__(self) -> int:
+        return len(self.packed)
+
+    def add(self, coordinate: Sequence[int]) -> None:
+        self.packed.add(self.encoder.encode(coordinate))
+
+    def discard(self, coordinate: Sequence[int]) -> None:
+        self.packed.discard(self.encoder.encode(coordinate))
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({set(self)})"
+
+
+class PackedCoordinateDict(MutableMapping):
+    """Dict keyed by coordinates, stored as packed ints (see
+    CoordinateEncoder). Like a defaultdict, missing keys are inserted with
+    the value of default_factory, if given."""
+
+    def __init__(
+        self,
+        encoder: CoordinateEncoder,
+        default_factory: Optional[Callable[[], Any]] = None,
+    ) -> None:
+        self.encoder = encoder
+        self.default_factory = default_factory
+        self.packed = {}
+
+    def __getitem__(self, coordinate: Sequence[int]) -> Any:
+        packed = self.encoder.encode(coordinate)
+        try:
+            return self.packed[packed]
+        except KeyError:
+            if self.default_factory is None:
+                raise KeyError(coordinate) from None
+            value = self.packed[packed] = self.default_factory()
+            return value
+
+    def get(self, coordinate: Sequence[int], default: Any = None) -> Any:
+        # Like defaultdict.get, a missing key is not inserted
+        return self.packed.get(self.encoder.encode(coordinate), default)
+
+    def __setitem__(self, coordinate: Sequence[int], value: Any) -> None:
+        self.packed[self.encoder.encode(coordinate)] = value
+
+    def __delitem__(self, coordinate: Sequence[int]) -> None:
+        try:
+            del self.packed[self.encoder.encode(coordinate)]
+        except KeyError:
+            raise KeyError(coordinate) from None
+
+    def __contains__(self, coordinate: Sequence[int]) -> bool:
+        return self.encoder.encode(coordinate) in self.packed
+
+    def __iter__(self) -> Iterator[Coordinate]:
+        return map(self.encoder.decode, self.packed)
+
+    def __len__(self) -> int:
+        return len(self.packed)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({dict(self.items())})"
+
+
+class CoordinateArray:
+    """Many coordinates of the same dimension, stored as one numpy array per
+    axis (struct of arrays). Arithmetic, distances and bounds checks work on
+    all coordinates at once, instead of looping over Coordinate objects.
+
+    Indexing with an int returns a Coordinate, indexing with a slice, index
+    array or boolean mask returns a CoordinateArray."""
+
+    __slots__ = ("axes",)
+
+    def __init__(self, coordinates: Union[Iterable[Sequence[int]], np.ndarray]) -> None:
+        """Create from an iterable of coordinates, or from an array with shape
+        (N, dimension)"""
+        data = np.asarray(
+            coordinates if isinstance(coordinates, np.ndarray) else list(coordinates),
+            dtype=np.int64,
+        )
+        if data.ndim != 2:
+            raise ValueError(
+                f"Expected coordinates with shape (N, dimension), got {data.shape}"
+            )
+        # Every axis is stored contiguous in memory
+        self.axes = np.ascontiguousarray(data.T)
+
+    @classmethod
+    def from_axes(cls, *axes: Sequence[int]) -> CoordinateArray:
+        """Create from one sequence of values per axis, e.g. from_axes(xs, ys)"""
+        coordinate_array = cls.__new__(cls)
+        coordinate_array.axes = np.array(axes, dtype=np.int64, ndmin=2)
+        return coordinate_array
+
+    @classmethod
+    def full_space(cls, start: Sequence[int], end: Sequence[int]) -> CoordinateArray:
+        """All coordinates between start and end (inclusive), in the same
+        order as full_space"""
+        if len(start) != len(end):
+            raise ValueError(
+                f"Start and end coordinates have different dimensions: "
+                f"{start = }, {end = }"
+            )
+        grids = np.meshgrid(
+            *[np.arange(low, high + 1) for low, high in zip(start, end)],
+            indexing="ij",
+        )
+        return cls.from_axes(*[grid.ravel() for grid in grids])
+
+    @property
+    def dimension(self) -> int:
+        return self.axes.shape[0]
+
+    def __len__(self) -> int:
+        return self.axes.shape[1]
+
+    def __getitem__(
+        self, index: Union[int, slice, np.ndarray]
+    ) -> Union[Coordinate, CoordinateArray]:
+        if isinstance(index, (int, np.integer)):
+            return _coordinate_type(self.dimension)(self.axes[:, index].tolist())
+        return CoordinateArray.from_axes(*self.axes[:, index])
+
+    def __iter__(self) -> Iterator[Coordinate]:
+        coordinate_type = _coordinate_type(self.dimension)
+        return map(coordinate_type, self.axes.T.tolist())
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.to_numpy().tolist()})"
+
+    def to_numpy(self) -> np.ndarray:
+        """Coordinates as an array with shape (N, dimension)"""
+        return self.axes.T.copy()
+
+    def as_index(self) -> tuple[np.ndarray, ...]:
+        """Index into a numpy array with one axis per dimension, e.g.
+        grid[coordinates.as_index()] gives the value at every coordinate"""
+        return tuple(self.axes)
+
+    def _other_axes(self, other: Union[Sequence[int], CoordinateArray]) -> np.ndarray:
+        """Axes of the other operand, a single coordinate is broadcast to all
+        coordinates"""
+        if isinstance(other, CoordinateArray):
+            return other.axes
+        return np.asarray(other, dtype=np.int64).reshape(-1, 1)
+
+    def __add__(self, other: Union[Sequence[int], CoordinateArray]) -> CoordinateArray:
+        return CoordinateArray.from_axes(*(self.axes + self._other_axes(other)))
+
+    def __sub__(self, other: Union[Sequence[int], CoordinateArray]) -> CoordinateArray:
+        return CoordinateArray.from_axes(*(self.axes - self._other_axes(other)))
+
+    def manhattan_distance(
+        self, other: Union[Sequence[int], CoordinateArray]
+    ) -> np.ndarray:
+        """Manhattan distance of every coordinate to a single coordinate, or to
+        the coordinate at the same index of another CoordinateArray"""
+        return np.abs(self.axes - self._other_axes(other)).sum(axis=0)
+
+    def bounding_box(self) -> tuple[Coordinate, Coordinate]:
+        """Minimum and maximum coordinate of the space covered by the
+        coordinates"""
+        coordinate_type = _coordinate_type(self.dimension)
+        return (
+            coordinate_type(self.axes.min(axis=1).tolist()),
+            coordinate_type(self.axes.max(axis=1).tolist()),
+        )
+
+    def in_bounds(self, minimum: Sequence[int], maximum: Sequence[int]) -> np.ndarray:
+        """Boolean mask of the coordinates between minimum and maximum
+        (inclusive)"""
+        return (
+            (self.axes >= self._other_axes(minimum))
+            & (self.axes <= self._other_axes(maximum))
+        ).all(axis=0)
+
+    def neighbours(self, diagonal: bool = False) -> CoordinateArray:
+        """Neighbours of all coordinates. Without diagonal, only the
+        neighbours that share a face are included. The result holds the
+        neighbours for the first step for all coordinates, then for the second
+        step, etc."""
+        steps = np.array(
+            [
+                step
+                for step in itertools.product((-1, 0, 1), repeat=self.dimension)
+                if any(step) and (diagonal or sum(map(abs, step)) == 1)
+            ],
+            dtype=np.int64,
+        )
+        # Shape (dimension, steps, N), flattened to (dimension, steps * N)
+        neighbour_axes = self.axes[:, np.newaxis, :] + steps.T[:, :, np.newaxis]
+        return CoordinateArray.from_axes(
+            *neighbour_axes.reshape(self.dimension, -1)
+        )
+
+
+class Grid:
+    """Dense grid of small integer codes in a typed numpy array, uint8 by
+    default. Symbols in the puzzle input map to codes by their position in the
+    symbols string, see from_lines.
+
+    The array can be padded with a border of fill_value. Every cell inside the
+    grid then has all its neighbours in the array, so a neighbour is found by
+    adding a flat-index offset (see neighbour_offsets) to the flat index of the
+    cell, without any bounds checks. Flat indices refer to the padded array,
+    which is available as data (and flattened as flat). Indexing the Grid
+    itself uses coordinates inside the padding."""
+
+    def __init__(
+        self,
+        data: np.ndarray,
+        padding: int = 0,
+        fill_value: int = 0,
+        symbols: Optional[str] = None,
+        dtype: type = None,
+    ) -> None:
+        """Create a grid from an array of codes
+
+        Args:
+            data:           Array with the code of every cell
+            padding:        Width of the border added around the grid
+            fill_value:     Code of the cells in the border
+            symbols:        The symbol of every code, symbols[code]. Only
+                            needed to convert the grid back to text
+            dtype:          Type of the array, uint8 by default
+        """
+        data = np.array(data, dtype=dtype or np.uint8)
+        if padding:
+            data = pad_numpy_array(data, fill_value, pad_width=padding)
+        self.data = data
+        # Flat view on the padded data, changes are visible in both
+        self.flat = data.reshape(-1)
+        self.padding = padding
+        self.fill_value = fill_value
+        self.symbols = symbols
+        self.strides = tuple(stride // data.itemsize for stride in data.strides)
+
+    def __getstate__(self) -> dict[str, Any]:
+        # The flat view would be pickled as a separate copy of the data
+        state = self.__dict__.copy()
+        del state["flat"]
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self.flat = self.data.reshape(-1)
+
+    @classmethod
+    def from_shape(
+        cls,
+        shape: Sequence[int],
+        value: int = 0,
+        padding: int = 0,
+        fill_value: int = 0,
+        symbols: Optional[str] = None,
+        dtype: type = None,
+    ) -> Grid:
+        """Create a grid of the given shape (without padding) with all cells set
+        to value, and the cells in the padding set to fill_value"""
+        return cls(
+            np.full(shape, value, dtype=dtype or np.uint8),
+            padding,
+            fill_value,
+            symbols,
+            dtype,
+        )
+
+    @classmethod
+    def from_lines(
+        cls,
+        lines: Sequence[str],
+        symbols: str,
+        padding: int = 0,
+        fill_value: int = 0,
+        dtype: type = None,
+    ) -> Grid:
+        """Create a grid from lines of text. Every character is converted to
+        its index in symbols, e.g. with symbols ".#" a "." becomes 0 and a
+        "#" becomes 1. All lines must have the same length."""
+        if len({len(line) for line in lines}) > 1:
+            raise ValueError("All lines of the grid must have the same length")
+        # Lookup table from the character code to the symbol code, unknown
+        # characters are marked with -1
+        lookup = np.full(256, -1, dtype=np.int64)
+        lookup[np.frombuffer(symbols.encode("ascii"), dtype=np.uint8)] = np.arange(
+            len(symbols)
+        )
+        characters = np.frombuffer("".join(lines).encode("ascii"), dtype=np.uint8)
+        codes = lookup[characters]
+        if (codes < 0).any():
+            unknown = sorted(set("".join(lines)) - set(symbols))
+            raise ValueError(f"Symbols {unknown} are not in {symbols!r}")
+        return cls(
+            codes.reshape(len(lines), -1), padding, fill_value, symbols, dtype
+        )
+
+    @property
+    def shape(self) -> tuple[int, ...]:
+        """Shape of the grid without the padding"""
+        return tuple(size - 2 * self.padding for size in self.data.shape)
+
+    @property
+    def interior(self) -> np.ndarray:
+        """View on the grid without the padding"""
+        if not self.padding:
+            return self.data
+        return self.data[(slice(self.padding, -self.padding),) * self.data.ndim]
+
+    def __array__(self, dtype: type = None) -> np.ndarray:
+        return np.asarray(self.interior, dtype=dtype)
+
+    def __getitem__(self, index: Any) -> Any:
+        return self.interior[index]
+
+    def __setitem__(self, index: Any, value: Any) -> None:
+        self.interior[index] = value
+
+    def flat_index(self, coordinate: Sequence[int]) -> int:
+        """Flat index in the padded array of a coordinate in the grid"""
+        return sum(
+            (value + self.padding) * stride
+            for value, stride in zip(coordinate, self.strides)
+        )
+
+    def coordinate(self, flat_index: int) -> Coordinate:
+        """Coordinate in the grid of a flat index in the padded array"""
+        return _coordinate_type(self.data.ndim)(
+            [
+                int(value) - self.padding
+                for value in np.unravel_index(flat_index, self.data.shape)
+            ]
+        )
+
+    def neighbour_offsets(self, diagonal: bool = False) -> np.ndarray:
+        """Flat-index offsets to the neighbours of a cell. Without diagonal,
+        only the neighbours that share a face are included."""
+        return np.array(
+            [
+                sum(value * stride for value, stride in zip(step, self.strides))
+                for step in itertools.product((-1, 0, 1), repeat=self.data.ndim)
+                if any(step) and (diagonal or sum(map(abs, step)) == 1)
+            ],
+            dtype=np.int64,
+        )
+
+    def neighbours(
+        self, flat_indices: Union[int, np.ndarray], diagonal: bool = False
+    ) -> np.ndarray:
+        """Flat indices of the neighbours of the given cells, with one row
+        per cell. The cells must lie inside the padding, or their neighbours
+        can wrap around to the other side of the array."""
+        return np.asarray(flat_indices)[..., np.newaxis] + self.neighbour_offsets(
+            diagonal
+        )
+
+    def neighbour_values(
+        self, flat_indices: Union[int, np.ndarray], diagonal: bool = False
+    ) -> np.ndarray:
+        """Codes of the neighbours of the given cells, see neighbours"""
+        return self.flat[self.neighbours(flat_indices, diagonal)]
+
+    def find(self, code: int) -> np.ndarray:
+        """Flat indices of all cells with the given code"""
+        return np.flatnonzero(self.flat == code)
+
+    def to_lines(self) -> list[str]:
+        """Convert the grid (without padding) back to lines of symbols"""
+        if self.symbols is None:
+            raise ValueError("The grid has no symbols to convert the codes to")
+        lookup = np.frombuffer(self.symbols.encode("ascii"), dtype=np.uint8)
+        return [
+            lookup[row].tobytes().decode("ascii")
+            for row in np.asarray(self.interior, dtype=np.int64)
+        ]
 
 
 class Processor:
@@ -378,9 +1342,12 @@ def get_unvisited_neighbouring_coordinates(
     return next_locations
 
 
+@profiler.profile
 def flood_fill(
-    starting_location: Coordinate, is_valid_coordinate: Callable
-) -> set[Coordinate]:
+    starting_location: Coordinate,
+    is_valid_coordinate: Callable,
+    encoder: Optional[CoordinateEncoder] = None,
+) -> Union[set[Coordinate], PackedCoordinateSet]:
     """Flood fill an arbitrary space from the given starting_location. All
     points to be filled are identified as coordinates. Valid coordinates are
     checked by the custom function that is passed by is_valid_coordinates.
@@ -396,7 +1363,13 @@ def flood_fill(
                                 whether the coordinate is still in the valid
                                 region of space or if it has not hit an
                                 obstacle or edge.
+        encoder:                Optional CoordinateEncoder. When given, the
+                                fill keeps track of packed coordinates, which
+                                takes less memory, and returns a
+                                PackedCoordinateSet.
     """
+    if encoder is not None:
+        return _flood_fill_packed(starting_location, is_valid_coordinate, encoder)
     if not is_valid_coordinate(starting_location):
         print(f"Starting coordinate is not a valid coordinate")
         return set()
@@ -421,3 +1394,119 @@ def flood_fill(
         current_frontier = next_frontier
 
     return visited
+
+
+def _flood_fill_packed(
+    starting_location: Coordinate,
+    is_valid_coordinate: Callable,
+    encoder: CoordinateEncoder,
+) -> PackedCoordinateSet:
+    """flood_fill on packed coordinates. Coordinates are only unpacked to
+    check whether they are valid."""
+    if not is_valid_coordinate(starting_location):
+        print(f"Starting coordinate is not a valid coordinate")
+        return PackedCoordinateSet(encoder)
+    steps = encoder.neighbour_steps()
+    decode = encoder.decode
+    current_frontier = [encoder.encode(starting_location)]
+    visited = set(current_frontier)
+    while current_frontier:
+        next_frontier = []
+        for frontier_block in current_frontier:
+            for step in steps:
+                neighbour = frontier_block + step
+                if neighbour not in visited and is_valid_coordinate(
+                    decode(neighbour)
+                ):
+                    visited.add(neighbour)
+                    next_frontier.append(neighbour)
+        current_frontier = next_frontier
+
+    return PackedCoordinateSet.from_packed(encoder, visited)
+
+
+class SimulationResult(NamedTuple):
+    # Metric of the state after the requested number of steps
+    metric: Any
+    # Step at which the cycle starts and number of steps in the cycle, None if
+    # no cycle was found before reaching the requested number of steps
+    cycle_start: Optional[int]
+    cycle_length: Optional[int]
+
+
+def _combine_metrics(*terms: tuple[int, Any]) -> Any:
+    """Linear combination of metrics, sum(coefficient * metric). Metrics are
+    either numbers or sequences (list, tuple) of numbers of equal length."""
+    coefficients, metrics = zip(*terms)
+    if isinstance(metrics[0], (int, float)):
+        return sum(coefficient * metric for coefficient, metric in terms)
+    return type(metrics[0])(
+        sum(coefficient * value for coefficient, value in zip(coefficients, values))
+        for values in zip(*metrics)
+    )
+
+
+def simulate_with_cycle_detection(
+    state: Any,
+    step: Callable[[Any], Any],
+    fingerprint: Callable[[Any], Hashable],
+    metric: Callable[[Any], Any],
+    number_of_steps: int,
+) -> SimulationResult:
+    """Simulate number_of_steps steps, starting from the given state. As soon
+    as a state repeats, the simulation stops and the metric after
+    number_of_steps steps is extrapolated from the cycle. This makes very long
+    simulations O(start of the cycle + cycle length).
+
+    Cycles are found with a dict of state fingerprints. Only the fingerprint
+    and the metric of every step is kept, so a compact fingerprint keeps the
+    memory usage low.
+
+    The metric has to be additive: every pass through the cycle increases the
+    metric by the same amount, e.g. the height of a tower or the number of
+    items each monkey inspected.
+
+    Args:
+        state:              Initial state of the simulation
+        step:               Callable that takes a state and returns the state
+                            after one step. It is allowed to update the state
+                            in-place and return it.
+        fingerprint:        Callable that takes a state and returns a hashable
+                            value. States with the same fingerprint must behave
+                            identically in all following steps.
+        metric:             Callable that takes a state and returns the metric
+                            of that state, either a number or a sequence of
+                            numbers
+        number_of_steps:    Number of steps to simulate
+
+    Returns:
+        The metric after number_of_steps steps, and the start and length of the
+        cycle if one was found
+    """
+    # Step at which each fingerprint was seen first, and the metric of the
+    # state at the start of every step
+    seen_at_step: dict[Hashable, int] = {}
+    metrics = []
+    for step_idx in range(number_of_steps):
+        state_fingerprint = fingerprint(state)
+        current_metric = metric(state)
+        if state_fingerprint in seen_at_step:
+            cycle_start = seen_at_step[state_fingerprint]
+            cycle_length = step_idx - cycle_start
+            number_of_cycles, remaining_steps = divmod(
+                number_of_steps - step_idx, cycle_length
+            )
+            # Every cycle adds the increase of the metric over one cycle, the
+            # remaining steps add the increase over the start of the cycle
+            final_metric = _combine_metrics(
+                (1 + number_of_cycles, current_metric),
+                (-1 - number_of_cycles, metrics[cycle_start]),
+                (1, metrics[cycle_start + remaining_steps]),
+            )
+            return SimulationResult(final_metric, cycle_start, cycle_length)
+
+        seen_at_step[state_fingerprint] = step_idx
+        metrics.append(current_metric)
+        state = step(state)
+
+    return SimulationResult(metric(state), None, None)
@@ -0,0 +1,108 @@
+import argparse
+import subprocess
+import sys
+from pathlib import Path
+from typing import NamedTuple, Sequence
+
+import run_days
+
+DESCRIPTION = (
+    "Check the import time of the day modules against a budget, using the "
+    "output of python -X importtime"
+)
+CURRENT_DIRECTORY = Path(__file__).parent
+# Modules that take long to import, and should only be imported when used
+HEAVY_MODULES = ("aocd", "numpy", "anytree")
+
+
+class ImportTime(NamedTuple):
+    module: str
+    milliseconds: float
+    heavy_imports: list[str]
+
+
+def measure_import_time(module: str) -> dict[str, int]:
+    """Import the module in a fresh interpreter with -X importtime.
+
+    Returns:
+        Dict with the cumulative import time in microseconds of every module
+        that was imported while importing the given module, including the
+        module itself
+    """
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        cwd=CURRENT_DIRECTORY,
+        check=True,
+    )
+    # Lines are formatted as 'import time: <self> | <cumulative> | <module>',
+    # where nested imports are indented. Imports done at interpreter startup
+    # are part of the output as well, so only the import of the requested
+    # module and the imports nested under it are kept.
+    import_times = {}
+    lines = [
+        line.removeprefix("import time:").split("|")
+        for line in process.stderr.splitlines()
+        if line.startswith("import time:") and "[us]" not in line
+    ]
+    # Imports are listed after their nested imports, so walk backwards from the
+    # requested module and stop at the first import at the same level
+    for idx in range(len(lines) - 1, -1, -1):
+        if lines[idx][2].strip() == module:
+            break
+    else:
+        return import_times
+    module_indentation = len(lines[idx][2]) - len(lines[idx][2].lstrip())
+    import_times[module] = int(lines[idx][1])
+    for _, cumulative, name in reversed(lines[:idx]):
+        if len(name) - len(name.lstrip()) <= module_indentation:
+            break
+        import_times[name.strip()] = int(cumulative)
+    return import_times
+
+
+def check_import_budget(modules: Sequence[str]) -> list[ImportTime]:
+    """Measure the import time of the given modules, and which heavy modules
+    (see HEAVY_MODULES) are imported right away"""
+    results = []
+    for module in modules:
+        import_times = measure_import_time(module)
+        heavy_imports = [name for name in import_times if name in HEAVY_MODULES]
+        results.append(ImportTime(module, import_times[module] / 1000, heavy_imports))
+    return results
+
+
+if __name__ == "__main__":
+    arguments = argparse.ArgumentParser(description=DESCRIPTION)
+    arguments.add_argument(
+        "modules",
+        nargs="*",
+        help="Modules to check. If not supplied, all day modules are checked.",
+        metavar="MODULE",
+    )
+    arguments.add_argument(
+        "-b",
+        "--budget",
+        type=float,
+        default=100,
+        help="Maximum import time of each module in milliseconds.",
+    )
+    args = arguments.parse_args()
+
+    import_results = check_import_budget(
+        args.modules or list(run_days.discover_days().values())
+    )
+    over_budget = False
+    for result in import_results:
+        problems = []
+        if result.milliseconds > args.budget:
+            problems.append("over budget")
+        if result.heavy_imports:
+            problems.append(f"imports {', '.join(result.heavy_imports)}")
+        over_budget |= bool(problems)
+        print(
+            f"{result.module:<20} {result.milliseconds:8.1f} ms"
+            + (f"  <- {', '.join(problems)}" if problems else "")
+        )
+    sys.exit(1 if over_budget else 0)
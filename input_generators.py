@@ -0,0 +1,446 @@
+"""Generators for synthetic puzzle inputs. Every generator creates an input in
+the same format as the real puzzle input, so it can be used to stress the
+solutions with inputs that are much larger than the actual puzzle inputs.
+
+Each generator takes the input size as its first argument and a seed, so the
+same arguments always generate the same input. Additional keyword arguments
+tune the shape of the generated input. Like the inputs downloaded by aocd, the
+generated inputs have no trailing newline.
+"""
+import json
+import math
+import random
+import string
+from typing import Callable
+
+import numpy as np
+
+
+def generate_day1(
+    size: int, seed: int = 0, max_items: int = 15, max_calories: int = 70_000
+) -> str:
+    """Calorie inventories of size elves, each holding 1 to max_items foods"""
+    rng = random.Random(seed)
+    return "\n\n".join(
+        "\n".join(
+            str(rng.randint(1000, max_calories))
+            for _ in range(rng.randint(1, max_items))
+        )
+        for _ in range(size)
+    )
+
+
+def generate_day2(size: int, seed: int = 0) -> str:
+    """Strategy guide of size rock-paper-scissors rounds"""
+    rng = random.Random(seed)
+    return "\n".join(
+        f"{rng.choice('ABC')} {rng.choice('XYZ')}" for _ in range(size)
+    )
+
+
+def generate_day3(
+    size: int, seed: int = 0, min_items: int = 4, max_items: int = 24
+) -> str:
+    """Rucksacks of size groups of three elves. The compartments of each
+    rucksack have exactly one item in common, and the rucksacks of each group
+    have exactly one item (the badge) in common.
+
+    Args:
+        size:       Number of groups, the input contains 3 * size rucksacks
+        seed:       Seed of the random generator
+        min_items:  Minimum number of items in each compartment (at least 2)
+        max_items:  Maximum number of items in each compartment
+    """
+    if min_items < 2:
+        raise ValueError(
+            f"Each compartment holds at least the common item and the badge, "
+            f"so it contains at least 2 items. Got {min_items = }"
+        )
+    rng = random.Random(seed)
+    items = list(string.ascii_letters)
+    rucksacks = []
+    for _ in range(size):
+        rng.shuffle(items)
+        badge = items[0]
+        # Every rucksack of the group picks its items from a separate pool, so
+        # the badge is the only item the rucksacks share.
+        for pool in (items[1:18], items[18:35], items[35:52]):
+            common_item = pool[0]
+            compartment_items = rng.randint(min_items, max_items)
+            first = rng.choices(pool[1:9], k=compartment_items - 2) + [
+                common_item,
+                badge,
+            ]
+            second = rng.choices(pool[9:17], k=compartment_items - 1) + [common_item]
+            rng.shuffle(first)
+            rng.shuffle(second)
+            rucksacks.append("".join(first + second))
+    return "\n".join(rucksacks)
+
+
+def generate_day4(size: int, seed: int = 0, max_section: int = 99) -> str:
+    """Section assignments of size pairs of elves"""
+    rng = random.Random(seed)
+
+    def section_range() -> str:
+        start, end = sorted(rng.randint(1, max_section) for _ in range(2))
+        return f"{start}-{end}"
+
+    return "\n".join(f"{section_range()},{section_range()}" for _ in range(size))
+
+
+def generate_day5(
+    size: int, seed: int = 0, number_of_stacks: int = 9, max_height: int = 8
+) -> str:
+    """Drawing of the starting stacks and size rearrangement procedures. Every
+    procedure moves at most the number of crates on the source stack.
+
+    Args:
+        size:               Number of rearrangement procedures
+        seed:               Seed of the random generator
+        number_of_stacks:   Number of stacks, between 2 and 9
+        max_height:         Maximum height of the starting stacks
+    """
+    if not 2 <= number_of_stacks <= 9:
+        raise ValueError(
+            f"Number of stacks should be between 2 and 9, got {number_of_stacks}"
+        )
+    rng = random.Random(seed)
+    # All stacks contain at least one crate, stacks are listed bottom to top
+    stacks = [
+        rng.choices(string.ascii_uppercase, k=rng.randint(1, max_height))
+        for _ in range(number_of_stacks)
+    ]
+    height = max(len(stack) for stack in stacks)
+    drawing = [
+        " ".join(
+            f"[{stack[level]}]" if level < len(stack) else "   " for stack in stacks
+        )
+        for level in range(height - 1, -1, -1)
+    ]
+    drawing.append(" ".join(f" {idx} " for idx in range(1, number_of_stacks + 1)))
+
+    procedures = []
+    # Keep track of the stack heights, so every procedure can be executed
+    heights = [len(stack) for stack in stacks]
+    for _ in range(size):
+        source = rng.choice([idx for idx, height in enumerate(heights) if height])
+        target = rng.choice([idx for idx in range(number_of_stacks) if idx != source])
+        crates = rng.randint(1, heights[source])
+        heights[source] -= crates
+        heights[target] += crates
+        procedures.append(f"move {crates} from {source + 1} to {target + 1}")
+
+    return "\n".join(drawing) + "\n\n" + "\n".join(procedures)
+
+
+def generate_day6(size: int, seed: int = 0) -> str:
+    """Datastream of size characters followed by the start-of-message marker
+    (14 distinct characters), so the marker is only found at the end."""
+    rng = random.Random(seed)
+    letters = list(string.ascii_lowercase)
+    rng.shuffle(letters)
+    # With only 13 different letters, there cannot be 14 distinct characters
+    # in a row before the marker at the end
+    stream = rng.choices(letters[:13], k=size)
+    rng.shuffle(letters)
+    return "".join(stream + letters[:14])
+
+
+def generate_day7(
+    size: int,
+    seed: int = 0,
+    max_files: int = 5,
+    nesting: float = 0.5,
+    max_file_size: int = 300_000,
+) -> str:
+    """Terminal output of browsing a file system with size directories. Every
+    directory is listed once, the file system is browsed depth first.
+
+    Args:
+        size:           Number of directories, including the root directory
+        seed:           Seed of the random generator
+        max_files:      Maximum number of files in each directory
+        nesting:        Probability that a new directory is created inside the
+                        previously created directory. Higher values create
+                        deeper file systems.
+        max_file_size:  Maximum file size
+    """
+    rng = random.Random(seed)
+    children: list[list[int]] = [[]]
+    for directory in range(1, size):
+        if rng.random() < nesting:
+            parent = directory - 1
+        else:
+            parent = rng.randrange(directory)
+        children[parent].append(directory)
+        children.append([])
+
+    def random_name() -> str:
+        return "".join(rng.choices(string.ascii_lowercase, k=rng.randint(1, 8)))
+
+    # Directory numbers are added to the names to keep them unique
+    names = [f"{random_name()}{directory}" for directory in range(size)]
+
+    def list_directory(directory: int) -> list[str]:
+        files = [
+            f"{rng.randint(1, max_file_size)} {random_name()}{file_idx}.{random_name()[:3]}"
+            for file_idx in range(rng.randint(0, max_files))
+        ]
+        subdirectories = [f"dir {names[child]}" for child in children[directory]]
+        return ["$ ls"] + subdirectories + files
+
+    lines = ["$ cd /"] + list_directory(0)
+    # Browse depth first, without recursion so deep file systems are possible
+    stack = [iter(children[0])]
+    while stack:
+        directory = next(stack[-1], None)
+        if directory is None:
+            stack.pop()
+            if stack:
+                lines.append("$ cd ..")
+            continue
+        lines.append(f"$ cd {names[directory]}")
+        lines += list_directory(directory)
+        stack.append(iter(children[directory]))
+
+    return "\n".join(lines)
+
+
+def generate_day8(size: int, seed: int = 0, columns: int = None) -> str:
+    """Grid of tree heights with size rows and columns (size by default)"""
+    columns = columns or size
+    rng = np.random.default_rng(seed)
+    grid = np.full((size, columns + 1), ord("\n"), dtype=np.uint8)
+    grid[:, :-1] = rng.integers(ord("0"), ord("9") + 1, size=(size, columns))
+    return grid.tobytes()[:-1].decode("ascii")
+
+
+def generate_day9(size: int, seed: int = 0, max_steps: int = 20) -> str:
+    """Series of size motions of the head of the rope"""
+    rng = random.Random(seed)
+    return "\n".join(
+        f"{rng.choice('LURD')} {rng.randint(1, max_steps)}" for _ in range(size)
+    )
+
+
+def generate_day10(
+    size: int, seed: int = 0, noop_probability: float = 0.3, max_value: int = 20
+) -> str:
+    """Program of size instructions for the CPU of the communication device"""
+    rng = random.Random(seed)
+    return "\n".join(
+        "noop"
+        if rng.random() < noop_probability
+        else f"addx {rng.choice([-1, 1]) * rng.randint(1, max_value)}"
+        for _ in range(size)
+    )
+
+
+def _primes(number_of_primes: int) -> list[int]:
+    """Return the first number_of_primes prime numbers"""
+    primes = []
+    candidate = 2
+    while len(primes) < number_of_primes:
+        if all(candidate % prime for prime in primes if prime * prime <= candidate):
+            primes.append(candidate)
+        candidate += 1
+    return primes
+
+
+def generate_day11(
+    size: int, seed: int = 0, max_items: int = 8, max_worry_level: int = 99
+) -> str:
+    """Notes on size monkeys. Every monkey tests the worry level against a
+    different prime number, and throws to other monkeys only."""
+    if size < 2:
+        raise ValueError(f"At least two monkeys are needed, got {size}")
+    rng = random.Random(seed)
+    primes = _primes(size)
+    rng.shuffle(primes)
+    monkeys = []
+    for monkey, prime in enumerate(primes):
+        items = ", ".join(
+            str(rng.randint(1, max_worry_level))
+            for _ in range(rng.randint(1, max_items))
+        )
+        operation = rng.choice(
+            ["old * old", f"old * {rng.randint(2, 19)}", f"old + {rng.randint(1, 9)}"]
+        )
+        other_monkeys = [other for other in range(size) if other != monkey]
+        target_true, target_false = (
+            rng.sample(other_monkeys, 2) if size > 2 else other_monkeys * 2
+        )
+        monkeys.append(
+            f"Monkey {monkey}:\n"
+            f"  Starting items: {items}\n"
+            f"  Operation: new = {operation}\n"
+            f"  Test: divisible by {prime}\n"
+            f"    If true: throw to monkey {target_true}\n"
+            f"    If false: throw to monkey {target_false}"
+        )
+    return "\n\n".join(monkeys)
+
+
+def generate_day12(
+    size: int, seed: int = 0, columns: int = None, valley_probability: float = 0.05
+) -> str:
+    """Heightmap with size rows and columns (size by default). The height rises
+    steadily from the start (top left) to the end (bottom right), so there is
+    always a path. Random cells are lowered to the lowest elevation.
+
+    Args:
+        size:               Number of rows (and columns)
+        seed:               Seed of the random generator
+        columns:            Number of columns, defaults to size
+        valley_probability: Probability that a cell is lowered to elevation a
+    """
+    columns = columns or size
+    if size * columns < 2:
+        raise ValueError("The heightmap needs room for both the start and the end")
+    rng = random.Random(seed)
+    # Neighbouring cells differ at most 1 in height, and the end is at height z
+    stretch = max(1, (size + columns - 2) // 25)
+    lines = []
+    for row in range(size):
+        line = [
+            "a"
+            if rng.random() < valley_probability
+            else chr(ord("a") + min(25, (row + column) // stretch))
+            for column in range(columns)
+        ]
+        lines.append(line)
+    lines[0][0] = "S"
+    lines[-1][-1] = "E"
+    return "\n".join("".join(line) for line in lines)
+
+
+def _generate_packet(rng: random.Random, max_depth: int, max_length: int) -> list:
+    """Generate a random (nested) list of integers"""
+    return [
+        _generate_packet(rng, max_depth - 1, max_length)
+        if max_depth and rng.random() < 0.3
+        else rng.randint(0, 10)
+        for _ in range(rng.randint(0, max_length))
+    ]
+
+
+def generate_day13(
+    size: int, seed: int = 0, max_depth: int = 4, max_length: int = 5
+) -> str:
+    """Distress signal with size pairs of packets"""
+    rng = random.Random(seed)
+
+    def packet() -> str:
+        return json.dumps(
+            _generate_packet(rng, max_depth, max_length), separators=(",", ":")
+        )
+
+    return "\n\n".join(f"{packet()}\n{packet()}" for _ in range(size))
+
+
+def generate_day14(
+    size: int,
+    seed: int = 0,
+    width: int = 25,
+    depth: int = 50,
+    max_points: int = 6,
+    max_length: int = 10,
+) -> str:
+    """Scan of size rock paths below the sand source at 500,0
+
+    Args:
+        size:           Number of rock paths
+        seed:           Seed of the random generator
+        width:          Rock paths lie within width columns left and right of
+                        the sand source
+        depth:          Depth of the deepest possible rock
+        max_points:     Maximum number of points in each rock path
+        max_length:     Maximum length of each line in a rock path
+    """
+    rng = random.Random(seed)
+    paths = []
+    for _ in range(size):
+        x = rng.randint(500 - width, 500 + width)
+        y = rng.randint(1, depth)
+        points = [(x, y)]
+        for point_idx in range(rng.randint(1, max_points - 1)):
+            # Rock paths alternate between horizontal and vertical lines
+            step = rng.choice([-1, 1]) * rng.randint(1, max_length)
+            if point_idx % 2:
+                y = min(max(y + step, 1), depth)
+            else:
+                x = min(max(x + step, 500 - width), 500 + width)
+            points.append((x, y))
+        paths.append(" -> ".join(f"{x},{y}" for x, y in points))
+    return "\n".join(paths)
+
+
+def generate_day15(
+    size: int,
+    seed: int = 0,
+    coordinate_range: int = 4_000_000,
+    max_distance: int = 1_000_000,
+) -> str:
+    """Report of size sensors and the beacon closest to each sensor
+
+    Args:
+        size:               Number of sensors
+        seed:               Seed of the random generator
+        coordinate_range:   Sensors are located in
+                            [-coordinate_range, coordinate_range] on both axes
+        max_distance:       Maximum manhattan distance between a sensor and its
+                            closest beacon
+    """
+    rng = random.Random(seed)
+    lines = []
+    for _ in range(size):
+        sensor_x = rng.randint(-coordinate_range, coordinate_range)
+        sensor_y = rng.randint(-coordinate_range, coordinate_range)
+        distance = rng.randint(1, max_distance)
+        x_offset = rng.randint(-distance, distance)
+        y_offset = rng.choice([-1, 1]) * (distance - abs(x_offset))
+        lines.append(
+            f"Sensor at x={sensor_x}, y={sensor_y}: closest beacon is at "
+            f"x={sensor_x + x_offset}, y={sensor_y + y_offset}"
+        )
+    return "\n".join(lines)
+
+
+def generate_day17(size: int, seed: int = 0) -> str:
+    """Jet pattern of size jets"""
+    rng = random.Random(seed)
+    return "".join(rng.choices("<>", k=size))
+
+
+def generate_day18(size: int, seed: int = 0, density: float = 0.3) -> str:
+    """Scan of size distinct lava cubes. The cubes fill a cube shaped region
+    with the given density, so lower densities spread the cubes out more."""
+    rng = random.Random(seed)
+    extent = max(1, math.ceil((size / density) ** (1 / 3)))
+    cubes = rng.sample(range(extent**3), k=size)
+    return "\n".join(
+        f"{cube // extent**2},{cube // extent % extent},{cube % extent}"
+        for cube in cubes
+    )
+
+
+GENERATORS: dict[int, Callable[..., str]] = {
+    1: generate_day1,
+    2: generate_day2,
+    3: generate_day3,
+    4: generate_day4,
+    5: generate_day5,
+    6: generate_day6,
+    7: generate_day7,
+    8: generate_day8,
+    9: generate_day9,
+    10: generate_day10,
+    11: generate_day11,
+    12: generate_day12,
+    13: generate_day13,
+    14: generate_day14,
+    15: generate_day15,
+    17: generate_day17,
+    18: generate_day18,
+}
@@ -0,0 +1,403 @@
+"""Hierarchical span profiler. A span is a named, timed section of code, spans
+that start while another span is running are recorded as children of that
+span. For every call path the profiler keeps the number of calls, and the
+cumulative and self time (cumulative time minus the time spent in child
+spans). All times are measured with time.perf_counter_ns.
+
+The profiler is disabled by default, so instrumented hot paths only pay for a
+single check when nobody is profiling. Typical use:
+```python
+import profiler
+
+@profiler.profile
+def solve(data): ...
+
+profiler.enable()
+with profiler.span("solve all"):
+    solve(data)
+profiler.disable()
+print(profiler.report())
+profiler.export_chrome_trace("trace.json")
+```
+The trace can be opened in chrome://tracing or https://ui.perfetto.dev. The
+profiler keeps a single stack of running spans, so it should only be used from
+a single thread.
+
+Memory usage is measured separately with measure_memory, because tracing the
+memory allocations slows down the code considerably:
+```python
+with profiler.measure_memory(count_instances=[Coordinate]) as memory_report:
+    solve(data)
+print(memory_report.format())
+```
+"""
+import contextlib
+import json
+import os
+import threading
+import time
+import tracemalloc
+from functools import wraps
+from pathlib import Path
+from typing import Callable, Iterator, NamedTuple, Optional, Sequence
+
+# Call path of a span: the names of all running spans, outermost first
+SpanPath = tuple[str, ...]
+
+
+class SpanStats:
+    """Aggregated timings of all calls of a span on a specific call path"""
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.cumulative_ns = 0
+        self.self_ns = 0
+
+    def __repr__(self) -> str:
+        return (
+            f"SpanStats(calls={self.calls}, cumulative_ns={self.cumulative_ns}, "
+            f"self_ns={self.self_ns})"
+        )
+
+
+class Profiler:
+    def __init__(self) -> None:
+        self.enabled = False
+        # Record every single span for the trace export
+        self.trace = True
+        self.stats: dict[SpanPath, SpanStats] = {}
+        # Finished spans as (name, start in ns, duration in ns, process id)
+        self.events: list[tuple[str, int, int, int]] = []
+        # Running spans as [path, start in ns, time spent in children in ns]
+        self._stack: list[list] = []
+
+    def enable(self, trace: bool = True) -> None:
+        """Start recording spans. Set trace to False to only keep the
+        aggregated statistics, which saves memory for very hot spans."""
+        self.enabled = True
+        self.trace = trace
+
+    def disable(self) -> None:
+        """Stop recording spans, the recorded spans are kept"""
+        self.enabled = False
+
+    def reset(self) -> None:
+        """Remove all recorded spans"""
+        self.stats = {}
+        self.events = []
+        self._stack = []
+
+    def start_span(self, name: str) -> None:
+        """Start a span as a child of the currently running span"""
+        path = self._stack[-1][0] + (name,) if self._stack else (name,)
+        self._stack.append([path, time.perf_counter_ns(), 0])
+
+    def stop_span(self) -> None:
+        """Stop the most recently started span and record its timings"""
+        end_time = time.perf_counter_ns()
+        path, start_time, children_ns = self._stack.pop()
+        duration = end_time - start_time
+        if path not in self.stats:
+            self.stats[path] = SpanStats()
+        stats = self.stats[path]
+        stats.calls += 1
+        stats.cumulative_ns += duration
+        stats.self_ns += duration - children_ns
+        if self._stack:
+            self._stack[-1][2] += duration
+        if self.trace:
+            self.events.append((path[-1], start_time, duration, os.getpid()))
+
+    @contextlib.contextmanager
+    def span(self, name: str) -> Iterator[None]:
+        """Context manager recording the enclosed code as a span"""
+        if not self.enabled:
+            yield
+            return
+        self.start_span(name)
+        try:
+            yield
+        finally:
+            self.stop_span()
+
+    def profile(
+        self, func: Optional[Callable] = None, *, name: Optional[str] = None
+    ) -> Callable:
+        """Decorator recording every call of the function as a span. Can be
+        used both as @profile and as @profile(name="custom name"). By default,
+        the span is named after the qualified name of the function."""
+        if func is None:
+            return lambda func: self.profile(func, name=name)
+        span_name = name or func.__qualname__
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if not self.enabled:
+                return func(*args, **kwargs)
+            self.start_span(span_name)
+            try:
+                return func(*args, **kwargs)
+            finally:
+                self.stop_span()
+
+        return wrapper
+
+    def flat_stats(self) -> dict[str, SpanStats]:
+        """Statistics per span name, regardless of the call path. For recursive
+        spans, the cumulative time only counts the outermost call."""
+        flat = {}
+        for path, stats in self.stats.items():
+            name = path[-1]
+            if name not in flat:
+                flat[name] = SpanStats()
+            flat[name].calls += stats.calls
+            flat[name].self_ns += stats.self_ns
+            if name not in path[:-1]:
+                flat[name].cumulative_ns += stats.cumulative_ns
+        return flat
+
+    def report(self) -> str:
+        """Table with the statistics of every call path. Child spans are
+        indented under their parent and sorted by cumulative time."""
+        children: dict[SpanPath, list[SpanPath]] = {}
+        for path in self.stats:
+            children.setdefault(path[:-1], []).append(path)
+
+        rows = []
+        paths_to_visit = sorted(
+            children.get((), []), key=lambda path: self.stats[path].cumulative_ns
+        )
+        while paths_to_visit:
+            path = paths_to_visit.pop()
+            stats = self.stats[path]
+            rows.append(
+                [
+                    "  " * (len(path) - 1) + path[-1],
+                    str(stats.calls),
+                    f"{stats.cumulative_ns / 1e6:.3f}",
+                    f"{stats.self_ns / 1e6:.3f}",
+                ]
+            )
+            paths_to_visit += sorted(
+                children.get(path, []), key=lambda path: self.stats[path].cumulative_ns
+            )
+
+        header = ["Span", "Calls", "Cumulative (ms)", "Self (ms)"]
+        widths = [
+            max(len(row[column]) for row in rows + [header])
+            for column in range(len(header))
+        ]
+        lines = [
+            " | ".join(
+                cell.ljust(width) if column == 0 else cell.rjust(width)
+                for column, (cell, width) in enumerate(zip(row, widths))
+            )
+            for row in [header] + rows
+        ]
+        lines.insert(1, "-+-".join("-" * width for width in widths))
+        return "\n".join(lines)
+
+    def chrome_trace(self) -> dict:
+        """The recorded spans in the Chrome trace event format"""
+        return {
+            "traceEvents": [
+                {
+                    "name": name,
+                    "ph": "X",
+                    "ts": start_time / 1000,
+                    "dur": duration / 1000,
+                    "pid": pid,
+                    "tid": 0,
+                }
+                for name, start_time, duration, pid in self.events
+            ],
+            "displayTimeUnit": "ms",
+        }
+
+    def export_chrome_trace(self, path: Path) -> None:
+        """Write the recorded spans as Chrome trace event JSON file"""
+        with open(path, "w") as f:
+            json.dump(self.chrome_trace(), f)
+
+
+# Profiler used by the module level functions, so instrumentation in different
+# modules ends up in the same profile
+PROFILER = Profiler()
+
+enable = PROFILER.enable
+disable = PROFILER.disable
+reset = PROFILER.reset
+span = PROFILER.span
+profile = PROFILER.profile
+flat_stats = PROFILER.flat_stats
+report = PROFILER.report
+export_chrome_trace = PROFILER.export_chrome_trace
+
+
+class AllocationSite(NamedTuple):
+    location: str
+    size_bytes: int
+    count: int
+
+
+class InstanceCount(NamedTuple):
+    created: int
+    peak_live: int
+
+
+class MemoryReport:
+    """Memory usage of a block of code, filled in by measure_memory"""
+
+    def __init__(self) -> None:
+        # Highest traced memory during the block, on top of the memory that
+        # was already in use when the block started
+        self.peak_bytes = 0
+        # Largest allocation sites close to the peak memory usage. The traced
+        # memory is sampled every 10 ms, so for short blocks these are the
+        # allocations that are still alive at the end of the block.
+        self.top_allocations: list[AllocationSite] = []
+        # Instance counts per class name
+        self.instances: dict[str, InstanceCount] = {}
+
+    def format(self) -> str:
+        """Human readable summary of the memory usage"""
+        lines = [f"Peak memory: {self.peak_bytes / 1024:.1f} KiB"]
+        for class_name, (created, peak_live) in self.instances.items():
+            lines.append(
+                f"{class_name} instances: {created} created, {peak_live} alive at "
+                f"the same time"
+            )
+        if self.top_allocations:
+            lines.append("Top allocation sites:")
+            lines += [
+                f"  {site.location}: {site.size_bytes / 1024:.1f} KiB in "
+                f"{site.count} blocks"
+                for site in self.top_allocations
+            ]
+        return "\n".join(lines)
+
+
+class _PeakSnapshotSampler(threading.Thread):
+    """Background thread taking a tracemalloc snapshot whenever the traced
+    memory grew by more than 10% since the previous snapshot. This keeps the
+    number of snapshots small, while the last snapshot shows the allocations
+    close to the peak memory usage."""
+
+    def __init__(self, interval: float = 0.01) -> None:
+        super().__init__(daemon=True)
+        self.interval = interval
+        self.snapshot: Optional[tracemalloc.Snapshot] = None
+        self.snapshot_size = 0
+        self._stop_event = threading.Event()
+
+    def take_snapshot_if_grown(self) -> None:
+        """Take a snapshot when the traced memory exceeds the last snapshot"""
+        current_size, _ = tracemalloc.get_traced_memory()
+        if current_size > 1.1 * self.snapshot_size:
+            self.snapshot = tracemalloc.take_snapshot()
+            self.snapshot_size = current_size
+
+    def run(self) -> None:
+        while not self._stop_event.wait(self.interval):
+            self.take_snapshot_if_grown()
+
+    def stop(self) -> None:
+        self._stop_event.set()
+        self.join()
+        self.take_snapshot_if_grown()
+
+
+@contextlib.contextmanager
+def _count_instances(
+    classes: Sequence[type], counts: dict[str, InstanceCount]
+) -> Iterator[None]:
+    """Count the instances of the given classes created inside the block, and
+    the peak number of those instances alive at the same time. Instances that
+    were created before the block, but freed inside it, lower the number of
+    live instances as well. The counting replaces __new__ and __del__ of the
+    classes for the duration of the block."""
+    patched_classes = []
+    for cls in classes:
+        # Number of created instances, live instances and peak live instances
+        counter = [0, 0, 0]
+        original_new = cls.__new__
+        original_del = getattr(cls, "__del__", None)
+
+        def counting_new(*args, _counter=counter, _new=original_new, **kwargs):
+            _counter[0] += 1
+            _counter[1] += 1
+            _counter[2] = max(_counter[2], _counter[1])
+            return _new(*args, **kwargs)
+
+        def counting_del(self, _counter=counter, _del=original_del):
+            _counter[1] = max(_counter[1] - 1, 0)
+            if _del is not None:
+                _del(self)
+
+        patched_classes.append(
+            (cls, counter, cls.__dict__.get("__new__"), cls.__dict__.get("__del__"))
+        )
+        cls.__new__ = staticmethod(counting_new)
+        cls.__del__ = counting_del
+    try:
+        yield
+    finally:
+        for cls, counter, original_new, original_del in patched_classes:
+            counts[cls.__name__] = InstanceCount(counter[0], counter[2])
+            for attribute, original in [
+                ("__new__", original_new),
+                ("__del__", original_del),
+            ]:
+                if original is None:
+                    delattr(cls, attribute)
+                else:
+                    setattr(cls, attribute, original)
+
+
+@contextlib.contextmanager
+def measure_memory(
+    count_instances: Sequence[type] = (), top: int = 5
+) -> Iterator[MemoryReport]:
+    """Measure the memory usage of the enclosed code with tracemalloc. The
+    report is filled in when the block exits.
+
+    Args:
+        count_instances:    Classes of which the number of instances is
+                            counted, e.g. helper_functions.Coordinate
+        top:                Number of allocation sites to report
+    """
+    report = MemoryReport()
+    was_tracing = tracemalloc.is_tracing()
+    if not was_tracing:
+        tracemalloc.start()
+    tracemalloc.reset_peak()
+    baseline, _ = tracemalloc.get_traced_memory()
+    sampler = _PeakSnapshotSampler()
+    sampler.start()
+    try:
+        with _count_instances(count_instances, report.instances):
+            yield report
+    finally:
+        _, peak = tracemalloc.get_traced_memory()
+        sampler.stop()
+        if not was_tracing:
+            tracemalloc.stop()
+        report.peak_bytes = peak - baseline
+        snapshot = sampler.snapshot.filter_traces(
+            [
+                tracemalloc.Filter(False, __file__),
+                tracemalloc.Filter(False, tracemalloc.__file__),
+                tracemalloc.Filter(False, threading.__file__),
+                tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+                tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+                tracemalloc.Filter(False, "<unknown>"),
+            ]
+        )
+        report.top_allocations = [
+            AllocationSite(
+                f"{statistic.traceback[0].filename}:{statistic.traceback[0].lineno}",
+                statistic.size,
+                statistic.count,
+            )
+            for statistic in snapshot.statistics("lineno")[:top]
+        ]
@@ -0,0 +1,497 @@
+import argparse
+import concurrent.futures
+import contextlib
+import importlib
+import io
+import json
+import os
+import time
+from pathlib import Path
+from typing import Any, Callable, NamedTuple, Optional, Sequence
+
+import helper_functions
+import profiler
+
+DESCRIPTION = "Advent of code runner, solves the selected days in parallel"
+CURRENT_DIRECTORY = Path(__file__).parent
+# Answers of earlier runs, see run_days
+ANSWER_STORE_FILE = CURRENT_DIRECTORY / ".answer_store" / "answers.json"
+# Classes whose instances are counted in memory mode
+COORDINATE_CLASSES = (
+    helper_functions.Coordinate,
+    helper_functions.Coordinate2,
+    helper_functions.Coordinate3,
+)
+
+
+class PartResult(NamedTuple):
+    day: int
+    part: str
+    answer: Any
+    wall_time: float
+    error: Optional[str] = None
+
+
+def discover_days(root: Path = CURRENT_DIRECTORY) -> dict[int, str]:
+    """Find all the day modules in the repository. Every puzzle lives in its
+    own directory dayXX, containing the solver module dayX.py.
+
+    Returns:
+        Dict with the puzzle day as key and the importable module name (e.g.
+        'day07.day7') as value, sorted by day
+    """
+    days = {}
+    for day_directory in sorted(root.glob("day[0-9][0-9]")):
+        day = int(day_directory.name[3:])
+        if (day_directory / f"day{day}.py").exists():
+            days[day] = f"{day_directory.name}.day{day}"
+    return days
+
+
+def solve_part(
+    day: int,
+    part: str,
+    load_test_data: bool = False,
+    show_output: bool = False,
+    cache_parsing: bool = False,
+) -> PartResult:
+    """Solve a single part of a single day. This is the unit of work that is
+    sent to the worker processes. Exceptions are caught and reported in the
+    result, so one failing day doesn't stop the full run.
+
+    Args:
+        day:            Puzzle day to solve
+        part:           "a" or "b"
+        load_test_data: Set to True to solve the local test input instead of
+                        the full input
+        show_output:    Set to True to let the day module print to stdout.
+                        By default, the output is suppressed, as the output of
+                        parallel runs would be interleaved.
+        cache_parsing:  Set to True to reuse parsed inputs from earlier runs.
+                        See helper_functions.cache_parsed_input.
+    """
+    helper_functions.enable_parse_cache(cache_parsing)
+    output = (
+        contextlib.nullcontext()
+        if show_output
+        else contextlib.redirect_stdout(io.StringIO())
+    )
+    answer, error = None, None
+    start_time = time.perf_counter()
+    try:
+        with output:
+            module = importlib.import_module(f"day{day:0>2}.day{day}")
+            start_time = time.perf_counter()
+            answer = module.main(
+                part, should_submit=False, load_test_data=load_test_data
+            )[part]
+    except Exception as exception:
+        error = f"{type(exception).__name__}: {exception}"
+    wall_time = time.perf_counter() - start_time
+
+    return PartResult(day, part, answer, wall_time, error)
+
+
+def get_answer_key(day: int, part: str, load_test_data: bool = False) -> str:
+    """Key of an answer in the answer store. The answer of a part only changes
+    when the input or the code changes, so the key combines the day and part
+    with the hash of the input and the hash of the source code of the day
+    module and helper_functions.
+
+    Raises:
+        Exception:  If the day module cannot be imported or the input cannot be
+                    found
+    """
+    module = importlib.import_module(f"day{day:0>2}.day{day}")
+    input_hash = helper_functions.get_input_hash(day, load_test_data)
+    source_hash = helper_functions.get_source_hash(module, helper_functions)
+    return f"{day}/{part}/{input_hash}/{source_hash}"
+
+
+def load_answers(answer_store: Path) -> dict[str, Any]:
+    """Load all answers from the answer store, keyed by get_answer_key"""
+    if not answer_store.exists():
+        return {}
+    with open(answer_store) as f:
+        return json.load(f)
+
+
+def store_answers(answers: dict[str, Any], answer_store: Path) -> None:
+    """Write the answers to the answer store. The store is replaced in one go,
+    so an interrupted run cannot leave a corrupt store behind."""
+    answer_store.parent.mkdir(parents=True, exist_ok=True)
+    temporary_file = answer_store.with_suffix(f".{os.getpid()}.tmp")
+    with open(temporary_file, "w") as f:
+        json.dump(answers, f, indent=4, sort_keys=True)
+    os.replace(temporary_file, answer_store)
+
+
+def run_days(
+    days: Sequence[int],
+    parts: str = "ab",
+    load_test_data: bool = False,
+    max_workers: Optional[int] = None,
+    show_output: bool = False,
+    cache_parsing: bool = False,
+    answer_store: Optional[Path] = None,
+) -> list[PartResult]:
+    """Solve the selected parts of the selected days. Every (day, part)
+    combination is solved in a separate task of a process pool, so a full run
+    can use all available cores.
+
+    With an answer store, parts that were solved before with the same input and
+    the same code are not solved again, their stored answer is returned right
+    away. The answers of newly solved parts are added to the store. The wall
+    time of a stored answer is the time it took to look it up.
+
+    Args:
+        days:           Puzzle days to solve
+        parts:          "a", "b", or "ab". Execute the chosen parts
+        load_test_data: Set to True to solve the local test inputs
+        max_workers:    Number of worker processes. By default, one per core.
+        show_output:    Let the day modules print to stdout
+        cache_parsing:  Reuse parsed inputs from earlier runs
+        answer_store:   Path to the JSON file storing the answers of earlier
+                        runs, e.g. ANSWER_STORE_FILE. By default, no answers
+                        are stored.
+
+    Returns:
+        The result of each solved part, sorted by day and part
+    """
+    _check_parts(parts)
+    tasks = [(day, part) for day in days for part in parts]
+
+    stored_results = []
+    answer_keys = {}
+    if answer_store is not None:
+        answers = load_answers(answer_store)
+        tasks_to_solve = []
+        for day, part in tasks:
+            start_time = time.perf_counter()
+            try:
+                answer_key = get_answer_key(day, part, load_test_data)
+            except Exception:
+                # Leave reporting the problem to the solver
+                tasks_to_solve.append((day, part))
+                continue
+            if answer_key in answers:
+                stored_results.append(
+                    PartResult(
+                        day, part, answers[answer_key], time.perf_counter() - start_time
+                    )
+                )
+            else:
+                answer_keys[(day, part)] = answer_key
+                tasks_to_solve.append((day, part))
+        tasks = tasks_to_solve
+
+    results = _run_in_pool(
+        solve_part,
+        tasks,
+        max_workers,
+        load_test_data,
+        show_output,
+        cache_parsing,
+    )
+
+    if answer_store is not None:
+        new_answers = {}
+        for result in results:
+            answer = _to_json(result.answer)
+            if result.error is None and answer is not None:
+                new_answers[answer_keys[(result.day, result.part)]] = answer
+        if new_answers:
+            store_answers(answers | new_answers, answer_store)
+
+    return sorted(
+        stored_results + results, key=lambda result: (result.day, result.part)
+    )
+
+
+def _to_json(answer: Any) -> Any:
+    """Convert the answer to a JSON serializable value. Numpy scalars are
+    converted to the equivalent Python type. Returns None for answers that
+    cannot be stored as JSON."""
+    if hasattr(answer, "item"):
+        answer = answer.item()
+    try:
+        json.dumps(answer)
+    except (TypeError, ValueError):
+        return None
+    return answer
+
+
+def measure_part_memory(
+    day: int, part: str, load_test_data: bool = False, show_output: bool = False
+) -> tuple[PartResult, profiler.MemoryReport]:
+    """Solve a single part like solve_part, while measuring the memory usage
+    with profiler.measure_memory. The day module is imported before the
+    measurement starts, so the report only contains the memory used for
+    parsing and solving. The number of Coordinate instances is counted, see
+    COORDINATE_CLASSES."""
+    with contextlib.suppress(Exception):
+        # Import errors are reported by solve_part
+        importlib.import_module(f"day{day:0>2}.day{day}")
+    with profiler.measure_memory(
+        count_instances=COORDINATE_CLASSES
+    ) as memory_report:
+        result = solve_part(day, part, load_test_data, show_output)
+    return result, memory_report
+
+
+def run_days_with_memory(
+    days: Sequence[int],
+    parts: str = "ab",
+    load_test_data: bool = False,
+    max_workers: Optional[int] = None,
+    show_output: bool = False,
+) -> list[tuple[PartResult, profiler.MemoryReport]]:
+    """Solve the selected parts of the selected days like run_days, and
+    measure the memory usage of every part. Tracing the memory allocations
+    slows down the solutions, so the wall times are higher than in regular
+    runs. Parsed inputs are never taken from the cache, as that would hide the
+    memory used for parsing.
+
+    Returns:
+        The result and memory report of each solved part, sorted by day and
+        part
+    """
+    _check_parts(parts)
+    return _run_in_pool(
+        measure_part_memory,
+        [(day, part) for day in days for part in parts],
+        max_workers,
+        load_test_data,
+        show_output,
+    )
+
+
+def _check_parts(parts: str) -> None:
+    """Raise a ValueError when parts contains anything else than 'a' or 'b'"""
+    for part in parts:
+        if part not in "ab":
+            raise ValueError(f"Wrong part chosen, expecting 'a' or 'b': got {part}")
+
+
+def _run_in_pool(
+    task: Callable,
+    tasks: Sequence[tuple[int, str]],
+    max_workers: Optional[int],
+    *task_arguments: Any,
+) -> list:
+    """Run task(day, part, *task_arguments) for every (day, part) combination
+    in tasks in a process pool, and return the outcomes sorted by day and
+    part"""
+    if not tasks:
+        return []
+    with concurrent.futures.ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            executor.submit(task, day, part, *task_arguments) for day, part in tasks
+        ]
+        outcomes = [future.result() for future in futures]
+
+    return [outcome for _, outcome in sorted(zip(tasks, outcomes), key=lambda x: x[0])]
+
+
+def profile_days(
+    days: Sequence[int],
+    parts: str = "ab",
+    load_test_data: bool = False,
+    show_output: bool = False,
+) -> list[PartResult]:
+    """Solve the selected parts of the selected days one after another in this
+    process, with the profiler enabled. Every part is recorded as a span, with
+    the spans of the instrumented functions as children. The recorded spans
+    remain available through the profiler module, e.g. profiler.report().
+
+    Args:
+        days:           Puzzle days to solve
+        parts:          "a", "b", or "ab". Execute the chosen parts
+        load_test_data: Set to True to solve the local test inputs
+        show_output:    Let the day modules print to stdout
+
+    Returns:
+        The result of each solved part, sorted by day and part
+    """
+    _check_parts(parts)
+
+    profiler.reset()
+    profiler.enable()
+    results = []
+    try:
+        for day in days:
+            for part in parts:
+                with profiler.span(f"day {day} part {part}"):
+                    results.append(
+                        solve_part(day, part, load_test_data, show_output)
+                    )
+    finally:
+        profiler.disable()
+    return results
+
+
+def count_coordinates(memory_report: profiler.MemoryReport) -> tuple[int, int]:
+    """Total number of created instances and peak live instances of all
+    COORDINATE_CLASSES in a memory report. The peaks of the classes are
+    added, which is an upper bound of the combined peak. The results of
+    Coordinate2 and Coordinate3 arithmetic skip __new__, and are not counted.
+    """
+    created, peak_live = 0, 0
+    for cls in COORDINATE_CLASSES:
+        counts = memory_report.instances.get(cls.__name__, (0, 0))
+        created += counts[0]
+        peak_live += counts[1]
+    return created, peak_live
+
+
+def format_results(
+    results: Sequence[PartResult],
+    memory_reports: Optional[Sequence[profiler.MemoryReport]] = None,
+) -> str:
+    """Format the results of a run as a table with one row per solved part.
+    When memory reports are given, the peak memory and the number of
+    Coordinate instances of every part are added as columns."""
+    header = ("Day", "Part", "Answer", "Time (s)")
+    rows = [
+        (
+            str(result.day),
+            result.part,
+            str(result.answer) if result.error is None else f"ERROR {result.error}",
+            f"{result.wall_time:.4f}",
+        )
+        for result in results
+    ]
+    if memory_reports is not None:
+        header += ("Peak memory (KiB)", "Coordinates (created/peak)")
+        rows = [
+            row
+            + (
+                f"{memory_report.peak_bytes / 1024:.1f}",
+                "{}/{}".format(*count_coordinates(memory_report)),
+            )
+            for row, memory_report in zip(rows, memory_reports)
+        ]
+    column_widths = [
+        max(len(row[column]) for row in [header] + rows)
+        for column in range(len(header))
+    ]
+
+    def format_row(row: Sequence[str]) -> str:
+        return " | ".join(
+            cell.ljust(width) for cell, width in zip(row, column_widths)
+        ).rstrip()
+
+    separator = "-+-".join("-" * width for width in column_widths)
+    return "\n".join([format_row(header), separator] + list(map(format_row, rows)))
+
+
+if __name__ == "__main__":
+    available_days = discover_days()
+
+    arguments = argparse.ArgumentParser(description=DESCRIPTION)
+    arguments.add_argument(
+        "days",
+        type=int,
+        nargs="*",
+        help="Select the days to solve. If not supplied, all days are solved.",
+        metavar="PUZZLE_DAY",
+    )
+    arguments.add_argument(
+        "-p",
+        "--parts",
+        default="ab",
+        choices=["a", "b", "ab"],
+        help="Select the parts to solve for each day.",
+    )
+    arguments.add_argument(
+        "-t",
+        "--test-data",
+        action="store_true",
+        help="Solve the local test inputs (inputX.1) instead of the full inputs.",
+    )
+    arguments.add_argument(
+        "-w",
+        "--workers",
+        type=int,
+        default=None,
+        help="Number of worker processes. Defaults to the number of cores.",
+    )
+    arguments.add_argument(
+        "-v",
+        "--verbose",
+        action="store_true",
+        help="Show the output printed by the day modules.",
+    )
+    arguments.add_argument(
+        "-c",
+        "--cache-parsing",
+        action="store_true",
+        help="Cache parsed inputs on disk and reuse them in later runs.",
+    )
+    arguments.add_argument(
+        "-f",
+        "--force",
+        action="store_true",
+        help="Solve every part, also when the answer store contains an answer "
+        "for the same input and code.",
+    )
+    arguments.add_argument(
+        "-m",
+        "--memory",
+        action="store_true",
+        help="Measure the peak memory, the top allocation sites and the number "
+        "of Coordinate instances of every part. Slows down the solutions.",
+    )
+    arguments.add_argument(
+        "--profile",
+        type=Path,
+        default=None,
+        help="Solve the days one after another with the profiler enabled. "
+        "Prints the profile and writes a Chrome trace to the given file.",
+        metavar="TRACE_FILE",
+    )
+    args = arguments.parse_args()
+    if unknown_days := set(args.days) - set(available_days):
+        arguments.error(
+            f"no solution available for day(s) {sorted(unknown_days)}, choose "
+            f"from {list(available_days)}"
+        )
+
+    start = time.perf_counter()
+    memory_reports = None
+    if args.profile:
+        run_results = profile_days(
+            args.days or list(available_days),
+            parts=args.parts,
+            load_test_data=args.test_data,
+            show_output=args.verbose,
+        )
+    elif args.memory:
+        run_results, memory_reports = zip(
+            *run_days_with_memory(
+                args.days or list(available_days),
+                parts=args.parts,
+                load_test_data=args.test_data,
+                max_workers=args.workers,
+                show_output=args.verbose,
+            )
+        )
+    else:
+        run_results = run_days(
+            args.days or list(available_days),
+            parts=args.parts,
+            load_test_data=args.test_data,
+            max_workers=args.workers,
+            show_output=args.verbose,
+            cache_parsing=args.cache_parsing,
+            answer_store=None if args.force else ANSWER_STORE_FILE,
+        )
+    print(format_results(run_results, memory_reports))
+    if memory_reports:
+        for result, memory_report in zip(run_results, memory_reports):
+            print(f"\nDay {result.day} part {result.part}\n{memory_report.format()}")
+    if args.profile:
+        print(f"\n{profiler.report()}")
+        profiler.export_chrome_trace(args.profile)
+        print(f"\nChrome trace written to {args.profile}")
+    print(f"\nTotal wall time: {time.perf_counter() - start:.4f} seconds")
@@ -49,14 +49,13 @@ if __name__ == "__main__":
     template_code = textwrap.dedent(
         f"""\
     import re
-    
-    from aocd import get_data, submit
-    import numpy as np
+    from typing import Any
     
     import helper_functions
     from helper_functions import Coordinate
     
     
+    @helper_functions.cache_parsed_input(day={target_day})
     def parse_data(load_test_data: bool = False):
         \"\"\"Parser function to parse today's data
         
@@ -64,12 +63,7 @@ if __name__ == "__main__":
             load_test_data:     Set to true to load test data from the local 
                                 directory
         \"\"\"
-        if load_test_data:
-            with open("input{target_day}.1", "r") as f:
-                # For loading example or test data
-                data = f.read()
-        else:
-            data = get_data(day={target_day}, year=2022)
+        data = helper_functions.load_input(day={target_day}, load_test_data=load_test_data)
         # lines = data.splitlines()
         # grid = np.array(helper_functions.digits_to_int(data.splitlines()))
         # numbers = [int(x) for x in re.findall("(-?\d+)", data)]
@@ -92,7 +86,7 @@ if __name__ == "__main__":
         return answer
         
     
-    def main(parts: str, should_submit: bool = False, load_test_data: bool = False) -> None:
+    def main(parts: str, should_submit: bool = False, load_test_data: bool = False) -> dict[str, Any]:
         \"\"\"Main function for solving the selected part(s) of today's puzzle
         and automatically submitting the answer. 
         
@@ -102,9 +96,14 @@ if __name__ == "__main__":
             load_test_data: Set to True if you want to load test data instead of
                             the full input. By default, this will load the file 
                             called 'input{target_day}.1'
+        
+        Returns:
+            Dict with the answer of each executed part, keyed by the part
+            ("a" or "b")
         \"\"\"
         data = parse_data(load_test_data=load_test_data)
         
+        answers = {{}}
         for part in parts:
             if part == "a":
                 aocd_result = part1(data)
@@ -112,9 +111,12 @@ if __name__ == "__main__":
                 aocd_result = part2(data)
             else:
                 raise ValueError(f"Wrong part chosen, expecting 'a' or 'b': got {{part}}")
+            answers[part] = aocd_result
     
             if should_submit:
-                submit(aocd_result, part=part, day={target_day}, year=2022)
+                helper_functions.submit(aocd_result, part=part, day={target_day}, year=2022)
+        
+        return answers
         
         
     if __name__ == "__main__":
@@ -0,0 +1,55 @@
+# Unit testing
+"""
+@author: Tobias Van Damme
+"""
+import unittest
+
+import benchmark
+import helper_functions
+
+
+class TestBenchmark(unittest.TestCase):
+    """Test class to test functions in benchmark"""
+
+    def setUp(self):
+        """Setup the tests"""
+        pass
+
+    def tearDown(self):
+        """Clean up"""
+        pass
+
+    def test_percentile(self):
+        """Test benchmark.percentile"""
+        values = [float(value) for value in range(100, 0, -1)]
+        assert benchmark.percentile(values, 50) == 50
+        assert benchmark.percentile(values, 95) == 95
+        assert benchmark.percentile(values, 100) == 100
+        assert benchmark.percentile([3.0], 95) == 3
+
+    def test_benchmark_day(self):
+        """Test benchmark.benchmark_day"""
+        results = benchmark.benchmark_day(4, sizes=[1, 2], repeats=2)
+        assert [(result["size"], result["part"]) for result in results] == [
+            (1, "parse"),
+            (1, "a"),
+            (1, "b"),
+            (2, "parse"),
+            (2, "a"),
+            (2, "b"),
+        ]
+        for result in results:
+            assert result["repeats"] == 2
+            assert 0 < result["median_seconds"] <= result["p95_seconds"]
+            assert result["peak_memory_bytes"] > 0
+        assert results[3]["input_bytes"] > results[0]["input_bytes"]
+
+        # The default input store is selected again after the benchmark
+        assert (
+            helper_functions._input_store_directory
+            == helper_functions.INPUT_STORE_DIRECTORY
+        )
+
+
+if __name__ == "__main__":
+    unittest.main(module="test_benchmark")
@@ -2,12 +2,16 @@
 """
 @author: Tobias Van Damme
 """
+import hashlib
 import itertools
 import math
+import pickle
+import tempfile
 import unittest
 import json
 from pathlib import Path
 from typing import Callable
+from unittest import mock
 
 import numpy as np
 
@@ -185,6 +189,43 @@ class TestHelperFunctions(unittest.TestCase):
         # Test manhattan distance
         assert coordinate1.manhattan_distance(coordinate2) == 4
 
+    def test_fixed_dimension_coordinates(self):
+        """Test helper_functions.Coordinate2 and helper_functions.Coordinate3
+        against the generic Coordinate"""
+        for cls, dimension in [
+            (helper_functions.Coordinate2, 2),
+            (helper_functions.Coordinate3, 3),
+        ]:
+            offsets = list(itertools.product([-2, -1, 0, 1, 2], repeat=dimension))
+            start = tuple(range(1, dimension + 1))
+            coordinate = cls(start)
+            assert coordinate == cls(*start) == Coordinate(start) == start
+            assert hash(coordinate) == hash(start)
+            assert isinstance(coordinate, Coordinate)
+            for offset in offsets:
+                other = Coordinate(start) + offset
+                assert type(coordinate + offset) is cls
+                assert coordinate + offset == other
+                assert coordinate - offset == Coordinate(start) - offset
+                assert (coordinate > other) == (Coordinate(start) > other)
+                assert (coordinate < other) == (Coordinate(start) < other)
+                assert (coordinate >= other) == (Coordinate(start) >= other)
+                assert (coordinate <= other) == (Coordinate(start) <= other)
+                assert coordinate.distance(other) == math.dist(start, other)
+                assert coordinate.manhattan_distance(other) == sum(
+                    abs(value) for value in offset
+                )
+                for overlap, diagonal in itertools.product([True, False], repeat=2):
+                    assert coordinate.is_touching(
+                        other, overlap, diagonal
+                    ) == Coordinate(start).is_touching(other, overlap, diagonal)
+
+            assert cls.create_origin() == (0,) * dimension
+            with self.assertRaises(ValueError):
+                cls.create_origin(dimension + 1)
+            with self.assertRaises(ValueError):
+                cls(range(dimension + 1))
+
     def test_get_sign(self):
         """Test helper_functions.get_sign"""
         assert helper_functions.get_sign(-5) == -1
@@ -275,16 +316,19 @@ class TestHelperFunctions(unittest.TestCase):
             is_valid_coordinate: Callable,
             expected_coordinates: list[Coordinate],
         ) -> None:
-            """Do test in the given space with the given valid coordinate checker"""
-            filled_coordinate = helper_functions.flood_fill(
-                space_limits[0], is_valid_coordinate
-            )
-            assert len(filled_coordinate) == len(expected_coordinates), (
-                f"Number of filled coordinates: {len(filled_coordinate)}, "
-                f"number of expected coordinates: {len(expected_coordinates)}"
-            )
-            for coordinate in expected_coordinates:
-                assert coordinate in filled_coordinate
+            """Do test in the given space with the given valid coordinate
+            checker, with and without packing the coordinates"""
+            encoder = helper_functions.CoordinateEncoder(len(space_limits[0]))
+            for coordinate_encoder in [None, encoder]:
+                filled_coordinate = helper_functions.flood_fill(
+                    space_limits[0], is_valid_coordinate, encoder=coordinate_encoder
+                )
+                assert len(filled_coordinate) == len(expected_coordinates), (
+                    f"Number of filled coordinates: {len(filled_coordinate)}, "
+                    f"number of expected coordinates: {len(expected_coordinates)}"
+                )
+                for coordinate in expected_coordinates:
+                    assert coordinate in filled_coordinate
 
         # 3D full space
         def accept_full_space(coordinate: Coordinate) -> bool:
@@ -326,6 +370,293 @@ class TestHelperFunctions(unittest.TestCase):
             expected_coordinates=expected_coordinates,
         )
 
+    def test_coordinate_encoder(self):
+        """Test helper_functions.CoordinateEncoder"""
+        for dimension in range(1, 5):
+            encoder = helper_functions.CoordinateEncoder(dimension)
+            coordinates = list(itertools.product([-3, 0, 7], repeat=dimension))
+            packed = [encoder.encode(coordinate) for coordinate in coordinates]
+            assert [encoder.decode(value) for value in packed] == coordinates
+            # Packed values sort like the coordinates
+            assert packed == sorted(packed)
+            assert all(0 <= value < 2**60 for value in packed)
+
+            # Moving a packed coordinate
+            step = tuple(range(-1, dimension - 1))
+            assert encoder.decode(packed[0] + encoder.step(step)) == Coordinate(
+                coordinates[0]
+            ) + step
+            neighbours = {
+                encoder.decode(packed[0] + neighbour_step)
+                for neighbour_step in encoder.neighbour_steps()
+            }
+            assert len(neighbours) == 2 * dimension
+            assert all(
+                Coordinate(coordinates[0]).is_touching(neighbour, diagonal=False)
+                for neighbour in neighbours
+            )
+            assert len(encoder.neighbour_steps(diagonal=True)) == 3**dimension - 1
+
+            # Arrays
+            packed_array = encoder.encode_array(np.array(coordinates))
+            assert packed_array.dtype == np.int64
+            assert packed_array.tolist() == packed
+            np.testing.assert_array_equal(
+                encoder.decode_array(packed_array), np.array(coordinates)
+            )
+
+        encoder = helper_functions.CoordinateEncoder(2, bits=4)
+        assert encoder.decode(encoder.encode((-8, 7))) == (-8, 7)
+        with self.assertRaises(ValueError):
+            encoder.encode_array(np.array([[8, 0]]))
+        with self.assertRaises(ValueError):
+            encoder.step((1, 0, 0))
+        with self.assertRaises(ValueError):
+            helper_functions.CoordinateEncoder(0)
+
+    def test_packed_coordinate_containers(self):
+        """Test helper_functions.PackedCoordinateSet and
+        helper_functions.PackedCoordinateDict"""
+        encoder = helper_functions.CoordinateEncoder(3)
+        coordinates = [(1, 2, 3), (-1, 0, 4), (1, 2, 3)]
+        coordinate_set = helper_functions.PackedCoordinateSet(encoder, coordinates)
+        assert coordinate_set == set(coordinates)
+        assert len(coordinate_set) == 2
+        assert (1, 2, 3) in coordinate_set
+        assert Coordinate(-1, 0, 4) in coordinate_set
+        assert (0, 0, 0) not in coordinate_set
+        coordinate_set.add((0, 0, 0))
+        coordinate_set.discard((1, 2, 3))
+        assert coordinate_set == {(0, 0, 0), (-1, 0, 4)}
+        assert coordinate_set.packed == {
+            encoder.encode((0, 0, 0)),
+            encoder.encode((-1, 0, 4)),
+        }
+        from_packed = helper_functions.PackedCoordinateSet.from_packed(
+            encoder, coordinate_set.packed
+        )
+        assert from_packed == coordinate_set
+        # The cache of parsed input pickles the sets
+        assert pickle.loads(pickle.dumps(coordinate_set)) == coordinate_set
+
+        counts = helper_functions.PackedCoordinateDict(encoder, default_factory=int)
+        for coordinate in coordinates:
+            counts[coordinate] += 1
+        assert dict(counts) == {(1, 2, 3): 2, (-1, 0, 4): 1}
+        del counts[(1, 2, 3)]
+        assert list(counts) == [(-1, 0, 4)]
+        assert counts.get((1, 2, 3)) is None
+
+        values = helper_functions.PackedCoordinateDict(encoder)
+        with self.assertRaises(KeyError):
+            values[(1, 2, 3)]
+        with self.assertRaises(KeyError):
+            del values[(1, 2, 3)]
+
+    def test_coordinate_array(self):
+        """Test helper_functions.CoordinateArray"""
+        coordinates = helper_functions.CoordinateArray([(1, 2), (3, 4), (5, -6)])
+        assert len(coordinates) == 3
+        assert coordinates.dimension == 2
+        assert coordinates[0] == (1, 2)
+        assert type(coordinates[0]) is helper_functions.Coordinate2
+        assert list(coordinates[1:]) == [(3, 4), (5, -6)]
+        np.testing.assert_array_equal(
+            coordinates.to_numpy(), np.array([[1, 2], [3, 4], [5, -6]])
+        )
+
+        # Arithmetic with a single coordinate and with another array
+        assert list(coordinates + (1, -1)) == [(2, 1), (4, 3), (6, -7)]
+        assert list(coordinates - coordinates[::-1]) == [(-4, 8), (0, 0), (4, -8)]
+        assert coordinates.manhattan_distance((0, 0)).tolist() == [3, 7, 11]
+        assert coordinates.manhattan_distance(coordinates[::-1]).tolist() == [
+            12,
+            0,
+            12,
+        ]
+
+        assert coordinates.bounding_box() == ((1, -6), (5, 4))
+        mask = coordinates.in_bounds((0, 0), (4, 4))
+        assert mask.tolist() == [True, True, False]
+        assert list(coordinates[mask]) == [(1, 2), (3, 4)]
+
+        grid = np.arange(20).reshape(4, 5)
+        assert grid[coordinates[:2].as_index()].tolist() == [7, 19]
+
+        # Neighbours are grouped per step
+        neighbours = helper_functions.CoordinateArray([(0, 0, 0)]).neighbours()
+        assert set(neighbours) == {
+            (-1, 0, 0),
+            (1, 0, 0),
+            (0, -1, 0),
+            (0, 1, 0),
+            (0, 0, -1),
+            (0, 0, 1),
+        }
+        neighbours = coordinates.neighbours(diagonal=True)
+        assert len(neighbours) == 8 * len(coordinates)
+        assert list(neighbours[: len(coordinates)]) == list(coordinates - (1, 1))
+
+        # Same coordinates and order as full_space
+        for start, end in [((0, 0), (2, 3)), ((-1, 0, 2), (1, 1, 3))]:
+            assert list(
+                helper_functions.CoordinateArray.full_space(start, end)
+            ) == helper_functions.full_space(start, end)
+        with self.assertRaises(ValueError):
+            helper_functions.CoordinateArray.full_space((0, 0), (1, 1, 1))
+        with self.assertRaises(ValueError):
+            helper_functions.CoordinateArray([1, 2, 3])
+
+    def test_lazy_import(self):
+        """Test helper_functions.lazy_import"""
+        # Modules that are already imported are returned as is
+        assert helper_functions.lazy_import("json") is json
+
+        with mock.patch.dict("sys.modules"):
+            import sys
+
+            sys.modules.pop("colorsys", None)
+            colorsys = helper_functions.lazy_import("colorsys")
+            assert sys.modules["colorsys"] is colorsys
+            assert colorsys.rgb_to_hsv(1.0, 0.0, 0.0) == (0.0, 1.0, 1.0)
+
+        with self.assertRaises(ModuleNotFoundError):
+            helper_functions.lazy_import("not_an_existing_module")
+
+    def test_submit(self):
+        """Test helper_functions.submit"""
+        with mock.patch("aocd.submit") as aocd_submit:
+            helper_functions.submit(24000, part="a", day=1)
+        aocd_submit.assert_called_once_with(24000, part="a", day=1, year=2022)
+
+    def test_simulate_with_cycle_detection(self):
+        """Test helper_functions.simulate_with_cycle_detection"""
+
+        # The position follows 0, 1, 2, 3, 4, 2, 3, 4, ... and the metric is
+        # the sum of all positions visited so far
+        def step(state):
+            position, total = state
+            next_position = position + 1 if position < 4 else 2
+            return next_position, total + next_position
+
+        def simulate(number_of_steps):
+            return helper_functions.simulate_with_cycle_detection(
+                (0, 0),
+                step=step,
+                fingerprint=lambda state: state[0],
+                metric=lambda state: state[1],
+                number_of_steps=number_of_steps,
+            )
+
+        for number_of_steps in range(20):
+            state = (0, 0)
+            for _ in range(number_of_steps):
+                state = step(state)
+            assert simulate(number_of_steps).metric == state[1], number_of_steps
+        assert simulate(3) == (6, None, None)
+        assert simulate(10**12) == (3 * 10**12 - 2, 2, 3)
+
+        # Metrics can also be sequences of numbers
+        result = helper_functions.simulate_with_cycle_detection(
+            0,
+            step=lambda state: state + 1,
+            fingerprint=lambda state: state % 2,
+            metric=lambda state: (state, 2 * state),
+            number_of_steps=10**12,
+        )
+        assert result == ((10**12, 2 * 10**12), 0, 2)
+
+    def test_load_input(self):
+        """Test helper_functions.load_input"""
+        puzzle_input = "1000\n2000\n\n3000\n"
+        with tempfile.TemporaryDirectory() as store_directory:
+            store_directory = Path(store_directory)
+            input_hash = helper_functions.store_input(
+                puzzle_input, day=1, store_directory=store_directory
+            )
+            assert input_hash == hashlib.sha256(puzzle_input.encode()).hexdigest()
+            assert (store_directory / "objects" / input_hash).exists()
+
+            # Stored inputs are loaded without fetching them with aocd
+            with mock.patch.object(helper_functions, "_fetch_input") as fetch_input:
+                assert (
+                    helper_functions.load_input(1, store_directory=store_directory)
+                    == puzzle_input
+                )
+                assert (
+                    helper_functions.get_input_hash(1, store_directory=store_directory)
+                    == input_hash
+                )
+                fetch_input.assert_not_called()
+
+            # Missing inputs are fetched once and added to the store
+            with mock.patch.object(
+                helper_functions, "_fetch_input", return_value="fetched"
+            ) as fetch_input:
+                for _ in range(2):
+                    assert (
+                        helper_functions.load_input(2, store_directory=store_directory)
+                        == "fetched"
+                    )
+                fetch_input.assert_called_once_with(2, helper_functions.YEAR)
+
+            # The store used by default can be changed
+            helper_functions.set_input_store(store_directory)
+            try:
+                assert helper_functions.load_input(1) == puzzle_input
+            finally:
+                helper_functions.set_input_store()
+
+            # An empty input can be stored and loaded as well
+            helper_functions.store_input("", day=3, store_directory=store_directory)
+            assert helper_functions.load_input(3, store_directory=store_directory) == ""
+
+        # Test data is loaded from the directory of the given day
+        test_data = helper_functions.load_input(4, load_test_data=True)
+        assert test_data.startswith("2-4,6-8")
+        assert (
+            helper_functions.get_input_hash(4, load_test_data=True)
+            == hashlib.sha256(test_data.encode()).hexdigest()
+        )
+
+    def test_cache_parsed_input(self):
+        """Test helper_functions.cache_parsed_input"""
+        parser_calls = []
+
+        @helper_functions.cache_parsed_input()
+        def parse_numbers(data: str) -> list[int]:
+            parser_calls.append(data)
+            return [int(number) for number in data.split(",")]
+
+        @helper_functions.cache_parsed_input(day=4)
+        def parse_day4(load_test_data: bool = False) -> str:
+            parser_calls.append(load_test_data)
+            return helper_functions.load_input(4, load_test_data=load_test_data)
+
+        with tempfile.TemporaryDirectory() as cache_directory:
+            with mock.patch.object(
+                helper_functions, "PARSE_CACHE_DIRECTORY", Path(cache_directory)
+            ):
+                # The cache is disabled by default
+                assert parse_numbers("1,2") == [1, 2]
+                assert parse_numbers("1,2") == [1, 2]
+                assert len(parser_calls) == 2
+
+                helper_functions.enable_parse_cache()
+                try:
+                    parser_calls.clear()
+                    assert parse_numbers("1,2") == [1, 2]
+                    assert parse_numbers("1,2") == [1, 2]
+                    assert parse_numbers("3,4") == [3, 4]
+                    assert parser_calls == ["1,2", "3,4"]
+
+                    parser_calls.clear()
+                    for _ in range(2):
+                        assert parse_day4(load_test_data=True).startswith("2-4")
+                    assert parser_calls == [True]
+                finally:
+                    helper_functions.enable_parse_cache(False)
+
 
 if __name__ == "__main__":
     unittest.main(module="test_helper_functions")
@@ -0,0 +1,44 @@
+# Unit testing
+"""
+@author: Tobias Van Damme
+"""
+import unittest
+
+import import_budget
+import run_days
+
+
+class TestImportBudget(unittest.TestCase):
+    """Test class to test functions in import_budget"""
+
+    def setUp(self):
+        """Setup the tests"""
+        pass
+
+    def tearDown(self):
+        """Clean up"""
+        pass
+
+    def test_measure_import_time(self):
+        """Test import_budget.measure_import_time"""
+        import_times = import_budget.measure_import_time("day01.day1")
+        assert list(import_times)[0] == "day01.day1"
+        assert "helper_functions" in import_times
+        assert import_times["day01.day1"] >= import_times["helper_functions"] > 0
+        # Modules imported at interpreter startup are not included
+        assert "site" not in import_times
+
+        assert import_budget.measure_import_time("json")["json"] > 0
+
+    def test_no_heavy_imports(self):
+        """Test that the day modules do not import heavy modules right away"""
+        day_modules = list(run_days.discover_days().values())
+        results = import_budget.check_import_budget(day_modules)
+        assert [result.module for result in results] == day_modules
+        for result in results:
+            assert result.heavy_imports == [], result
+            assert result.milliseconds > 0
+
+
+if __name__ == "__main__":
+    unittest.main(module="test_import_budget")
@@ -0,0 +1,96 @@
+# Unit testing
+"""
+@author: Tobias Van Damme
+"""
+import contextlib
+import importlib
+import io
+import tempfile
+import unittest
+from pathlib import Path
+
+import helper_functions
+import input_generators
+
+
+def solve_generated_input(day: int, puzzle_input: str) -> tuple:
+    """Solve both parts of the given day for the generated input"""
+    module = importlib.import_module(f"day{day:0>2}.day{day}")
+    with tempfile.TemporaryDirectory() as store_directory:
+        helper_functions.set_input_store(Path(store_directory))
+        try:
+            helper_functions.store_input(puzzle_input, day)
+            data = module.parse_data()
+            with contextlib.redirect_stdout(io.StringIO()):
+                return module.part1(data), module.part2(data)
+        finally:
+            helper_functions.set_input_store()
+
+
+class TestInputGenerators(unittest.TestCase):
+    """Test class to test functions in input_generators"""
+
+    def setUp(self):
+        """Setup the tests"""
+        pass
+
+    def tearDown(self):
+        """Clean up"""
+        pass
+
+    def test_generators(self):
+        """Test that every generator creates a deterministic input that the
+        solution of the day can solve"""
+        for day, generator in input_generators.GENERATORS.items():
+            with self.subTest(day=day):
+                puzzle_input = generator(5, seed=1)
+                assert puzzle_input == generator(5, seed=1)
+                assert puzzle_input != generator(5, seed=2)
+                assert not puzzle_input.endswith("\n")
+                if day == 14:
+                    # Keep the cavern small, the solution is slow
+                    puzzle_input = generator(5, seed=1, depth=10)
+                solve_generated_input(day, puzzle_input)
+
+    def test_generate_day3(self):
+        """Test input_generators.generate_day3"""
+        rucksacks = input_generators.generate_day3(10, seed=3).splitlines()
+        assert len(rucksacks) == 30
+        for rucksack in rucksacks:
+            half = len(rucksack) // 2
+            assert len(set(rucksack[:half]) & set(rucksack[half:])) == 1
+        for group_idx in range(0, 30, 3):
+            group = [set(rucksack) for rucksack in rucksacks[group_idx : group_idx + 3]]
+            assert len(set.intersection(*group)) == 1
+
+    def test_generate_day5(self):
+        """Test input_generators.generate_day5"""
+        puzzle_input = input_generators.generate_day5(20, number_of_stacks=4)
+        drawing, procedures = puzzle_input.split("\n\n")
+        assert len({len(line) for line in drawing.splitlines()}) == 1
+        assert drawing.splitlines()[-1] == " 1   2   3   4 "
+        assert len(procedures.splitlines()) == 20
+
+        with self.assertRaises(ValueError):
+            input_generators.generate_day5(20, number_of_stacks=10)
+
+    def test_generate_day6(self):
+        """Test input_generators.generate_day6"""
+        _, answer_b = solve_generated_input(6, input_generators.generate_day6(100))
+        assert answer_b == 114
+
+    def test_generate_day12(self):
+        """Test input_generators.generate_day12"""
+        puzzle_input = input_generators.generate_day12(
+            30, columns=40, valley_probability=0
+        )
+        lines = puzzle_input.splitlines()
+        assert len(lines) == 30
+        assert all(len(line) == 40 for line in lines)
+        # Without valleys, the shortest path goes straight down the slope
+        answer_a, _ = solve_generated_input(12, puzzle_input)
+        assert answer_a == 29 + 39
+
+
+if __name__ == "__main__":
+    unittest.main(module="test_input_generators")
@@ -0,0 +1,144 @@
+# Unit testing
+"""
+@author: Tobias Van Damme
+"""
+import json
+import tempfile
+import time
+import unittest
+from pathlib import Path
+
+import profiler
+from helper_functions import Coordinate
+
+
+class TestProfiler(unittest.TestCase):
+    """Test class to test functions in profiler"""
+
+    def setUp(self):
+        """Setup the tests"""
+        self.profiler = profiler.Profiler()
+        self.profiler.enable()
+
+    def tearDown(self):
+        """Clean up"""
+        pass
+
+    def test_nested_spans(self):
+        """Test the call counts and timings of nested spans"""
+
+        @self.profiler.profile(name="inner")
+        def inner():
+            time.sleep(0.001)
+
+        @self.profiler.profile(name="outer")
+        def outer():
+            inner()
+            inner()
+
+        with self.profiler.span("run"):
+            outer()
+            outer()
+
+        stats = self.profiler.stats
+        assert list(stats) == [
+            ("run", "outer", "inner"),
+            ("run", "outer"),
+            ("run",),
+        ]
+        inner_stats = stats[("run", "outer", "inner")]
+        assert inner_stats.calls == 4
+        assert inner_stats.cumulative_ns == inner_stats.self_ns >= 4_000_000
+        outer_stats = stats[("run", "outer")]
+        assert outer_stats.calls == 2
+        assert (
+            outer_stats.self_ns
+            == outer_stats.cumulative_ns - inner_stats.cumulative_ns
+        )
+        assert stats[("run",)].cumulative_ns >= outer_stats.cumulative_ns
+
+        report = self.profiler.report().splitlines()
+        assert report[2].startswith("run ")
+        assert report[3].startswith("  outer ")
+        assert report[4].startswith("    inner ")
+
+    def test_recursive_spans(self):
+        """Test profiler.Profiler.flat_stats on a recursive function"""
+
+        @self.profiler.profile(name="countdown")
+        def countdown(number):
+            if number:
+                countdown(number - 1)
+
+        countdown(3)
+        assert len(self.profiler.stats) == 4
+        flat_stats = self.profiler.flat_stats()["countdown"]
+        assert flat_stats.calls == 4
+        outermost = self.profiler.stats[("countdown",)]
+        assert flat_stats.cumulative_ns == outermost.cumulative_ns
+        assert flat_stats.self_ns == outermost.cumulative_ns
+
+    def test_disabled(self):
+        """Test that nothing is recorded while the profiler is disabled"""
+        self.profiler.disable()
+
+        def increment(number):
+            return number + 1
+
+        function = self.profiler.profile(increment)
+        with self.profiler.span("disabled"):
+            assert function(1) == 2
+        assert self.profiler.stats == {}
+        assert self.profiler.events == []
+
+        self.profiler.enable(trace=False)
+        assert function(1) == 2
+        assert list(self.profiler.stats) == [
+            ("TestProfiler.test_disabled.<locals>.increment",)
+        ]
+        assert self.profiler.events == []
+
+        self.profiler.reset()
+        assert self.profiler.stats == {}
+
+    def test_export_chrome_trace(self):
+        """Test profiler.Profiler.export_chrome_trace"""
+        with self.profiler.span("outer"):
+            with self.profiler.span("inner"):
+                pass
+
+        with tempfile.TemporaryDirectory() as directory:
+            trace_file = Path(directory) / "trace.json"
+            self.profiler.export_chrome_trace(trace_file)
+            with open(trace_file) as f:
+                trace = json.load(f)
+
+        inner, outer = trace["traceEvents"]
+        assert (inner["name"], outer["name"]) == ("inner", "outer")
+        assert inner["ph"] == outer["ph"] == "X"
+        assert outer["ts"] <= inner["ts"]
+        assert inner["ts"] + inner["dur"] <= outer["ts"] + outer["dur"]
+
+    def test_measure_memory(self):
+        """Test profiler.measure_memory"""
+        with profiler.measure_memory(count_instances=[Coordinate]) as report:
+            coordinates = [Coordinate(x, 0) + Coordinate(0, 1) for x in range(1000)]
+            # Keep a large allocation alive for a while, so the sampler sees it
+            large_list = [0] * 1_000_000
+            time.sleep(0.05)
+            del large_list
+
+        assert report.peak_bytes >= 8_000_000
+        assert report.instances["Coordinate"] == (3000, 1002)
+        assert "test_profiler.py" in report.top_allocations[0].location
+        assert report.top_allocations[0].size_bytes >= 8_000_000
+        assert "Coordinate instances: 3000 created" in report.format()
+
+        # The instance counting is removed after the measurement
+        assert "__del__" not in Coordinate.__dict__
+        assert Coordinate(1, 2) == (1, 2)
+        assert len(coordinates) == 1000
+
+
+if __name__ == "__main__":
+    unittest.main(module="test_profiler")
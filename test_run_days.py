@@ -0,0 +1,134 @@
+# Unit testing
+"""
+@author: Tobias Van Damme
+"""
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+import numpy as np
+
+import profiler
+import run_days
+
+
+TEST_FOLDER = Path(__file__).parent
+
+
+class TestRunDays(unittest.TestCase):
+    """Test class to test functions in run_days"""
+
+    def setUp(self):
+        """Setup the tests"""
+        pass
+
+    def tearDown(self):
+        """Clean up"""
+        pass
+
+    def test_discover_days(self):
+        """Test run_days.discover_days"""
+        days = run_days.discover_days(TEST_FOLDER)
+        assert days[1] == "day01.day1"
+        assert days[18] == "day18.day18"
+        assert list(days) == sorted(days)
+
+    def test_run_days(self):
+        """Test run_days.run_days"""
+        results = run_days.run_days([4, 6], parts="ab", load_test_data=True)
+        answers = {(result.day, result.part): result.answer for result in results}
+        assert answers == {(4, "a"): 2, (4, "b"): 4, (6, "a"): 11, (6, "b"): 26}
+        assert all(result.error is None for result in results)
+
+        with self.assertRaises(ValueError):
+            run_days.run_days([4], parts="c")
+
+    def test_answer_store(self):
+        """Test run_days.run_days with an answer store"""
+        with tempfile.TemporaryDirectory() as directory:
+            answer_store = Path(directory) / "answers.json"
+            results = run_days.run_days(
+                [4, 6], parts="b", load_test_data=True, answer_store=answer_store
+            )
+            assert [result.answer for result in results] == [4, 26]
+            answers = run_days.load_answers(answer_store)
+            answer_key = run_days.get_answer_key(4, "b", load_test_data=True)
+            assert answers[answer_key] == 4
+            assert len(answers) == 2
+
+            # Stored answers are returned without solving the part again
+            answers[answer_key] = "stored answer"
+            run_days.store_answers(answers, answer_store)
+            results = run_days.run_days(
+                [4, 6], parts="ab", load_test_data=True, answer_store=answer_store
+            )
+            assert [result.answer for result in results] == [2, "stored answer", 11, 26]
+            with open(answer_store) as f:
+                assert len(json.load(f)) == 4
+
+        # The key changes with the part and the input
+        assert answer_key != run_days.get_answer_key(4, "a", load_test_data=True)
+        assert answer_key != run_days.get_answer_key(6, "b", load_test_data=True)
+
+    def test_to_json(self):
+        """Test run_days._to_json"""
+        assert run_days._to_json(np.int32(21)) == 21
+        assert type(run_days._to_json(np.int32(21))) is int
+        assert run_days._to_json("CMZ") == "CMZ"
+        assert run_days._to_json({1, 2}) is None
+
+    def test_solve_part(self):
+        """Test run_days.solve_part"""
+        result = run_days.solve_part(4, "b", load_test_data=True)
+        assert result == (4, "b", 4, result.wall_time, None)
+
+        # A failing day is reported in the result instead of raising
+        result = run_days.solve_part(4, "c", load_test_data=True)
+        assert result.answer is None
+        assert result.error.startswith("ValueError: Wrong part chosen")
+
+    def test_profile_days(self):
+        """Test run_days.profile_days"""
+        results = run_days.profile_days([4], parts="ab", load_test_data=True)
+        assert [result.answer for result in results] == [2, 4]
+        assert not profiler.PROFILER.enabled
+        assert ("day 4 part a",) in profiler.PROFILER.stats
+        assert ("day 4 part b",) in profiler.PROFILER.stats
+        profiler.reset()
+
+    def test_run_days_with_memory(self):
+        """Test run_days.run_days_with_memory"""
+        outcomes = run_days.run_days_with_memory([18], parts="b", load_test_data=True)
+        assert len(outcomes) == 1
+        result, memory_report = outcomes[0]
+        assert result.answer == 58
+        assert memory_report.peak_bytes > 0
+        created, peak_live = run_days.count_coordinates(memory_report)
+        assert created >= peak_live > 0
+
+    def test_format_results(self):
+        """Test run_days.format_results"""
+        results = [
+            run_days.PartResult(4, "a", 2, 0.5),
+            run_days.PartResult(7, "b", None, 0.1, "FileNotFoundError: input7.1"),
+        ]
+        table = run_days.format_results(results).splitlines()
+        assert len(table) == 4
+        assert [cell.strip() for cell in table[2].split(" | ")] == [
+            "4",
+            "a",
+            "2",
+            "0.5000",
+        ]
+        assert "ERROR FileNotFoundError" in table[3]
+
+        memory_report = profiler.MemoryReport()
+        memory_report.peak_bytes = 2048
+        memory_report.instances["Coordinate"] = profiler.InstanceCount(10, 4)
+        table = run_days.format_results(results[:1], [memory_report]).splitlines()
+        assert [cell.strip() for cell in table[2].split(" | ")][-2:] == ["2.0", "10/4"]
+
+
+if __name__ == "__main__":
+    unittest.main(module="test_run_days")